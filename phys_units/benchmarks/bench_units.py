@@ -0,0 +1,291 @@
+##############################################################################
+##                    Benchmarks for units_database                         ##
+##                                                                          ##
+##  Times the hot paths of units_database separately, reporting the        ##
+##  operations per second and the memory allocated per operation. Results  ##
+##  can be saved as a baseline and later runs compared against it:         ##
+##                                                                          ##
+##      python bench_units.py --save baseline.json                          ##
+##      python bench_units.py --compare baseline.json --threshold 0.2       ##
+##                                                                          ##
+##  the comparison exits with status 1 if any case is slower than the      ##
+##  baseline by more than the threshold fraction. Import times are those   ##
+##  reported by 'python -X importtime' for a cold import in a fresh        ##
+##  interpreter, the median of several runs. Importing the units alone     ##
+##  must also stay within IMPORT_LIMITS whatever the baseline, the run     ##
+##  exiting with status 1 if it does not.                                  ##
+##############################################################################
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import timeit
+import tracemalloc
+
+import units_database as ud
+
+#------------------------------ The Cases -----------------------------------#
+#                                                                            #
+#   Each case is a (setup, statement) pair run with timeit, the setup        #
+#   having access to all of units_database.                                  #
+#                                                                            #
+#----------------------------------------------------------------------------#
+
+_SETUP = 'from units_database import *; x = 5*kg*m/s**2; y = 2*m; d = 1089*m'
+
+CASES = {
+    'combined_units.__mul__': (_SETUP, 'x*y'),
+    'combined_units.__truediv__': (_SETUP, 'x/y'),
+    'combined_units.__pow__': (_SETUP, 'x**2'),
+    'combined_units.__add__': (_SETUP, 'x+x'),
+    'QuantityArray.__iadd__': (
+        _SETUP + '; z = QuantityArray(range(1000), N)', 'z.__iadd__(x)'),
+    'QuantityAccumulator.update (1000 quantities)': (
+        _SETUP + '; xs = [x*i for i in range(1, 1001)]',
+        'QuantityAccumulator().update(xs)'),
+    'combined_units.__lt__': (_SETUP, 'y < d'),
+    'QuantityIndex.range (100000 quantities)': (
+        _SETUP + '; I = QuantityIndex(QuantityArray(range(100000), m))',
+        'I.range(1*km, 3*mile)'),
+    'combined_units.__str__': (_SETUP, 'str(x)'),
+    'combined_units.__format__': (_SETUP, "format(x, '.3e')"),
+    'format_many (1000 quantities)': (
+        _SETUP + '; xs = [x*i for i in range(1, 1001)]', "format_many(xs, fmt='.3e')"),
+    'combined_units.as_unit': (_SETUP, 'd.as_unit(mile)'),
+    'combined_units.as_base': (_SETUP, 'd.as_base()'),
+    'combined_units.to': (_SETUP, 'd.to(mile)'),
+    'convert_many (all lengths)': (_SETUP, 'convert_many(d)'),
+    'simplify': (_SETUP, 'simplify(x)'),
+    'simplify: h as J.s': (_SETUP, 'simplify(h)'),
+    'umath.sqrt': (_SETUP + '; import units_database.umath as umath', 'umath.sqrt(x*y)'),
+    'si_unit.clone': (_SETUP, "m.clone('km', 1000, 'kilometre')"),
+    'parse': (_SETUP, "parse('5.2 km.h^-1')"),
+    'formula: G*M_sol*M_earth/AU**2': (_SETUP, 'G*M_sol*M_earth/AU**2'),
+    'deferred formula: evaluate': (
+        _SETUP + "; f = deferred(G)*M_sol*M_earth/variable('r', AU)**2",
+        'f.evaluate(r=1.5)'),
+    'uncertain formula: G*M_sol*M_earth/AU**2': (
+        _SETUP + '; M = UncertainQuantity(M_sol, 0.001*M_sol)',
+        'G*M*M_earth/AU**2'),
+    'monte_carlo (10000 samples)': (
+        _SETUP + '; M = UncertainQuantity(M_sol, 0.001*M_sol)',
+        'monte_carlo(lambda M: G*M*M_earth/AU**2, M, n=10000)'),
+    'compiled formula call': (
+        _SETUP + "; import units_database; "
+        "f = units_database.compile(lambda M, r: G*M*M_earth/r**2, inputs=(kg, AU))",
+        'f(1.989E30, 1.5)'),
+    'checked function call': (
+        _SETUP + "; f = checked(inputs=(m, m), output=m**2)(lambda a, b: a*b)",
+        'f(y, d)'),
+}
+
+
+def _namespace(setup):
+    _namespace = {}
+    exec(setup, _namespace)
+    return _namespace
+
+
+def _time_case(setup, statement, min_time):
+    _timer = timeit.Timer(statement, globals=_namespace(setup))
+    _number, _ = _timer.autorange()
+    _number = max(_number, int(_number * min_time / 0.2))
+    _best = min(_timer.repeat(repeat=5, number=_number)) / _number
+    return 1. / _best
+
+
+def _allocations(setup, statement, number=1000):
+    # The number of memory blocks and bytes still allocated per operation
+    # when the results are kept alive, i.e. the size of what is created.
+    _globals = _namespace(setup)
+    _globals['_number'] = number
+    _globals['_results'] = []
+    _code = compile('for _ in range(_number):\n    _results.append({})'.format(
+        statement), '<bench>', 'exec')
+    exec(_code, _globals)
+    _globals['_results'] = []
+    tracemalloc.start()
+    _blocks = sys.getallocatedblocks()
+    _before = tracemalloc.get_traced_memory()[0]
+    exec(_code, _globals)
+    _bytes = tracemalloc.get_traced_memory()[0] - _before
+    _blocks = sys.getallocatedblocks() - _blocks
+    tracemalloc.stop()
+    return _blocks / number, _bytes / number
+
+
+IMPORTS = {
+    'import units_database': 'import units_database',
+    'from units_database import m, s': 'from units_database import m, s',
+    'from units_database import *': 'from units_database import *',
+}
+
+
+# The cold imports which must stay cheap, with the most time in
+# milliseconds each may take, and the modules which only the features
+# needing them may import
+
+IMPORT_LIMITS = {
+    'import units_database': 10.,
+    'from units_database import m, s': 10.,
+}
+
+HEAVY_MODULES = ('numpy', 'multiprocessing', 'concurrent.futures', 'inspect',
+                 're', 'units_database.parsing')
+
+
+def _environment():
+    _env = dict(os.environ)
+    _path = os.path.dirname(os.path.dirname(os.path.abspath(ud.__file__)))
+    _env['PYTHONPATH'] = os.pathsep.join(
+        [_path] + [x for x in [_env.get('PYTHONPATH')] if x])
+    return _env
+
+
+def _import_time(code, env):
+    # The microseconds spent importing the modules imported by 'code', as
+    # reported by 'python -X importtime', leaving out those imported when
+    # the interpreter starts
+    _stderr = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code], env=env,
+        check=True, capture_output=True, text=True).stderr
+    _times = {}
+    for line in _stderr.splitlines():
+        if not line.startswith('import time:') or '[us]' in line:
+            continue
+        _self, _cumulative, _name = line[len('import time:'):].split('|')
+        if not _name[1:].startswith(' '):
+            _times[_name.strip()] = int(_cumulative)
+    return _times
+
+
+def _cold_import(code, repeat=21):
+    # Imports per second from the median of several fresh interpreters
+    _env = _environment()
+    _startup = _import_time('pass', _env)
+    _runs = sorted(sum(t for name, t in _import_time(code, _env).items()
+                       if name not in _startup) for _ in range(repeat))
+    return 1e6 / _runs[repeat // 2]
+
+
+def run(cases=None, min_time=0.2):
+    '''
+    Run the benchmarks.
+
+    Optional Arguments
+    ------------------
+
+    cases      (list of strings)     names of the cases to run, default all
+
+    min_time   (float)               minimum time in seconds per repeat
+
+    Returns
+    -------
+
+    dict       mapping of case name to a dictionary of 'ops_per_sec',
+               'blocks_per_op' and 'bytes_per_op'
+    '''
+    _results = {}
+    for name, (setup, statement) in CASES.items():
+        if cases and name not in cases:
+            continue
+        _blocks, _bytes = _allocations(setup, statement)
+        _results[name] = {'ops_per_sec': _time_case(setup, statement, min_time),
+                          'blocks_per_op': _blocks, 'bytes_per_op': _bytes}
+    for name, code in IMPORTS.items():
+        if cases and name not in cases:
+            continue
+        _results[name] = {'ops_per_sec': _cold_import(code),
+                          'blocks_per_op': None, 'bytes_per_op': None}
+    return _results
+
+
+def _heavy_imports(code):
+    # The heavy modules imported by 'code' which are not already imported
+    # when the interpreter starts
+    _check = ('import sys; _before = set(sys.modules); {}; '
+              'print(\' \'.join(x for x in {!r} if x in sys.modules '
+              'and x not in _before))').format(code, HEAVY_MODULES)
+    return subprocess.run([sys.executable, '-c', _check], env=_environment(),
+                          check=True, capture_output=True,
+                          text=True).stdout.split()
+
+
+def check_imports(results):
+    '''
+    Check the cold imports in 'results' against IMPORT_LIMITS, returning
+    a description of each which takes too long or imports heavy modules.
+    '''
+    _failures = []
+    for name, limit in IMPORT_LIMITS.items():
+        if name not in results:
+            continue
+        _milliseconds = 1000. / results[name]['ops_per_sec']
+        if _milliseconds > limit:
+            _failures.append('{} ({:.1f}ms > {:.1f}ms)'.format(
+                name, _milliseconds, limit))
+        _heavy = _heavy_imports(IMPORTS[name])
+        if _heavy:
+            _failures.append('{} (imports {})'.format(name, ', '.join(_heavy)))
+    return _failures
+
+
+def compare(results, baseline, threshold):
+    '''
+    Compare results against a baseline, returning the names of the cases
+    slower than the baseline by more than the threshold fraction.
+    '''
+    _slower = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        _ratio = result['ops_per_sec'] / baseline[name]['ops_per_sec']
+        result['vs_baseline'] = _ratio
+        if _ratio < 1 - threshold:
+            _slower.append(name)
+    return _slower
+
+
+def _report(results):
+    _width = max(len(name) for name in results)
+    print('{:<{}}  {:>14}  {:>10}  {:>10}  {:>9}'.format(
+        'case', _width, 'ops/sec', 'blocks/op', 'bytes/op', 'baseline'))
+    for name, result in results.items():
+        print('{:<{}}  {:>14,.0f}  {:>10}  {:>10}  {:>9}'.format(
+            name, _width, result['ops_per_sec'],
+            '-' if result['blocks_per_op'] is None else '{:.1f}'.format(result['blocks_per_op']),
+            '-' if result['bytes_per_op'] is None else '{:.0f}'.format(result['bytes_per_op']),
+            '{:.2f}x'.format(result['vs_baseline']) if 'vs_baseline' in result else '-'))
+
+
+def main(argv=None):
+    _parser = argparse.ArgumentParser(description='Benchmark units_database.')
+    _parser.add_argument('cases', nargs='*', help='names of the cases to run')
+    _parser.add_argument('--save', help='save the results as a JSON baseline')
+    _parser.add_argument('--compare', help='JSON baseline to compare against')
+    _parser.add_argument('--threshold', type=float, default=0.1,
+                         help='allowed fractional slow down vs the baseline')
+    _parser.add_argument('--min-time', type=float, default=0.2)
+    _args = _parser.parse_args(argv)
+
+    _results = run(_args.cases, _args.min_time)
+    _slower = []
+    if _args.compare:
+        with open(_args.compare) as f:
+            _slower = compare(_results, json.load(f), _args.threshold)
+    _failures = check_imports(_results)
+    _report(_results)
+    if _args.save:
+        with open(_args.save, 'w') as f:
+            json.dump(_results, f, indent=2, sort_keys=True)
+    if _slower:
+        print('\nSlower than the baseline: {}'.format(', '.join(_slower)))
+    if _failures:
+        print('\nOver the import limits: {}'.format(', '.join(_failures)))
+    return 1 if _slower or _failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -10,4 +10,7 @@ setup(name                =  'units_database'                              ,
       packages            =  ['units_database']                            ,
       zip_safe            =  False                                         ,
       tests_require       =  ['nose2']                                    ,
+      extras_require      =  {'array': ['numpy']}                          ,
+      entry_points        =  {'console_scripts':
+                              ['units-convert = units_database.convert:main']},
      )
@@ -0,0 +1,61 @@
+import unittest
+
+import units_database as ud
+from units_database import QuantityArray, km, m, s
+
+
+class TestInPlace(unittest.TestCase):
+
+    def test_scalar_is_value_type(self):
+        y = 5 * m
+        z = y
+        z += 1 * m
+        self.assertIsNot(y, z)
+        self.assertEqual(y.to(m), 5)
+        self.assertEqual(z.to(m), 6)
+
+    def test_running_total_keeps_inputs(self):
+        qs = [1 * m, 2 * m, 3 * m]
+        total = qs[0]
+        for q in qs[1:]:
+            total += q
+        self.assertEqual(total.to(m), 6)
+        self.assertEqual([q.to(m) for q in qs], [1, 2, 3])
+
+    def test_registry_units_unchanged(self):
+        t = km
+        t *= 2
+        t /= s
+        self.assertEqual(km.to(m), 1000)
+        self.assertTrue(t.has_units(m / s))
+
+    def test_sum_and_subtract_zero_copy(self):
+        q = 5 * m
+        t = sum([q])
+        t += 1 * m
+        x = q - 0
+        x -= 1 * m
+        self.assertEqual(q.to(m), 5)
+
+    def test_array_in_place(self):
+        a = QuantityArray([1., 2.], m)
+        b = a
+        b += a
+        self.assertIs(a, b)
+        self.assertEqual(a.to(m).tolist(), [2., 4.])
+        a *= s
+        self.assertTrue(a.has_units(m * s))
+
+    def test_array_sum_copy(self):
+        a = QuantityArray([1., 2.], m)
+        total = sum([a])
+        total += a
+        self.assertEqual(a.to(m).tolist(), [1., 2.])
+
+    def test_incompatible_add(self):
+        with self.assertRaises(Exception):
+            (1 * m) + (1 * s)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+
+import numpy as np
+
+from units_database import km, m, s
+from units_database.phys_units import QuantityArray, phys_float
+
+
+class TestQuantityArray(unittest.TestCase):
+
+    def setUp(self):
+        self.distances = QuantityArray([1., 2., 3.], m)
+
+    def assertMagnitudes(self, quantity, magnitudes):
+        self.assertIsInstance(quantity, QuantityArray)
+        self.assertTrue(np.allclose(quantity._magnitude, magnitudes))
+
+    def test_arrays_with_units(self):
+        self.assertMagnitudes(np.array([1, 2]) * km, [1000., 2000.])
+        self.assertMagnitudes(km / np.array([1, 2]), [1000., 500.])
+        self.assertEqual(str(np.array([1, 2]) * km), '[1000. 2000.]m')
+
+    def test_arrays_with_numbers(self):
+        self.assertTrue(np.all(np.array([1, 2]) * phys_float(2) == [2, 4]))
+        self.assertFalse(np.array([1, 2]) == m)
+
+    def test_ufunc_with_quantity(self):
+        self.assertMagnitudes(np.maximum(self.distances, 2 * m), [2., 2., 3.])
+        self.assertMagnitudes(np.minimum(2 * km, self.distances), [1., 2., 3.])
+        self.assertMagnitudes(np.add(self.distances, m), [2., 3., 4.])
+        _speeds = np.divide(self.distances, 2 * s)
+        self.assertTrue(_speeds.check_dimensionality(m / s))
+
+    def test_ufunc_dimensions_checked(self):
+        with self.assertRaises(Exception):
+            np.maximum(self.distances, 2 * s)
+
+    def test_array_functions(self):
+        self.assertMagnitudes(np.concatenate([self.distances, self.distances]),
+                              [1., 2., 3., 1., 2., 3.])
+        self.assertMagnitudes(np.clip(self.distances, 1.5 * m, 2.5 * m),
+                              [1.5, 2., 2.5])
+        self.assertMagnitudes(np.round(self.distances / 3, 2), [0.33, 0.67, 1.])
+        self.assertAlmostEqual(np.linalg.norm(self.distances).to(m), 14**0.5)
+        self.assertAlmostEqual(np.sum(self.distances).to(m), 6.)
+
+    def test_concatenate_dimensions_checked(self):
+        with self.assertRaises(Exception):
+            np.concatenate([self.distances, QuantityArray([1.], s)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+from units_database import m
+from units_database.convert import convert_lines, convert_pairs, main
+
+
+class TestConvert(unittest.TestCase):
+
+    def test_convert_pairs(self):
+        self.assertEqual(list(convert_pairs([(1, 'km'), (2, m)], m)),
+                         [1000., 2.])
+
+    def test_convert_lines(self):
+        _lines = ['1,km,a\n', '\n', '2.5,m,b\n']
+        self.assertEqual(''.join(convert_lines(_lines, 'm', chunk_size=1)),
+                         '1000.0,m,a\n2.5,m,b\n')
+
+    def test_bad_line(self):
+        with self.assertRaisesRegex(ValueError, 'line 2'):
+            list(convert_lines(['1,km\n', 'x,km\n'], 'm'))
+
+    def test_on_error(self):
+        _errors = []
+        _converted = convert_lines(['1,km\n', '2,kms\n', '3\n'], 'm',
+                                   on_error=lambda *x: _errors.append(x))
+        self.assertEqual(''.join(_converted), '1000.0,m\n')
+        self.assertEqual([number for number, _ in _errors], [2, 3])
+
+    def test_invalid_counts(self):
+        for kwargs in ({'chunk_size': 0}, {'chunk_size': -1}, {'workers': 0}):
+            with self.assertRaises(ValueError):
+                list(convert_lines(['1,km\n'], 'm', **kwargs))
+
+
+class TestCommand(unittest.TestCase):
+
+    def setUp(self):
+        _file, self.path = tempfile.mkstemp(suffix='.csv')
+        with os.fdopen(_file, 'w') as f:
+            f.write('value,unit\n1,km\nfive,km\n2,m\n')
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def _main(self, *args):
+        _stdout, _stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(_stdout), \
+                contextlib.redirect_stderr(_stderr):
+            try:
+                _status = main(list(args) + [self.path])
+            except SystemExit as e:
+                _status = e.code
+        return _status, _stdout.getvalue(), _stderr.getvalue()
+
+    def test_errors_reported(self):
+        _status, _out, _err = self._main('--to', 'm', '--header')
+        self.assertEqual(_status, 1)
+        self.assertEqual(_out, 'value,unit\n1000.0,m\n2.0,m\n')
+        self.assertIn('line 3', _err)
+
+    def test_unknown_unit(self):
+        self.assertEqual(self._main('--to', 'kms')[0], 2)
+
+    def test_invalid_counts(self):
+        for args in (('--chunk-size', '0'), ('--chunk-size', '-2'),
+                     ('--workers', '0')):
+            _status, _out, _err = self._main('--to', 'm', *args)
+            self.assertEqual(_status, 2)
+            self.assertEqual(_out, '')
+            self.assertIn('must be at least 1', _err)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import pickle
+import unittest
+
+import numpy
+
+import units_database as ud
+from units_database import km, m
+
+
+class TestFrozen(unittest.TestCase):
+
+    def test_registry_units_equal_numbers(self):
+        self.assertTrue(ud.c == 299792458)
+        self.assertTrue(ud.km == 1000)
+        self.assertTrue(ud.G == 6.67e-11)
+
+    def test_equal_frozen_have_equal_hashes(self):
+        first, second = km.freeze(), (1000 * m).freeze()
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), hash(second))
+        self.assertEqual({first: 'one kilometre'}[second], 'one kilometre')
+
+    def test_frozen_not_equal_to_numbers(self):
+        frozen = (1000 * m).freeze()
+        self.assertFalse(frozen == 1000)
+        self.assertTrue(frozen != 1000)
+        self.assertNotIn(1000, {frozen})
+
+    def test_frozen_immutable(self):
+        with self.assertRaises(Exception):
+            km.freeze()._magnitude = 1
+
+    def test_thaw(self):
+        thawed = km.freeze().thaw()
+        self.assertNotIsInstance(thawed, type(km.freeze()))
+        self.assertEqual(thawed.to(m), 1000)
+
+
+class TestPickling(unittest.TestCase):
+
+    def test_registry_units_keep_identity(self):
+        for unit in (m, km, ud.c, ud.hour):
+            self.assertIs(pickle.loads(pickle.dumps(unit)), unit)
+
+    def test_round_trip(self):
+        for quantity in (5 * km, (5 * km).freeze(), 3 * ud.N / ud.s**2):
+            _copy = pickle.loads(pickle.dumps(quantity))
+            self.assertIs(type(_copy), type(quantity))
+            self.assertTrue(_copy.has_units(quantity))
+            self.assertEqual(_copy._magnitude, quantity._magnitude)
+
+    def test_wire_round_trip(self):
+        for quantity in (5 * km, 3 * ud.N / ud.s**2,
+                         ud.QuantityArray([1., 2.5], km)):
+            _copy = ud.from_wire(ud.to_wire(quantity))
+            self.assertTrue(_copy.has_units(quantity))
+            self.assertTrue(numpy.all(_copy._magnitude == quantity._magnitude))
+
+
+if __name__ == '__main__':
+    unittest.main()
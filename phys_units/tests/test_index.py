@@ -0,0 +1,56 @@
+import unittest
+
+import numpy as np
+
+from units_database import QuantityIndex, km, m, mile, s
+from units_database.phys_units import QuantityArray
+
+
+class TestQuantityIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = QuantityIndex([3 * km, 1 * m, 1 * mile, 2 * km])
+
+    def test_range(self):
+        self.assertEqual(list(self.index.range(1 * km, 2 * km)), [2, 3])
+        self.assertEqual(list(self.index.range(1 * km, 2 * km, False)), [2])
+        self.assertEqual(list(self.index.range(low=1 * mile)), [2, 3, 0])
+        self.assertEqual(self.index.count(high=1 * km), 1)
+
+    def test_nearest(self):
+        self.assertEqual(self.index.nearest(1.7 * km), 2)
+        self.assertEqual(list(self.index.nearest(2 * km, k=2)), [3, 2])
+        _nearest = self.index.nearest(QuantityArray([0., 2900.], m))
+        self.assertEqual(list(_nearest), [1, 0])
+
+    def test_insert_merged_in_order(self):
+        self.index.insert(QuantityArray([0.5, 10.], km), ['a', 'b'])
+        self.assertEqual(list(self.index.range(400 * m, 600 * m)), ['a'])
+        self.assertTrue(np.all(np.diff(self.index.quantities()._magnitude) >= 0))
+
+    def test_dimensions_checked(self):
+        with self.assertRaises(Exception):
+            self.index.insert([1 * s])
+        with self.assertRaises(Exception):
+            self.index.range(1 * s, 2 * s)
+        self.assertEqual(len(self.index), 4)
+
+    def test_query_of_empty_index(self):
+        _index = QuantityIndex()
+        self.assertEqual(len(_index.range(1 * m, 2 * m)), 0)
+        _index.insert([1 * s, 2 * s])
+        self.assertEqual(list(_index.range(0 * s, 1.5 * s)), [0])
+
+    def test_plain_numbers(self):
+        _index = QuantityIndex(unit=km)
+        _index.insert([1 * m, 2])
+        _index.insert(np.array([3.]))
+        self.assertEqual(list(_index.quantities()._magnitude), [1., 2000., 3000.])
+        with self.assertRaises(Exception):
+            QuantityIndex().insert([1 * m, 2])
+        with self.assertRaises(Exception):
+            QuantityIndex().insert([2, 1 * m])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import pickle
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from units_database import QuantityArray, hour, km, m, parallel_map, s
+
+
+def _speed(distance, time):
+    return distance / time
+
+
+class TestParallel(unittest.TestCase):
+
+    def test_array_round_trip(self):
+        _distances = QuantityArray([1., 2.5], km)
+        _copy = pickle.loads(pickle.dumps(_distances))
+        self.assertIsInstance(_copy, QuantityArray)
+        self.assertTrue(_copy.has_units(_distances))
+        self.assertTrue(np.all(_copy._magnitude == _distances._magnitude))
+
+    def test_parallel_map(self):
+        _speeds = list(parallel_map(_speed, [i * km for i in range(1, 6)],
+                                    [2 * hour] * 5, workers=2, chunksize=2))
+        self.assertEqual(len(_speeds), 5)
+        for i, speed in enumerate(_speeds):
+            self.assertTrue(speed.has_units(m / s))
+            self.assertAlmostEqual(speed.to(km / hour), (i + 1) / 2.)
+
+    def test_executor(self):
+        with ThreadPoolExecutor(2) as executor:
+            _speeds = list(parallel_map(_speed, [3 * m], [1 * s],
+                                        executor=executor))
+        self.assertAlmostEqual(_speeds[0].to(m / s), 3.)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+
+import units_database as ud
+from units_database import parse, parse_array, km, hour, m, s, h, c
+
+
+class TestParse(unittest.TestCase):
+
+    def test_compound_units(self):
+        self.assertTrue(parse('5.2 km.h^-1').has_units(m / s))
+        self.assertAlmostEqual(parse('5.2 km.h^-1').to(km / hour), 5.2)
+        self.assertAlmostEqual(parse('3e8m.s^-1').to(m / s), 3e8)
+        self.assertTrue(parse('kg.m.s^-2').has_units(ud.N))
+
+    def test_units_before_constants(self):
+        self.assertEqual(parse('h').to(hour), 1)
+        self.assertEqual(parse('2 b').to(ud.barn), 2)
+
+    def test_constants_by_symbol(self):
+        self.assertEqual(parse('c').to(c), 1)
+        self.assertEqual(parse('hbar').to(h), 1 / (2 * ud.pi._magnitude))
+
+    def test_prefixed_units(self):
+        self.assertAlmostEqual(parse('3 um').to(m), 3e-6)
+        self.assertAlmostEqual(parse('2 kPa').to(ud.Pa), 2000)
+
+    def test_unknown_unit(self):
+        with self.assertRaises(ValueError):
+            parse('5 parsecs_x')
+
+    def test_malformed_expression(self):
+        with self.assertRaises(ValueError):
+            parse('5 km..s')
+
+    def test_array(self):
+        distances = parse_array(['5 km', '3 miles'])
+        self.assertAlmostEqual(distances.to(km)[0], 5)
+        self.assertAlmostEqual(distances.to(ud.mile)[1], 3)
+
+    def test_array_mixed_dimensions(self):
+        with self.assertRaises(Exception):
+            parse_array(['5 km', '3 s'])
+
+
+if __name__ == '__main__':
+    unittest.main()
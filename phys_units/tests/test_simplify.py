@@ -0,0 +1,55 @@
+import unittest
+
+import units_database as ud
+from units_database import simplify, A, C, J, K, W, cd, kg, m, ohm, s, sr
+
+
+class TestSimplify(unittest.TestCase):
+
+    def test_named_units(self):
+        self.assertEqual(str(simplify(kg * m / s**2)), 'N')
+        self.assertEqual(str(simplify(J / s)), 'W')
+        self.assertEqual(str(simplify(cd * sr)), 'lm')
+        self.assertEqual(str(simplify(1 / ohm)), 'S')
+
+    def test_single_base_unit_kept(self):
+        self.assertEqual(str(simplify(5 * s)), '5s')
+        self.assertEqual(str(simplify(ud.minute)), '60s')
+        self.assertEqual(str(simplify(3 * s**2)), '3s^2')
+        self.assertEqual(str(simplify(1 / s)), 's^-1')
+        self.assertEqual(str(simplify(5 * m**3)), '5m^3')
+
+    def test_decomposition(self):
+        self.assertEqual(str(simplify(5 * J / s / m**2)), '5.0W.m^-2')
+        self.assertEqual(str(simplify(2 * kg * m / s)), '2N.s')
+        self.assertEqual(str(simplify(ud.V / m)), 'V.m^-1')
+        self.assertEqual(str(simplify(ud.h)).split('e-34')[1], 'J.s')
+
+    def test_base_form_kept_unless_simpler(self):
+        self.assertEqual(str(simplify(kg / m**3)), 'kg.m^-3')
+        self.assertEqual(str(simplify(m**3 / s)), 'm^3.s^-1')
+        self.assertEqual(str(simplify(m / s**2)), 'm.s^-2')
+        self.assertEqual(str(simplify(m**2 / s**2)), 'm^2.s^-2')
+        self.assertEqual(str(simplify(ud.G)).split('e-11')[1],
+                         'kg^-1.m^3.s^-2')
+
+    def test_dimension_aliases_not_used(self):
+        for unit in (ud.Hz, ud.Bq, ud.Gy, ud.Sv):
+            self.assertNotIn(unit, ud.all_cunits)
+        self.assertNotIn('Gy', str(simplify(m**2 / s**2)))
+
+    def test_magnitude_kept(self):
+        self.assertAlmostEqual(simplify(2 * W).to(W), 2)
+
+    def test_register_unit(self):
+        _unit = ud.pu.combined_units((A, s, K), (1, 1, 1), 'test', 'Tq', 'test')
+        try:
+            ud.register_unit(_unit)
+            self.assertEqual(str(simplify(C * K)), 'Tq')
+        finally:
+            ud.all_cunits.remove(_unit)
+            ud._update_index()
+
+
+if __name__ == '__main__':
+    unittest.main()
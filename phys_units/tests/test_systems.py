@@ -0,0 +1,24 @@
+import unittest
+
+from units_database import N, c, hbar, m, unit_system
+
+
+class TestUnitSystems(unittest.TestCase):
+
+    def test_natural_units(self):
+        with unit_system('natural'):
+            self.assertEqual(str(hbar), '1')
+            self.assertEqual(str(c), '1')
+            self.assertEqual(str(2 * c), '2.0')
+
+    def test_cgs_units(self):
+        with unit_system('cgs'):
+            self.assertEqual(str(5 * N * 1), '500000.0dyn')
+
+    def test_dimensionless(self):
+        self.assertEqual(str(m / m), '1')
+        self.assertEqual(str(2 * m / m), '2')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,9 @@
+import sys
+
 from . import phys_units as pu
-from math import pi
+from .phys_units import QuantityArray
+from itertools import combinations, product
+from math import gcd, pi
 
 ################### DEFINE BASE SI UNITS #######################
 
@@ -19,201 +23,502 @@ cd = pu.si_unit(
     "<Unit('cd'), 'candela', 'luminous intensity'>",
     'luminous intensity')
 
-######################### DISTANCE ##############################
-
-cm = m.clone('cm', 1E-2, 'centimetre')
-mm = m.clone('mm', 1E-3, 'millimetre')
-km = m.clone('km', 1000, 'kilometre')
-nm = m.clone('nm', 1E-9, 'nanometre')
-angstrom = m.clone('Å', 1E-10, 'angstrom')
-yd = m.clone('yds', 0.9144, 'yard')
-mile = m.clone('miles', 1609.344)
-inch = cm.clone('in', 2.54E-2, 'inch')
-ft = cm.clone('ft', 30.48, 'foot')
-furlong = yd.clone('furlongs', 220, 'furlong')
-rod = yd.clone('rods', 5.5)
-
-#################### COMPOUND SI UNITS ##########################
-
-all_cunits = []
-
-C = pu.combined_units((s, A), (1, 1), 'charge', 'C', 'coulomb')
-V = pu.combined_units((kg, m, s, A), (1, 2, -3, -1), 'voltage', 'V', 'volt')
-J = pu.combined_units((kg, m, s), (1, 2, -2), 'energy', 'J', 'joule')
-N = pu.combined_units((kg, m, s), (1, 1, -2), 'force', 'N', 'newton')
-L = pu.combined_units((m,), (3,), '', '').clone('L', 1E-3, 'volume', 'litre')
-ha = pu.combined_units((m,), (2,), '', '').clone('ha', 1E4, 'area', 'hectare')
-Pa = pu.combined_units((kg, m, s), (1, -1, -2), 'pressure', 'Pa', 'pascal')
-
-all_cunits += [C, V, J, N]
-
-#---------------------- Astro -----------------------------#
-
-M_sol = pu.combined_units((kg,), (1,), 'solar mass', 'M_ʘ', const=2E30)
-R_sol = pu.combined_units((m,), (1,), 'solar radius', 'R_ʘ', const=6.957E8)
-M_earth = pu.combined_units((kg,), (1,), 'earth mass', 'M_𐌈', const=5.9722E24)
-R_earth = pu.combined_units((kg,), (1,), 'earth radius', 'R_𐌈', const=6.3781E6)
-pc = pu.combined_units((m,), (1,), 'distance', 'pc', 'parsec', const=3.086E16)
-AU = pu.combined_units((m,), (1,), 'distanct', 'AU',
-                       'astronomical unit', const=1.495978707E8)
-Mpc = pc.clone('Mpc', 1E6)
-Gpc = pc.clone('Gpc', 1E9)
-erg = pu.combined_units((kg, m, s), (1, 2, -2), 'work done', 'erg', const=1E-7)
-
-#----------------------- HEP ------------------------------#
-
-eV = J.clone('eV', 1.6E-19)
-keV = eV.clone('keV', 1E3)
-MeV = eV.clone('MeV', 1E6)
-GeV = eV.clone('GeV', 1E9)
-TeV = eV.clone('TeV', 1E12)
+# All other units and constants are only built when first accessed
+# (see '__getattr__'), each definition being a function of this module
+# so that the units it depends on are in turn built on demand.
+
+
+def _named(unit, label, other_label, desc=None):
+    unit._label = label
+    unit._other_label = other_label
+    if desc:
+        unit._desc = desc
+    return unit
 
-b = pu.combined_units(
-    (m,), (2,), 'area', 'm^2', '').clone(
-        'b', 1E-28, desc='cross section')
-fb = b.clone('fb', 1E-15)
-pb = b.clone('pb', 1E-12)
 
-#----------------------------------------------------------#
+def _derived_units(u):
+    # The named derived units of all of the definitions, in the order they
+    # are defined, being those with a word name and an SI magnitude of one.
+    # Scaled units (e.g. L, ha, eV) and constants are left out so that
+    # 'simplify' keeps results in SI units, rather than e.g. m^3 as 1000L,
+    # as are the units which are other names for a dimension with its own
+    # unit (e.g. Gy for m^2.s^-2) so that speeds squared are not doses.
+    _units = (getattr(u, name) for name in _definitions
+              if name != 'all_cunits' and name not in _DIMENSION_ALIASES)
+    return [x for x in _units if isinstance(x, pu.combined_units)
+            and x._other_label and x._magnitude == 1]
 
-W = J * s
-W._label = 'W'
-W._other_label = 'watt'
-W._desc = 'power'
 
-celsius = K.clone('ᵒC', 273.15, other_label='celsius')
+_DIMENSION_ALIASES = ('Hz', 'Bq', 'Gy', 'Sv')
 
-#----------------------------------------------------------#
 
+_definitions = {
 
-F = C / V
-F._label = 'F'
-F._other_label = 'farad'
-F._desc = 'capacitance'
+    ######################### DISTANCE ##############################
 
-#----------------------------------------------------------#
+    'cm': lambda u: u.m.clone('cm', 1E-2, 'centimetre'),
+    'mm': lambda u: u.m.clone('mm', 1E-3, 'millimetre'),
+    'km': lambda u: u.m.clone('km', 1000, 'kilometre'),
+    'nm': lambda u: u.m.clone('nm', 1E-9, 'nanometre'),
+    'angstrom': lambda u: u.m.clone('Å', 1E-10, 'angstrom'),
+    'yd': lambda u: u.m.clone('yds', 0.9144, 'yard'),
+    'mile': lambda u: u.m.clone('miles', 1609.344),
+    'inch': lambda u: u.cm.clone('in', 2.54E-2, 'inch'),
+    'ft': lambda u: u.cm.clone('ft', 30.48, 'foot'),
+    'furlong': lambda u: u.yd.clone('furlongs', 220, 'furlong'),
+    'rod': lambda u: u.yd.clone('rods', 5.5),
 
-Hz = 1 / s
-Hz._label = 'Hz'
-Hz._other_label = 'hertz'
-Hz._desc = 'frequency'
+    ########################### TIME ################################
 
-#----------------------------------------------------------#
+    'minute': lambda u: u.s.clone('min', 60, 'minute'),
+    'hour': lambda u: u.s.clone('h', 3600, 'hour'),
 
-ohm = V / A
-ohm._label = 'Ω'
-ohm._other_label = 'ohm'
-ohm._desc = 'resistance'
+    #################### COMPOUND SI UNITS ##########################
 
-S = 1 / ohm
-S._label = 'S'
-S._other_label = 'siemens'
+    'C': lambda u: pu.combined_units((u.s, u.A), (1, 1), 'charge', 'C', 'coulomb'),
+    'V': lambda u: pu.combined_units((u.kg, u.m, u.s, u.A), (1, 2, -3, -1),
+                                     'voltage', 'V', 'volt'),
+    'J': lambda u: pu.combined_units((u.kg, u.m, u.s), (1, 2, -2), 'energy',
+                                     'J', 'joule'),
+    'N': lambda u: pu.combined_units((u.kg, u.m, u.s), (1, 1, -2), 'force',
+                                     'N', 'newton'),
+    'L': lambda u: pu.combined_units((u.m,), (3,), '', '').clone(
+        'L', 1E-3, 'volume', 'litre'),
+    'ha': lambda u: pu.combined_units((u.m,), (2,), '', '').clone(
+        'ha', 1E4, 'area', 'hectare'),
+    'Pa': lambda u: pu.combined_units((u.kg, u.m, u.s), (1, -1, -2), 'pressure',
+                                      'Pa', 'pascal'),
 
-#----------------------------------------------------------#
+    #---------------------- Astro -----------------------------#
+
+    'M_sol': lambda u: pu.combined_units((u.kg,), (1,), 'solar mass', 'M_ʘ',
+                                         const=2E30),
+    'R_sol': lambda u: pu.combined_units((u.m,), (1,), 'solar radius', 'R_ʘ',
+                                         const=6.957E8),
+    'M_earth': lambda u: pu.combined_units((u.kg,), (1,), 'earth mass', 'M_𐌈',
+                                           const=5.9722E24),
+    'R_earth': lambda u: pu.combined_units((u.kg,), (1,), 'earth radius', 'R_𐌈',
+                                           const=6.3781E6),
+    'pc': lambda u: pu.combined_units((u.m,), (1,), 'distance', 'pc', 'parsec',
+                                      const=3.086E16),
+    'AU': lambda u: pu.combined_units((u.m,), (1,), 'distanct', 'AU',
+                                      'astronomical unit', const=1.495978707E8),
+    'Mpc': lambda u: u.pc.clone('Mpc', 1E6),
+    'Gpc': lambda u: u.pc.clone('Gpc', 1E9),
+    'erg': lambda u: pu.combined_units((u.kg, u.m, u.s), (1, 2, -2), 'work done',
+                                       'erg', const=1E-7),
+
+    #----------------------- HEP ------------------------------#
+
+    'eV': lambda u: u.J.clone('eV', 1.6E-19),
+    'keV': lambda u: u.eV.clone('keV', 1E3),
+    'MeV': lambda u: u.eV.clone('MeV', 1E6),
+    'GeV': lambda u: u.eV.clone('GeV', 1E9),
+    'TeV': lambda u: u.eV.clone('TeV', 1E12),
+
+    'barn': lambda u: pu.combined_units((u.m,), (2,), 'area', 'm^2', '').clone(
+        'b', 1E-28, desc='cross section'),
+    'fb': lambda u: u.barn.clone('fb', 1E-15),
+    'pb': lambda u: u.barn.clone('pb', 1E-12),
+
+    #----------------------------------------------------------#
+
+    'W': lambda u: _named(u.J / u.s, 'W', 'watt', 'power'),
+
+    'celsius': lambda u: u.K.clone('ᵒC', 273.15, other_label='celsius'),
+
+    #----------------------------------------------------------#
+
+    'F': lambda u: _named(u.C / u.V, 'F', 'farad', 'capacitance'),
+
+    #----------------------------------------------------------#
+
+    'Hz': lambda u: _named(1 / u.s, 'Hz', 'hertz', 'frequency'),
+
+    #----------------------------------------------------------#
+
+    'ohm': lambda u: _named(u.V / u.A, 'Ω', 'ohm', 'resistance'),
+    'S': lambda u: _named(1 / u.ohm, 'S', 'siemens'),
+
+    #----------------------------------------------------------#
+
+    'Wb': lambda u: _named(u.V * u.s, 'Wb', 'weber', 'magnetic flux'),
+    'T': lambda u: _named(u.Wb / u.m**2, 'T', 'tesla',
+                          'magnetic field strength'),
+    'H': lambda u: _named(u.Wb / u.A, 'H', 'henry', 'inductance'),
+
+    #---------------------------------------------------------#
+
+    'lm': lambda u: _named(u.cd * u.sr, 'lm', 'lumen', 'luminous flux'),
+    'lx': lambda u: _named(u.lm / u.m**2, 'lx', 'lux', 'illuminance'),
+
+    #---------------------------------------------------------#
+
+    'Bq': lambda u: u.Hz.clone('Bq', 1, 'radioactivity', 'becquerel'),
+    'Gy': lambda u: _named(u.J / u.kg, 'Gy', 'gray',
+                           'absorbed dose of ionising radiation'),
+    'Sv': lambda u: _named(u.Gy.clone('Sv', 1), 'Sv', 'seivert',
+                           'equivalent dose of ionising radiation'),
+
+    #---------------------------------------------------------#
+
+    'kat': lambda u: _named(u.mol / u.s, 'kat', 'katal', 'catalytic activity'),
+
+    #---------------------------------------------------------#
+
+    'all_cunits': lambda u: _derived_units(u),
+
+    ######################## CONSTANTS ##############################
+
+    'G': lambda u: pu.combined_units((u.m, u.kg, u.s), (3, -1, -2),
+                                     'gravitational constant', 'G', const=6.67E-11),
+    'g': lambda u: pu.combined_units((u.m, u.s), (1, -2), 'acc. due to gravity',
+                                     'g', const=9.81),
+    'epsilon_0': lambda u: pu.combined_units((u.m, u.kg, u.s, u.A), (-3, -1, 4, 2),
+                                             'permittivity of free space',
+                                             'epsilon_0', const=8.85418782E-12),
+    'mu_0': lambda u: pu.combined_units((u.m, u.kg, u.s, u.A), (1, 1, -2, -2),
+                                        'permeability of free space', 'mu_0',
+                                        const=1.25663706E-6),
+    'R_H': lambda u: pu.combined_units((u.m,), (-1,), 'Rydberg Constant',
+                                       'R_H', const=10973731.6),
+    'c': lambda u: pu.combined_units((u.m, u.s), (1, -1), 'speed of light in vacuum',
+                                     'c', const=299792458),
+    'h': lambda u: pu.combined_units((u.kg, u.m, u.s), (1, 2, -1),
+                                     'Planck constant', 'h', const=6.626070040E-34),
+    'hbar': lambda u: u.h.clone('hbar', 1) / (2 * u.pi),
+    'e': lambda u: u.C.clone('e', 1.6021766208E-19),
+    'm_e': lambda u: u.kg.clone('m_e', 9.10938356E-31),
+    'm_p': lambda u: u.kg.clone('m_p', 1.672621898E-27),
+    'm_n': lambda u: u.kg.clone('m_n', 1.674927471E-27),
+    'm_u': lambda u: u.kg.clone('m_u', 1.660539040E-27),
+    'N_A': lambda u: pu.combined_units((u.mol,), (-1,), 'Avogadros Number',
+                                       'N_A', const=6.022140857E23),
+    'k_B': lambda u: pu.combined_units((u.kg, u.m, u.s, u.K), (1, 2, -2, -1),
+                                       'Boltzmann constant', 'k_B',
+                                       const=1.38064852E-23),
+    'R': lambda u: pu.combined_units((u.kg, u.m, u.s, u.mol, u.K),
+                                     (1, 2, -2, -1, -1), 'Gas constant', 'R',
+                                     const=8.3144598),
+    'sigma_sb': lambda u: pu.combined_units((u.kg, u.s, u.K), (1, -3, -4),
+                                            'Stefan-Boltzmann constant',
+                                            'sigma_sb', const=5.670367E-8),
+    'b': lambda u: pu.combined_units((u.m, u.K), (1, -1), 'Wien constant',
+                                     'b', const=2.8977729E-3),
 
-Wb = V * s
-Wb._desc = 'magnetic flux'
-Wb._label = 'Wb'
-Wb._other_label = 'weber'
+    'NULL': lambda u: pu.combined_units((u.m,), (0,), '', '', const=0),
+}
 
-T = Wb / m**2
-T._desc = 'magnetic field strength'
-T._label = 'T'
-T._other_label = 'tesla'
-
-H = Wb / A
-H._desc = 'inductance'
-H._other_label = 'henry'
-H._label = 'H'
-
-#---------------------------------------------------------#
-
-lm = cd * sr
-lm._desc = 'luminous flux'
-lm._label = 'lm'
-lm._other_label = 'lumen'
-
-lx = lm / m**2
-lx._desc = 'illuminance'
-lx._other_label = 'lux'
-lx._label = 'lx'
-
-#---------------------------------------------------------#
-
-Bq = Hz.clone('Bq', 1, 'radioactivity', 'becquerel')
-Bq._desc = 'radioactivity'
-
-Gy = J / kg
-Gy._desc = 'absorbed dose of ionising radiation'
-Gy._label = 'Gy'
-Gy._other_label = 'gray'
-
-Sv = Gy.clone('Sv', 1, other_label='seivert')
-Sv._desc = 'equivalent dose of ionising radiation'
-
-#---------------------------------------------------------#
+pi = pu.phys_float(pi)
 
-kat = mol / s
-kat._desc = 'catalytic activity'
-kat._label = 'kat'
-kat._other_label = 'katal'
+# The names of all of the units and constants, in the order in which they
+# are defined
+
+_unit_names = ['A', 's', 'kg', 'm', 'rad', 'sr', 'K', 'mol', 'cd',
+               'pi'] + list(_definitions)
+
+# The physical constants among them, which are only used as unit symbols
+# in unit expressions where no unit has the same symbol, e.g. 'h' is the
+# hour rather than the Planck constant in 'km.h^-1'
+
+_constant_names = ('G', 'g', 'epsilon_0', 'mu_0', 'R_H', 'c', 'h', 'hbar',
+                   'e', 'm_e', 'm_p', 'm_n', 'm_u', 'N_A', 'k_B', 'R',
+                   'sigma_sb', 'b', 'NULL')
+
+# The functions and classes of the submodules, which like the submodules
+# themselves are only imported when first accessed so that importing the
+# units costs next to nothing
+
+_lazy = {
+    'clear_parse_cache': 'parsing', 'parse': 'parsing',
+    'parse_array': 'parsing', 'parse_many': 'parsing',
+    'convert_lines': 'convert', 'convert_pairs': 'convert',
+    'Expression': 'expression', 'deferred': 'expression',
+    'variable': 'expression', 'compile': 'compiler',
+    'checked': 'decorators', 'format_many': 'formatting',
+    'QuantityAccumulator': 'accumulate', 'QuantityIndex': 'index',
+    'to_wire': 'wire', 'from_wire': 'wire', 'parallel_map': 'parallel',
+    'save_column': 'columns', 'load_column': 'columns',
+    'prefixed_unit': 'prefixes', 'auto_prefix': 'prefixes',
+    'format_prefixed': 'prefixes', 'conversion_table': 'tables',
+    'convert_many': 'tables', 'instrumented': 'instrument',
+    'UncertainQuantity': 'uncertainty', 'monte_carlo': 'uncertainty',
+    'UnitSystem': 'systems', 'get_unit_system': 'systems',
+    'unit_system': 'systems',
+}
+
+_submodules = ('accumulate', 'columns', 'compiler', 'convert', 'decorators',
+               'expression', 'formatting', 'index', 'instrument', 'parallel',
+               'parsing', 'prefixes', 'systems', 'tables', 'umath',
+               'uncertainty', 'wire')
+
+_this = sys.modules[__name__]
+
+
+def _loaded(name):
+    # A submodule if it has already been imported, otherwise None
+    return sys.modules.get('{}.{}'.format(__name__, name))
+
+
+def __getattr__(name):
+    if name in _lazy or name in _submodules:
+        _module = '{}.{}'.format(__name__, _lazy.get(name, name))
+        __import__(_module)
+        _module = sys.modules[_module]
+        _value = getattr(_module, name) if name in _lazy else _module
+        globals()[name] = _value
+        return _value
+    try:
+        _definition = _definitions[name]
+    except KeyError:
+        from .prefixes import prefixed_unit
+        _unit = prefixed_unit(name)
+        if _unit is None:
+            raise AttributeError(
+                "module '{}' has no attribute '{}'".format(__name__, name))
+        globals()[name] = _unit
+        return _unit
+    _unit = _definition(_this)
+    globals()[name] = _unit
+    return _unit
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_definitions) | set(_lazy)
+                  | set(_submodules))
 
-######################## CONSTANTS ##############################
-
-G = pu.combined_units((m, kg, s), (3, -1, -2),
-                      'gravitational constant', 'G', const=6.67E-11)
-g = pu.combined_units((m, s), (1, -2), 'acc. due to gravity', 'g', const=9.81)
-epsilon_0 = pu.combined_units((m, kg, s, A), (-3, -1, 4, 2),
-                              'permittivity of free space', 'epsilon_0', const=8.85418782E-12)
-mu_0 = pu.combined_units((m, kg, s, A), (1, 1, -2, -2),
-                         'permeability of free space', 'mu_0', const=1.25663706E-6)
-R_H = pu.combined_units((m,), (-1,), 'Rydberg Constant',
-                        'R_H', const=10973731.6)
-pi = pu.phys_float(pi)
-c = pu.combined_units(
-    (m, s), (1, -2), 'speed of light in vacuum', 'c', const=299792458)
-h = pu.combined_units((kg, m, s), (1, 2, -1),
-                      'Planck constant', 'h', const=6.626070040E-34)
-hbar = h.clone('hbar', 1) / (2 * pi)
-e = C.clone('e', 1.6021766208E-19)
-m_e = kg.clone('m_e', 9.10938356E-31)
-m_p = kg.clone('m_p', 1.672621898E-27)
-m_n = kg.clone('m_n', 1.674927471E-27)
-m_u = kg.clone('m_u', 1.660539040E-27)
-N_A = pu.combined_units((mol,), (-1,), 'Avogadros Number',
-                        'N_A', const=6.022140857E23)
-k_B = pu.combined_units((kg, m, s, K), (1, 2, -2, -1),
-                        'Boltzmann constant', 'k_B', const=1.38064852E-23)
-R = pu.combined_units((kg, m, s, mol, K), (1, 2, -2, -1, -1),
-                      'Gas constant', 'R', const=8.3144598)
-sigma_sb = pu.combined_units(
-    (kg, s, K), (1, -3, -4), 'Stefan-Boltzmann constant', 'sigma_sb', const=5.670367E-8)
-b = pu.combined_units((m, K), (1, -1), 'Wien constant',
-                      'b', const=2.8977729E-3)
-
-NULL = pu.combined_units((m,), (0,), '', '', const=0)
 
 ##################### SIMPLIFY ####################################
 
+# Index of the named units in 'all_cunits' by their normalised dimension
+# (see '_normalise'), along with the memoized result of 'simplify' for
+# each dimension seen so far, as the display suffix, scale and description.
+
+_simplify_index = {}
+_simplify_cache = {}
+_n_indexed = 0
+
+# The bounds of the search of '_decompose', the most named units combined
+# and the largest power of each of them
+
+_MAX_NAMED = 2
+_MAX_POWER = 3
+_combination_table = None
+
+
+def _normalise(dims):
+    '''
+    Split a dimension into the smallest integer exponent vector with a
+    positive leading exponent and the integer multiple of it, e.g.
+    (0, 2, -4) becomes ((0, -1, 2), -2).
+    '''
+    if any(not isinstance(x, int) for x in dims) or not any(dims):
+        return None, None
+    _factor = 0
+    for exponent in dims:
+        _factor = gcd(_factor, exponent)
+    if [x for x in dims if x != 0][0] < 0:
+        _factor *= -1
+    return tuple(x // _factor for x in dims), _factor
+
+
+def _update_index():
+    global _n_indexed, _combination_table
+    all_cunits = _this.all_cunits
+    if len(all_cunits) < _n_indexed:
+        _simplify_index.clear()
+        _n_indexed = 0
+    for unit in all_cunits[_n_indexed:]:
+        _primitive, _factor = _normalise(unit._dims)
+        if _primitive is not None:
+            _simplify_index.setdefault(_primitive, []).append((unit, _factor))
+    _n_indexed = len(all_cunits)
+    _simplify_cache.clear()
+    _combination_table = None
+
+
+def _combinations():
+    # Every combination of named units searched by '_decompose', as the
+    # list of units with their powers, the dimension of each combination
+    # as a row of an integer matrix, and the number of units and cost of
+    # each combination, the sum of the absolute powers with negative
+    # powers of named units counting three times (Pa^-1.W is not simpler
+    # than m^3.s^-1)
+    global _combination_table
+    if _combination_table is not None:
+        return _combination_table
+    _np = pu._numpy()
+    _units = [x for x in _this.all_cunits
+              if all(isinstance(y, int) for y in x._dims)]
+    _powers = [x for x in range(-_MAX_POWER, _MAX_POWER + 1) if x != 0]
+    _named, _rows = [], []
+    for n in range(1, _MAX_NAMED + 1):
+        for units in combinations(_units, n):
+            for powers in product(_powers, repeat=n):
+                _named.append(list(zip(units, powers)))
+                _rows.append([sum(power * unit._dims[i]
+                                  for unit, power in _named[-1])
+                              for i in range(len(pu.BASE_UNITS))])
+    _combination_table = (
+        _named, _np.array(_rows, dtype=int).reshape(-1, len(pu.BASE_UNITS)),
+        _np.array([len(x) for x in _named], dtype=int),
+        _np.array([sum(abs(power) if power > 0 else -3 * power
+                       for _, power in x) for x in _named], dtype=int))
+    return _combination_table
+
+
+def _decompose(dims):
+    '''
+    Find the simplest product of up to '_MAX_NAMED' named units, each to a
+    power of at most '_MAX_POWER', with the SI base units making up the
+    rest of the dimension, e.g. kg.s^-3 as W.m^-2. Dimensions are treated
+    as integer vectors, the base units being left with the difference
+    between 'dims' and each combination of named units, all of the
+    combinations being tried at once. Simpler products have fewer
+    factors, then smaller powers, then fewer named units (e.g. J.s rather
+    than C.Wb), the order of 'all_cunits' breaking any remaining ties.
+    Negative powers of named units are penalised, and a product is only
+    used when it is strictly simpler than the base units: it must have
+    fewer factors, or as many factors and smaller powers where the base
+    form has a power of 3 or more and no base unit is left with a larger
+    power than it started with (kg.s^-3 as W.m^-2, but m.s^-2 is kept
+    rather than N.kg^-1 and kg^-1.m^3.s^-2 rather than J.kg^-2.m).
+
+    Returns
+    -------
+
+    list of tuples       the named units with their powers, empty if no
+                         combination is simpler than the base units alone
+    '''
+    _np = pu._numpy()
+    _named, _vectors, _counts, _sizes = _combinations()
+    if not _named:
+        return []
+    _dims = _np.array(dims, dtype=int)
+    _residuals = _dims - _vectors
+    _factors = _np.count_nonzero(_residuals, axis=1) + _counts
+    _total = _np.abs(_residuals).sum(axis=1) + _sizes
+    i = _np.lexsort((_counts, _total, _factors))[0]
+    _base_factors = sum(1 for x in dims if x)
+    if _factors[i] < _base_factors:
+        return _named[i]
+    if _factors[i] > _base_factors or max(abs(x) for x in dims) < 3:
+        return []
+    _grown = ((_dims != 0) & ((_residuals * _dims < 0)
+                              | (_np.abs(_residuals) > _np.abs(_dims))))
+    _total = _np.where(_factors == _base_factors, _total, _np.iinfo(int).max)
+    _total[_grown.any(axis=1)] = _np.iinfo(int).max
+    i = _np.lexsort((_counts, _total))[0]
+    if _total[i] < sum(abs(x) for x in dims):
+        return _named[i]
+    return []
+
+
+def _simplified(dims):
+    # The display suffix, scale and description of the simplest form of
+    # a dimension, or None if it is best left in terms of the base units,
+    # as are all powers of a single base unit, e.g. s rather than Hz^-1
+    if sum(1 for x in dims if x) < 2:
+        return None
+    _match = _find_named_unit(dims)
+    if _match is not None:
+        unit, _factor = _match
+        return ('{}{}'.format(unit._label, '^{}'.format(
+            _factor) if _factor != 1 else ''), unit._magnitude**_factor,
+            unit._desc)
+    if any(not isinstance(x, int) for x in dims):
+        return None
+    _named = _decompose(dims)
+    if not _named:
+        return None
+    _residual = list(dims)
+    _labels, _scale = [], 1
+    for unit, power in _named:
+        for i, exponent in enumerate(unit._dims):
+            _residual[i] -= power * exponent
+        _labels.append('{}{}'.format(
+            unit._label, '^{}'.format(power) if power != 1 else ''))
+        _scale *= unit._magnitude**power
+    _labels.append(pu._format_dims(pu._dimension(_residual)))
+    return ('.'.join(x for x in _labels if x), _scale,
+            'Quantity Has No Known Label')
+
+
+def _find_named_unit(dims):
+    _primitive, _factor = _normalise(dims)
+    _best = None
+    for unit, unit_factor in _simplify_index.get(_primitive, []):
+        if _factor % unit_factor == 0:
+            _power = _factor // unit_factor
+            # The smallest power, positive rather than negative, e.g. S
+            # rather than Ω^-1
+            if _best is None or (abs(_power), _power < 0) \
+                    < (abs(_best[1]), _best[1] < 0):
+                _best = (unit, _power)
+    return _best
+
+
+def register_unit(unit):
+    '''
+    Add a named combined_units object to the units 'simplify' will
+    express results in terms of.
+
+    Arguments
+    ---------
+
+    unit      (combined_units)     the named unit, e.g. W
+    '''
+    _this.all_cunits.append(unit)
+    _update_index()
+    if _loaded('parsing'):
+        _this.clear_parse_cache()
+    if _loaded('tables'):
+        _this.tables._add_unit(unit)
+
 
 def simplify(comp_unit):
-    for unit in all_cunits:
-        _match_keys = comp_unit._components.keys() == unit._components.keys()
-        if _match_keys:
-            _factor = min([abs(i) for i in comp_unit._components.values()])
-            _other_indices = [_factor * i for i in unit._components.values()]
-            _match_indices = list(
-                comp_unit._components.values()) == _other_indices
-            _other_indices = [-1 * _factor *
-                              i for i in unit._components.values()]
-            _match_indices_neg = list(
-                comp_unit._components.values()) == _other_indices
-            if _match_indices or _match_indices_neg:
-                if _match_indices_neg:
-                    _factor *= -1
-                tmp = comp_unit._magnitude * pu.combined_units()
-                tmp._desc = unit._desc
-                tmp._components[pu.si_unit(unit._label, "", "")] = _factor
-                tmp._magnitude = comp_unit._magnitude
-                return tmp
-    return comp_unit
+    '''
+    Express a combined_units object as a power of one of the named units
+    in 'all_cunits' where possible, e.g. kg.m.s^-2 as N, or else as the
+    simplest product of named units and SI base units, e.g. kg.s^-3 as
+    W.m^-2. The search is done once for each dimension.
+
+    Arguments
+    ---------
+
+    comp_unit      (combined_units)     the unit to simplify
+
+    Returns
+    -------
+
+    combined_units      the simplified unit, or comp_unit itself if no
+                        named unit matches
+    '''
+    if len(_this.all_cunits) != _n_indexed:
+        _update_index()
+    try:
+        _match = _simplify_cache[comp_unit._dims]
+    except KeyError:
+        _match = _simplify_cache[comp_unit._dims] = _simplified(
+            comp_unit._dims)
+    if _match is None:
+        return comp_unit
+    _suffix, _scale, _desc = _match
+    tmp = pu.combined_units()
+    tmp._desc = _desc
+    tmp._dims = comp_unit._dims
+    tmp._magnitude = comp_unit._magnitude
+    tmp._display = (_suffix, _scale)
+    return tmp
+
+
+__all__ = ['A', 's', 'kg', 'm', 'rad', 'sr', 'K', 'mol', 'cd', 'pi',
+           'QuantityArray', 'register_unit',
+           'simplify', 'clear_parse_cache', 'parse', 'parse_array',
+           'parse_many', 'convert_lines', 'convert_pairs', 'Expression',
+           'deferred', 'variable', 'checked', 'format_many',
+           'QuantityAccumulator', 'QuantityIndex', 'to_wire', 'from_wire',
+           'parallel_map', 'save_column', 'load_column', 'prefixed_unit',
+           'auto_prefix', 'format_prefixed', 'conversion_table',
+           'convert_many', 'instrumented', 'UncertainQuantity',
+           'monte_carlo', 'UnitSystem', 'get_unit_system', 'unit_system'] + list(_definitions)
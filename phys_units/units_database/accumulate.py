@@ -0,0 +1,202 @@
+import math
+
+from . import phys_units as pu
+
+
+class QuantityAccumulator(object):
+    '''
+    Running statistics of a stream of measurements of the same dimension,
+    e.g. the energies of many events, without keeping the measurements.
+    The dimension is checked once per measurement (or once per array of
+    measurements) and only the SI magnitudes are then folded into the
+    sum, mean, minimum, maximum and variance, the latter using Welford's
+    algorithm.
+
+    Optional Arguments
+    ------------------
+
+    unit       (si_unit/combined_units)     unit of plain numbers given to
+                                            'add' and 'update', by default
+                                            they are in SI units and the
+                                            dimension is taken from the
+                                            first measurement added
+
+    Examples
+    --------
+
+    energies = QuantityAccumulator(GeV)
+    energies.update(event_energies)
+    print(energies.mean().as_unit(GeV), energies.std().as_unit(GeV))
+    '''
+
+    def __init__(self, unit=None):
+        self._dims = None
+        self._unit_magnitude = 1
+        if unit is not None:
+            self._unit_magnitude, self._dims = pu._unit_parts(unit)
+        self.count = 0
+        self._sum = 0.
+        self._mean = 0.
+        self._m2 = 0.
+        self._min = math.inf
+        self._max = -math.inf
+
+    def __len__(self):
+        return self.count
+
+    def _check(self, dims):
+        if self._dims is None:
+            self._dims = dims
+        elif dims != self._dims:
+            raise Exception(
+                "Cannot Accumulate '{}' With '{}', Do Indices Match?".format(
+                    pu._format_dims(dims) or 'dimensionless',
+                    pu._format_dims(self._dims) or 'dimensionless'))
+
+    def add(self, quantity):
+        '''
+        Add a single measurement.
+
+        Arguments
+        ---------
+
+        quantity    (combined_units/number)     the measurement
+        '''
+        return self.update((quantity,))
+
+    def update(self, quantities):
+        '''
+        Add many measurements, an array of measurements being added at
+        once with numpy.
+
+        Arguments
+        ---------
+
+        quantities    (iterable of combined_units    the measurements
+                       or numbers, QuantityArray
+                       or numpy array)
+
+        Returns
+        -------
+
+        QuantityAccumulator      self
+        '''
+        if isinstance(quantities, pu.QuantityArray):
+            self._check(quantities._dims)
+            return self._add_array(quantities._magnitude)
+        if pu._is_array(quantities):
+            self._check(self._dims or pu.DIMENSIONLESS)
+            return self._add_array(quantities * self._unit_magnitude)
+
+        _dims, _unit_magnitude = self._dims, self._unit_magnitude
+        _count, _sum, _mean, _m2 = self.count, self._sum, self._mean, self._m2
+        _min, _max = self._min, self._max
+        try:
+            for quantity in quantities:
+                if isinstance(quantity, (int, float)):
+                    _value = quantity * _unit_magnitude
+                    if _dims is None:
+                        _dims = self._dims = pu.DIMENSIONLESS
+                else:
+                    _value, _quantity_dims = pu._unit_parts(quantity)
+                    if _quantity_dims is not _dims:
+                        self._check(_quantity_dims)
+                        _dims = self._dims
+                _count += 1
+                _sum += _value
+                _delta = _value - _mean
+                _mean += _delta / _count
+                _m2 += _delta * (_value - _mean)
+                if _value < _min:
+                    _min = _value
+                if _value > _max:
+                    _max = _value
+        finally:
+            self._dims = _dims
+            self.count, self._sum, self._mean, self._m2 = _count, _sum, _mean, _m2
+            self._min, self._max = _min, _max
+        return self
+
+    def _add_array(self, magnitudes):
+        _magnitudes = magnitudes.ravel()
+        if not _magnitudes.size:
+            return self
+        _mean = float(_magnitudes.mean())
+        return self._combine(_magnitudes.size, float(_magnitudes.sum()), _mean,
+                             float(((_magnitudes - _mean)**2).sum()),
+                             float(_magnitudes.min()), float(_magnitudes.max()))
+
+    def _combine(self, count, total, mean, m2, minimum, maximum):
+        # Chan et al.'s formula for the variance of two combined samples
+        _count = self.count + count
+        _delta = mean - self._mean
+        self._m2 += m2 + _delta**2 * self.count * count / _count
+        self._mean += _delta * count / _count
+        self._sum += total
+        self.count = _count
+        self._min = min(self._min, minimum)
+        self._max = max(self._max, maximum)
+        return self
+
+    def merge(self, other):
+        '''
+        Add the measurements accumulated by another QuantityAccumulator,
+        e.g. one filled in another process.
+
+        Arguments
+        ---------
+
+        other      (QuantityAccumulator)     the accumulator to merge
+
+        Returns
+        -------
+
+        QuantityAccumulator      self
+        '''
+        if other.count:
+            self._check(other._dims)
+            self._combine(other.count, other._sum, other._mean, other._m2,
+                          other._min, other._max)
+        return self
+
+    def _result(self, magnitude, power=1):
+        if not self.count:
+            raise Exception("No Quantities Have Been Accumulated")
+        return pu._from_si(magnitude, pu._dim_pow(self._dims, power))
+
+    def sum(self):
+        return pu._from_si(self._sum, self._dims or pu.DIMENSIONLESS)
+
+    def mean(self):
+        return self._result(self._mean)
+
+    def min(self):
+        return self._result(self._min)
+
+    def max(self):
+        return self._result(self._max)
+
+    def variance(self, ddof=0):
+        '''
+        The variance of the measurements.
+
+        Optional Arguments
+        ------------------
+
+        ddof     (int)     delta degrees of freedom, 1 for the sample
+                           variance
+
+        Returns
+        -------
+
+        combined_units      the variance, in the square of the units of
+                            the measurements
+        '''
+        if self.count <= ddof:
+            raise Exception("Too Few Quantities Accumulated for Variance")
+        return self._result(self._m2 / (self.count - ddof), 2)
+
+    def std(self, ddof=0):
+        if self.count <= ddof:
+            raise Exception("Too Few Quantities Accumulated for Variance")
+        return self._result(math.sqrt(self._m2 / (self.count - ddof)))
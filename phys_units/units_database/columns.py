@@ -0,0 +1,136 @@
+import struct
+
+from . import phys_units as pu
+
+# A column file is a header followed by the SI magnitudes as a raw
+# little-endian float64 or float32 buffer, starting at a multiple of
+# 64 bytes. The header holds, in order:
+#
+#   magic        6 bytes, b'PUCOL\0'
+#   version      uint8
+#   dtype        uint8, 0 for float64 and 1 for float32
+#   offset       uint64, the position of the buffer in the file
+#   ndim         uint8, followed by the shape as ndim uint64
+#   dims         the exponent of each SI base unit as a float64
+#   const        float64
+#   scale        float64, the display scale, 0 if there is none
+#   strings      the display suffix, label, other label and description
+#                each as a uint32 length followed by utf-8 text
+
+_MAGIC = b'PUCOL\0'
+_VERSION = 1
+_ALIGNMENT = 64
+_DTYPES = ('<f8', '<f4')
+
+_START = struct.Struct('<6sBBQ')
+_NDIM = struct.Struct('<B')
+_DIMS = struct.Struct('<{}d'.format(len(pu.BASE_UNITS)))
+_FLOATS = struct.Struct('<dd')
+_LENGTH = struct.Struct('<I')
+
+
+def _header(quantities, dtype):
+    _magnitude = quantities._magnitude
+    _display = quantities._display or ('', 0)
+    _parts = [_NDIM.pack(_magnitude.ndim),
+              struct.pack('<{}Q'.format(_magnitude.ndim), *_magnitude.shape),
+              _DIMS.pack(*quantities._dims),
+              _FLOATS.pack(quantities._const, _display[1])]
+    for text in (_display[0], quantities._label, quantities._other_label,
+                 quantities._desc):
+        _text = text.encode('utf-8')
+        _parts += [_LENGTH.pack(len(_text)), _text]
+    _size = _START.size + sum(len(x) for x in _parts)
+    _offset = -(-_size // _ALIGNMENT) * _ALIGNMENT
+    _start = _START.pack(_MAGIC, _VERSION, _DTYPES.index(dtype), _offset)
+    return (_start + b''.join(_parts)).ljust(_offset, b'\0')
+
+
+def save_column(path, quantities, dtype='float64'):
+    '''
+    Write an array of measurements to a column file, which can be read
+    back with 'load_column' without parsing or copying the data.
+
+    Arguments
+    ---------
+
+    path          (string)            the file to write
+
+    quantities    (QuantityArray)     the measurements
+
+    Optional Arguments
+    ------------------
+
+    dtype         (string)            'float64' or 'float32', the type in
+                                      which the SI magnitudes are stored
+    '''
+    if not isinstance(quantities, pu.QuantityArray):
+        raise Exception("Only a QuantityArray can be Saved as a Column")
+    _np = pu._numpy()
+    _dtype = _np.dtype(dtype).newbyteorder('<').str
+    if _dtype not in _DTYPES:
+        raise ValueError("Unsupported Column Type '{}'".format(dtype))
+    with open(path, 'wb') as f:
+        f.write(_header(quantities, _dtype))
+        f.write(_np.ascontiguousarray(quantities._magnitude, dtype=_dtype).tobytes())
+
+
+def load_column(path, mode='r'):
+    '''
+    Read an array of measurements from a column file written by
+    'save_column'. The magnitudes are memory mapped rather than read,
+    so that several processes loading the same file share its data.
+
+    Arguments
+    ---------
+
+    path     (string)     the file to read
+
+    Optional Arguments
+    ------------------
+
+    mode     (string)     the numpy.memmap mode, 'r' for read only, 'r+'
+                          to write changes back to the file or 'c' for
+                          changes to be kept in memory only
+
+    Returns
+    -------
+
+    QuantityArray      the measurements, with the units they were saved with
+    '''
+    with open(path, 'rb') as f:
+        _data = f.read(_START.size)
+        if len(_data) < _START.size or not _data.startswith(_MAGIC):
+            raise ValueError("'{}' is Not a Column File".format(path))
+        _, _version, _dtype, _start = _START.unpack(_data)
+        if _version != _VERSION:
+            raise ValueError(
+                "Unsupported Column File Version '{}'".format(_version))
+        _data = f.read(_start - _START.size)
+
+    _ndim = _NDIM.unpack_from(_data)[0]
+    _shape = struct.unpack_from('<{}Q'.format(_ndim), _data, _NDIM.size)
+    _offset = _NDIM.size + 8 * _ndim
+    _dims = _DIMS.unpack_from(_data, _offset)
+    _offset += _DIMS.size
+    _const, _scale = _FLOATS.unpack_from(_data, _offset)
+    _offset += _FLOATS.size
+    _strings = []
+    for _ in range(4):
+        _length = _LENGTH.unpack_from(_data, _offset)[0]
+        _offset += _LENGTH.size
+        _strings.append(_data[_offset:_offset + _length].decode('utf-8'))
+        _offset += _length
+
+    _np = pu._numpy()
+    tmp = pu.QuantityArray.__new__(pu.QuantityArray)
+    if 0 in _shape:
+        tmp._magnitude = _np.empty(_shape, dtype=_DTYPES[_dtype])
+    else:
+        tmp._magnitude = _np.memmap(path, dtype=_DTYPES[_dtype], mode=mode,
+                                    offset=_start, shape=_shape)
+    tmp._dims = pu._dimension(_dims)
+    tmp._const = int(_const) if _const == int(_const) else _const
+    tmp._display = (_strings[0], _scale) if _scale else None
+    tmp._label, tmp._other_label, tmp._desc = _strings[1:]
+    return tmp
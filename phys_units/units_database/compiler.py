@@ -0,0 +1,142 @@
+import builtins
+from functools import update_wrapper
+
+from . import phys_units as pu
+from .expression import Expression, variable
+
+# A formula is compiled by calling it once with a variable (see
+# expression.py) in place of each argument, and turning the recorded
+# expression into the source of a plain Python function. The products,
+# quotients and powers of the expression are gathered into a single
+# numeric coefficient, into which all of the constants and conversion
+# factors are folded, times powers of the arguments or of sums.
+
+
+def _factor(source, power, factors):
+    factors[source] = factors.get(source, 0) + power
+
+
+def _fold(node, constants):
+    # The expression as a numeric coefficient and a dictionary of the
+    # source of each factor depending on the arguments with its power
+    if not node._variables:
+        return node._magnitude({}), {}
+    _op, _operands = node._op, node._operands
+    if _op == 'var':
+        return _operands[1], {_operands[0]: 1}
+    if _op in ('mul', 'div'):
+        _sign = 1 if _op == 'mul' else -1
+        _coefficient, _factors = _fold(_operands[0], constants)
+        _other, _other_factors = _fold(_operands[1], constants)
+        for source, power in _other_factors.items():
+            _factor(source, _sign * power, _factors)
+        return _coefficient * _other**_sign, _factors
+    if _op == 'neg':
+        _coefficient, _factors = _fold(_operands[0], constants)
+        return -_coefficient, _factors
+    if _op == 'pow' and isinstance(_operands[1], int):
+        _coefficient, _factors = _fold(_operands[0], constants)
+        return _coefficient**_operands[1], {
+            source: power * _operands[1] for source, power in _factors.items()}
+    if _op == 'pow':
+        return 1, {'({})'.format(_source(_operands[0], constants)): _operands[1]}
+    return 1, {'({}{}{})'.format(_source(_operands[0], constants),
+                                 ' + ' if _op == 'add' else ' - ',
+                                 _source(_operands[1], constants)): 1}
+
+
+def _power(source, power):
+    if power == 1:
+        return source
+    return '{}**{}'.format(source, power)
+
+
+def _source(node, constants, scale=1):
+    # The source of an expression, divided by 'scale', the constants it
+    # uses being added to 'constants' by name
+    _coefficient, _factors = _fold(node, constants)
+    _coefficient = _coefficient / scale
+    _numerator = [_power(x, p) for x, p in _factors.items() if p > 0]
+    _denominator = [_power(x, -p) for x, p in _factors.items() if p < 0]
+    if pu._is_array(_coefficient) or _coefficient != 1 or not _numerator:
+        _name = '{}{}'.format(constants['_prefix'], len(constants) - 1)
+        constants[_name] = _coefficient
+        _numerator.insert(0, _name)
+    _source = '*'.join(_numerator)
+    if len(_denominator) == 1:
+        _source += '/' + _denominator[0]
+    elif _denominator:
+        _source += '/({})'.format('*'.join(_denominator))
+    return _source
+
+
+def compile(function, inputs, output=None):
+    '''
+    Compile a formula written in terms of units and quantities into a
+    plain function of numbers, e.g.
+
+    force = compile(lambda M, m, r: G*M*m/r**2, inputs=(kg, kg, AU),
+                    output=N)
+    force(1.989E30, 5.972E24, [1, 1.5, 5.2])
+
+    The formula is traced once, with its dimensions checked, and all of
+    the constants and conversion factors are folded into a single number,
+    so that the compiled function does only the arithmetic on its
+    arguments, whether they are floats or numpy arrays.
+
+    Arguments
+    ---------
+
+    function   (callable)                   the formula, taking one
+                                            argument for each of 'inputs'
+
+    inputs     (tuple)                      the unit of each argument of
+                                            the compiled function, None for
+                                            a dimensionless argument
+
+    Optional Arguments
+    ------------------
+
+    output     (si_unit/combined_units)     the unit of the result of the
+                                            compiled function, by default
+                                            SI units
+
+    Returns
+    -------
+
+    function      the compiled function, its source being kept as its
+                  'source' attribute
+    '''
+    # inspect is slow to import and only needed here
+    import inspect
+    _names = list(inspect.signature(function).parameters)
+    if len(_names) != len(inputs):
+        raise Exception(
+            "'{}' Takes {} Arguments With Units But {} Were Given".format(
+                function.__name__, len(_names), len(inputs)))
+    _prefix = '_k'
+    while any(x.startswith(_prefix) for x in _names):
+        _prefix = '_' + _prefix
+    _expression = function(*(variable(name, unit)
+                             for name, unit in zip(_names, inputs)))
+    if not isinstance(_expression, Expression):
+        _expression = Expression._wrap(_expression)
+    _dims = _expression.dims()
+    _scale = 1
+    if output is not None:
+        _scale, _output = pu._unit_parts(output)
+        if _dims != _output:
+            raise Exception(
+                "'{}' Returns Units of '{}', Not '{}'".format(
+                    function.__name__, pu._format_dims(_dims) or 'dimensionless',
+                    pu._format_dims(_output) or 'dimensionless'))
+
+    _constants = {'_prefix': _prefix}
+    _body = _source(_expression, _constants, _scale)
+    del _constants['_prefix']
+    _code = 'def compiled({}):\n    return {}\n'.format(', '.join(_names), _body)
+    exec(builtins.compile(_code, '<compiled {}>'.format(function.__name__), 'exec'),
+         _constants)
+    _compiled = update_wrapper(_constants['compiled'], function)
+    _compiled.source = _code
+    return _compiled
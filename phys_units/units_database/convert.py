@@ -0,0 +1,234 @@
+import sys
+from collections import deque
+from functools import lru_cache
+from itertools import islice
+
+from . import phys_units as pu
+from .parsing import _parse_unit
+
+
+@lru_cache(maxsize=1024)
+def _factor(unit_str, to_str):
+    _unit = _parse_unit(unit_str)
+    _to = _parse_unit(to_str)
+    return _unit._magnitude / pu._conversion_factor(_unit._dims, _to._dims,
+                                                    _to._magnitude)
+
+
+def convert_pairs(pairs, to):
+    '''
+    Convert measurements given as (value, unit) pairs to another unit.
+
+    Arguments
+    ---------
+
+    pairs    (iterable of tuples)          the measurements, the unit of
+                                           each being either a string,
+                                           e.g. 'km', or a unit object
+
+    to       (combined_units/si_unit)      unit to convert to
+
+    Returns
+    -------
+
+    generator of floats      the values in terms of 'to'
+    '''
+    _to_magnitude, _to_dims = pu._unit_parts(to)
+    for value, unit in pairs:
+        if isinstance(unit, str):
+            unit = _parse_unit(unit)
+        _magnitude, _dims = pu._unit_parts(unit)
+        yield float(value) * _magnitude / pu._conversion_factor(
+            _dims, _to_dims, _to_magnitude)
+
+
+def _convert_chunk(args):
+    # The converted lines of a chunk, along with the number and error
+    # message of each line which could not be converted and is left out
+    lines, first_line, to_str, delimiter, value_column, unit_column = args
+    _out = []
+    _errors = []
+    for number, line in enumerate(lines, first_line):
+        _fields = line.rstrip('\r\n').split(delimiter)
+        if _fields == ['']:
+            continue
+        try:
+            _fields[value_column] = repr(
+                float(_fields[value_column])
+                * _factor(_fields[unit_column].strip(), to_str))
+        except IndexError:
+            _errors.append((number, 'Expected Columns {} and {}, Found {}'.format(
+                value_column, unit_column, len(_fields))))
+            continue
+        except Exception as e:
+            _errors.append((number, str(e)))
+            continue
+        _fields[unit_column] = to_str
+        _out.append(delimiter.join(_fields) + '\n')
+    return ''.join(_out), _errors
+
+
+def _chunks(lines, chunk_size, start):
+    _lines = iter(lines)
+    while True:
+        _chunk = list(islice(_lines, chunk_size))
+        if not _chunk:
+            return
+        yield _chunk, start
+        start += len(_chunk)
+
+
+def _pooled(function, jobs, workers):
+    # 'map(function, jobs)' run by a pool of processes, with at most twice
+    # as many jobs sent to the pool as there are workers so that the input
+    # is read only as fast as it is converted
+    from multiprocessing import Pool
+    with Pool(workers) as pool:
+        _pending = deque(pool.apply_async(function, (job,))
+                         for job in islice(jobs, 2 * workers))
+        while _pending:
+            _result = _pending.popleft().get()
+            for job in islice(jobs, 1):
+                _pending.append(pool.apply_async(function, (job,)))
+            yield _result
+
+
+def convert_lines(lines, to, delimiter=',', value_column=0, unit_column=1,
+                  chunk_size=10000, workers=1, on_error=None, start=1):
+    '''
+    Convert lines of delimited text containing a value and a unit column
+    to another unit, reading and converting 'chunk_size' lines at a time
+    so that the whole input is never held in memory. All other columns
+    are passed through unchanged.
+
+    Arguments
+    ---------
+
+    lines          (iterable of strings)   the input lines, e.g. an open file
+
+    to             (string)                unit to convert to, e.g. 'miles'
+
+    delimiter      (string)                column separator
+
+    value_column   (int)                   index of the value column
+
+    unit_column    (int)                   index of the unit column
+
+    chunk_size     (int)                   number of lines converted at a time
+
+    workers        (int)                   number of processes to convert
+                                           chunks in parallel
+
+    on_error       (callable)              called with the line number and
+                                           error message of each line which
+                                           cannot be converted, the line
+                                           being left out, by default a
+                                           ValueError is raised
+
+    start          (int)                   number of the first line, used
+                                           in the error messages
+
+    Returns
+    -------
+
+    generator of strings      the converted chunks of lines
+    '''
+    if chunk_size < 1:
+        raise ValueError('Chunk Size Must Be At Least 1, Not {}'.format(chunk_size))
+    if workers < 1:
+        raise ValueError('Workers Must Be At Least 1, Not {}'.format(workers))
+    _parse_unit(to)
+    _jobs = ((chunk, first_line, to, delimiter, value_column, unit_column)
+             for chunk, first_line in _chunks(lines, chunk_size, start))
+    if workers > 1:
+        _converted = _pooled(_convert_chunk, _jobs, workers)
+    else:
+        _converted = map(_convert_chunk, _jobs)
+    for converted, errors in _converted:
+        for number, message in errors:
+            if on_error is None:
+                raise ValueError('line {}: {}'.format(number, message))
+            on_error(number, message)
+        yield converted
+
+
+def _positive(text):
+    # An argparse type for the counts which must be at least 1
+    import argparse
+    try:
+        _value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError("invalid int value: '{}'".format(text))
+    if _value < 1:
+        raise argparse.ArgumentTypeError('must be at least 1, not {}'.format(_value))
+    return _value
+
+
+def main(argv=None):
+    '''
+    Entry point of the 'units-convert' command, e.g.
+
+    units-convert --to miles --chunk-size 100000 --workers 4 data.csv
+
+    where each line of data.csv is of the form '5.2,km'. Lines which
+    cannot be converted are reported on standard error and left out, the
+    exit status then being 1.
+    '''
+    import argparse
+
+    _parser = argparse.ArgumentParser(
+        prog='units-convert',
+        description='Convert delimited (value, unit) records to another unit.')
+    _parser.add_argument('inputs', nargs='*', default=['-'],
+                         help="input files, '-' for standard input")
+    _parser.add_argument('--to', required=True,
+                         help="unit to convert to, e.g. 'miles' or 'km.h^-1'")
+    _parser.add_argument('--chunk-size', type=_positive, default=10000,
+                         help='number of lines converted at a time')
+    _parser.add_argument('--workers', type=_positive, default=1,
+                         help='number of worker processes')
+    _parser.add_argument('--delimiter', default=',',
+                         help="column separator, 'tab' for TSV input")
+    _parser.add_argument('--value-column', type=int, default=0)
+    _parser.add_argument('--unit-column', type=int, default=1)
+    _parser.add_argument('--header', action='store_true',
+                         help='copy the first line of each input unchanged')
+    _parser.add_argument('-o', '--output', default='-',
+                         help="output file, '-' for standard output")
+    _args = _parser.parse_args(argv)
+
+    _delimiter = '\t' if _args.delimiter == 'tab' else _args.delimiter
+    try:
+        _parse_unit(_args.to)
+    except ValueError as e:
+        _parser.error(str(e))
+    _errors = []
+
+    def _report(number, message):
+        _errors.append(number)
+        print('{}: line {}: {}'.format('<stdin>' if _name == '-' else _name,
+                                       number, message), file=sys.stderr)
+
+    _output = sys.stdout if _args.output == '-' else open(
+        _args.output, 'w', encoding='utf-8')
+    try:
+        for _name in _args.inputs:
+            _input = sys.stdin if _name == '-' else open(_name, encoding='utf-8')
+            try:
+                if _args.header:
+                    _output.write(next(_input, ''))
+                for converted in convert_lines(_input, _args.to, _delimiter,
+                                               _args.value_column,
+                                               _args.unit_column,
+                                               _args.chunk_size,
+                                               _args.workers, _report,
+                                               2 if _args.header else 1):
+                    _output.write(converted)
+            finally:
+                if _input is not sys.stdin:
+                    _input.close()
+    finally:
+        if _output is not sys.stdout:
+            _output.close()
+    return 1 if _errors else 0
+
@@ -0,0 +1,97 @@
+from functools import wraps
+
+from . import phys_units as pu
+
+
+def _parts(value):
+    # The (SI magnitude, dimensions) of an argument, avoiding the
+    # isinstance checks of _unit_parts for quantities.
+    try:
+        return value._magnitude, value._dims
+    except AttributeError:
+        return pu._unit_parts(value)
+
+
+def _verdict(expected, dims, name):
+    # None if the dimensions of the arguments are those expected, else
+    # the message of the exception raised.
+    if len(dims) != len(expected):
+        return "'{}' Takes {} Arguments With Units But {} Were Given".format(
+            name, len(expected), len(dims))
+    for position, (_expected, _dims) in enumerate(zip(expected, dims)):
+        if _expected is not None and _dims != _expected:
+            return "Argument {} of '{}' Must Have Units of '{}', Not '{}'".format(
+                position, name, pu._format_dims(_expected) or 'dimensionless',
+                pu._format_dims(_dims) or 'dimensionless')
+    return None
+
+
+def checked(inputs, output=None):
+    '''
+    Decorator checking the dimensions of the positional arguments of a
+    function, which is then called with their magnitudes in SI units
+    (floats or numpy arrays) so that its body does no unit arithmetic.
+    The result of the check is cached for each combination of argument
+    dimensions, so that calls after the first cost little more than
+    calling the function itself. Keyword arguments are passed unchanged.
+
+    e.g.
+
+    @checked(inputs=(m, s), output=m/s)
+    def speed(distance, time):
+        return distance / time
+
+    speed(5*km, 2*minute)
+
+    Arguments
+    ---------
+
+    inputs     (tuple)                   the unit of each positional
+                                         argument, plain numbers being
+                                         dimensionless, or None for an
+                                         argument which is not checked
+
+    output     (si_unit/combined_units   the unit of the SI magnitude(s)
+                or tuple)                returned by the function, a tuple
+                                         for a function returning several
+                                         values, or None to return the
+                                         result unchanged
+
+    Returns
+    -------
+
+    function      the decorator
+    '''
+    _expected = tuple(None if unit is None else pu._unit_parts(unit)[1]
+                      for unit in inputs)
+    _several = isinstance(output, tuple)
+    if output is None:
+        _output = None
+    elif _several:
+        _output = tuple(pu._unit_parts(unit)[1] for unit in output)
+    else:
+        _output = pu._unit_parts(output)[1]
+
+    def decorator(function):
+        _verdicts = {}
+        _name = function.__name__
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            _magnitudes, _dims = zip(*map(_parts, args)) if args else ((), ())
+            try:
+                _failure = _verdicts[_dims]
+            except KeyError:
+                _failure = _verdicts[_dims] = _verdict(_expected, _dims, _name)
+            if _failure is not None:
+                raise Exception(_failure)
+            _result = function(*_magnitudes, **kwargs)
+            if _output is None:
+                return _result
+            if _several:
+                return tuple(pu._from_si(x, dims) for x, dims in zip(_result, _output))
+            return pu._from_si(_result, _output)
+
+        return wrapper
+
+    return decorator
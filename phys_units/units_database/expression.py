@@ -0,0 +1,318 @@
+from numbers import Number
+
+from . import phys_units as pu
+
+_SYMBOLS = {'mul': '*', 'div': '/', 'add': ' + ', 'sub': ' - '}
+
+
+def _label(unit):
+    if isinstance(unit, pu.si_unit) and not isinstance(unit, pu.phys_float):
+        return unit._unit_string
+    if isinstance(unit, (pu.combined_units, pu.QuantityArray)) and unit._label:
+        return unit._label
+    return str(unit)
+
+
+class Expression(object):
+    '''
+    A formula whose evaluation is deferred, recorded as a tree of the
+    operations applied to units, quantities and variables. The dimensions
+    of the result are resolved once, symbolically, and the magnitudes
+    of all steps are then computed in a single pass when the expression
+    is evaluated. Parts of the tree which do not depend on variables are
+    only ever computed once.
+
+    Expressions are created with 'deferred' and 'variable', e.g.
+
+    force = deferred(G)*M_sol*M_earth/variable('r', AU)**2
+    force.evaluate(r=[1, 1.5, 5.2])
+    '''
+    __slots__ = ('_op', '_operands', '_dims', '_value', '_variables')
+
+    # The quantities of units_database leave their operations with an
+    # Expression to its reflected methods, so that deferred expressions
+    # may be started from a variable, e.g. G*variable('M', kg)
+    _defers_units = True
+
+    def __init__(self, op, operands, variables=frozenset()):
+        self._op = op
+        self._operands = operands
+        self._dims = None
+        self._value = None
+        self._variables = variables
+
+    @classmethod
+    def _wrap(cls, value):
+        if isinstance(value, Expression):
+            return value
+        if isinstance(value, Number):
+            return cls('leaf', (value, pu.DIMENSIONLESS, repr(value)))
+        if isinstance(value, (pu.si_unit, pu.combined_units, pu.QuantityArray)):
+            _magnitude, _dims = pu._unit_parts(value)
+            return cls('leaf', (_magnitude, _dims, _label(value)))
+        if pu._is_array(value):
+            _array = pu._numpy().asarray(value, dtype=float)
+            return cls('leaf', (_array, pu.DIMENSIONLESS, 'array'))
+        raise Exception(
+            "Cannot Defer Evaluation of Object of Type '{}'".format(type(value)))
+
+    def _combine(self, op, other, reflected=False):
+        try:
+            other = Expression._wrap(other)
+        except Exception:
+            return NotImplemented
+        _operands = (other, self) if reflected else (self, other)
+        return Expression(op, _operands, self._variables | other._variables)
+
+    def __mul__(self, other):
+        return self._combine('mul', other)
+
+    def __rmul__(self, other):
+        return self._combine('mul', other, True)
+
+    def __truediv__(self, other):
+        return self._combine('div', other)
+
+    def __rtruediv__(self, other):
+        return self._combine('div', other, True)
+
+    def __add__(self, other):
+        return self._combine('add', other)
+
+    def __radd__(self, other):
+        return self._combine('add', other, True)
+
+    def __sub__(self, other):
+        return self._combine('sub', other)
+
+    def __rsub__(self, other):
+        return self._combine('sub', other, True)
+
+    def __neg__(self):
+        return Expression('neg', (self,), self._variables)
+
+    def __pow__(self, power):
+        if not isinstance(power, Number):
+            raise Exception("Exponent of a Deferred Expression Must be a Number")
+        return Expression('pow', (self, power), self._variables)
+
+    @property
+    def variables(self):
+        '''
+        The names of the variables which must be given to 'evaluate'.
+        '''
+        return sorted(self._variables)
+
+    def dims(self):
+        '''
+        Resolve the dimensions of the expression without evaluating it,
+        checking that only quantities of the same dimension are added.
+
+        Returns
+        -------
+
+        tuple      the exponents of the SI base units of the result
+        '''
+        if self._dims is not None:
+            return self._dims
+        _op, _operands = self._op, self._operands
+        if _op == 'leaf':
+            _dims = _operands[1]
+        elif _op == 'var':
+            _dims = _operands[2]
+        elif _op == 'mul':
+            _dims = pu._dim_mul(_operands[0].dims(), _operands[1].dims())
+        elif _op == 'div':
+            _dims = pu._dim_div(_operands[0].dims(), _operands[1].dims())
+        elif _op == 'pow':
+            _dims = pu._dim_pow(_operands[0].dims(), _operands[1])
+        elif _op == 'neg':
+            _dims = _operands[0].dims()
+        else:
+            _dims = _operands[0].dims()
+            if _operands[1].dims() != _dims:
+                raise Exception(
+                    "Cannot {} Unit Combination Objects, Do Indices Match?".format(
+                        'Add' if _op == 'add' else 'Subtract'))
+        self._dims = _dims
+        return _dims
+
+    def _magnitude(self, bindings):
+        if self._value is not None:
+            return self._value
+        _op, _operands = self._op, self._operands
+        if _op == 'leaf':
+            return _operands[0]
+        if _op == 'var':
+            return bindings[_operands[0]]
+        if _op == 'pow':
+            _result = _operands[0]._magnitude(bindings)**_operands[1]
+        elif _op == 'neg':
+            _result = -_operands[0]._magnitude(bindings)
+        else:
+            _left = _operands[0]._magnitude(bindings)
+            _right = _operands[1]._magnitude(bindings)
+            if _op == 'mul':
+                _result = _left * _right
+            elif _op == 'div':
+                _result = _left / _right
+            elif _op == 'add':
+                _result = _left + _right
+            else:
+                _result = _left - _right
+        if not self._variables:
+            self._value = _result
+        return _result
+
+    def _bind(self, name, value):
+        _unit_magnitude, _dims = self._find_variable(name)._operands[1:]
+        if isinstance(value, (pu.si_unit, pu.combined_units, pu.QuantityArray)):
+            _magnitude, _value_dims = pu._unit_parts(value)
+            if _value_dims != _dims:
+                raise Exception(
+                    "Variable '{}' Must Have Units of '{}'".format(
+                        name, pu._format_dims(_dims)))
+            return _magnitude
+        if pu._is_array(value) or isinstance(value, (list, tuple)):
+            value = pu._numpy().asarray(value, dtype=float)
+        return value * _unit_magnitude
+
+    def _find_variable(self, name):
+        _stack = [self]
+        while _stack:
+            _node = _stack.pop()
+            if _node._op == 'var':
+                if _node._operands[0] == name:
+                    return _node
+            elif _node._op != 'leaf' and _node._variables:
+                _stack.extend(x for x in _node._operands if isinstance(x, Expression))
+        raise Exception("Expression Has No Variable '{}'".format(name))
+
+    def evaluate(self, **bindings):
+        '''
+        Evaluate the expression.
+
+        Arguments
+        ---------
+
+        **bindings    values of the variables, each being a quantity of the
+                      variable's dimension, or a number, list or array of
+                      numbers in the variable's unit. Arrays evaluate the
+                      expression for every element at once.
+
+        Returns
+        -------
+
+        combined_units/QuantityArray     the result
+        '''
+        _missing = self._variables.difference(bindings)
+        if _missing:
+            raise Exception("No Value Given for Variable(s) '{}'".format(
+                "', '".join(sorted(_missing))))
+        _dims = self.dims()
+        _magnitudes = {name: self._bind(name, value)
+                       for name, value in bindings.items()}
+        return pu._from_si(self._magnitude(_magnitudes), _dims)
+
+    def evaluate_many(self, bindings):
+        '''
+        Evaluate the expression for many sets of variable values in a
+        single pass.
+
+        Arguments
+        ---------
+
+        bindings     (iterable of dicts)     the values of the variables
+                                             for each evaluation, see
+                                             'evaluate'
+
+        Returns
+        -------
+
+        QuantityArray      the result of each evaluation
+        '''
+        _columns = {name: [] for name in self._variables}
+        _n = 0
+        for binding in bindings:
+            for name in self._variables:
+                _value = binding[name]
+                if isinstance(_value, (pu.si_unit, pu.combined_units)):
+                    _value = self._bind(name, _value) / self._find_variable(
+                        name)._operands[1]
+                _columns[name].append(_value)
+            _n += 1
+        _np = pu._numpy()
+        _result = self.evaluate(**{name: _np.asarray(values, dtype=float)
+                                   for name, values in _columns.items()})
+        if isinstance(_result, pu.QuantityArray):
+            return _result
+        return pu._from_si(_np.full(_n, _result._magnitude, dtype=float),
+                           _result._dims)
+
+    def __str__(self):
+        _op, _operands = self._op, self._operands
+        if _op == 'leaf':
+            return _operands[2]
+        if _op == 'var':
+            return _operands[0]
+        if _op == 'pow':
+            _base = _operands[0]
+            return ('{}**{}' if _base._op in ('leaf', 'var') else '({})**{}').format(
+                _base, _operands[1])
+        if _op == 'neg':
+            return '-({})'.format(_operands[0])
+        _left, _right = _operands
+        if _op in ('mul', 'div'):
+            _left = '({})'.format(_left) if _left._op in ('add', 'sub') else _left
+            _right = '({})'.format(_right) if _right._op in (
+                'add', 'sub', 'neg') or (_op == 'div' and _right._op in (
+                    'mul', 'div')) else _right
+        elif _right._op in ('add', 'sub', 'neg'):
+            _right = '({})'.format(_right)
+        return '{}{}{}'.format(_left, _SYMBOLS[_op], _right)
+
+    def __repr__(self):
+        return 'Expression({})'.format(self)
+
+
+def deferred(value):
+    '''
+    Start a deferred expression from a unit, quantity, number or array.
+    Operations applied to the result are recorded rather than computed,
+    see Expression.
+
+    Arguments
+    ---------
+
+    value     (si_unit/combined_units/QuantityArray/number)
+
+    Returns
+    -------
+
+    Expression      the value as a deferred expression
+    '''
+    return Expression._wrap(value)
+
+
+def variable(name, unit=None):
+    '''
+    A named placeholder in a deferred expression, given a value when the
+    expression is evaluated.
+
+    Arguments
+    ---------
+
+    name     (string)                      name of the variable
+
+    unit     (si_unit/combined_units)      unit of plain numbers given for
+                                           the variable, dimensionless if
+                                           not given
+
+    Returns
+    -------
+
+    Expression      the variable as a deferred expression
+    '''
+    _magnitude, _dims = (1, pu.DIMENSIONLESS) if unit is None \
+        else pu._unit_parts(unit)
+    return Expression('var', (name, _magnitude, _dims), frozenset((name,)))
@@ -0,0 +1,73 @@
+from . import phys_units as pu
+
+
+def _unit_suffix(unit):
+    if isinstance(unit, pu.si_unit):
+        return str(unit)
+    return unit._label
+
+
+def _magnitude_str(magnitude, fmt):
+    if fmt:
+        return format(magnitude, fmt)
+    return str(magnitude) if magnitude != 1 else ''
+
+
+def format_many(quantities, unit=None, fmt=''):
+    '''
+    Format many measurements at once, e.g. when writing a report, without
+    creating any intermediate objects. The suffix of each distinct unit
+    and the factor converting to 'unit' are only computed once.
+
+    Arguments
+    ---------
+
+    quantities     (iterable of combined_units,    the measurements
+                    or QuantityArray)
+
+    unit           (combined_units/si_unit)        unit to express the
+                                                   measurements in terms of,
+                                                   by default their own
+
+    fmt            (string)                        format specification of
+                                                   the magnitudes, e.g. '.3e'
+
+    Returns
+    -------
+
+    list of strings      the formatted measurements
+    '''
+    if isinstance(quantities, pu.QuantityArray):
+        if unit is None:
+            if quantities._display:
+                _magnitudes = quantities.get_magnitude()
+                _suffix = quantities._display[0]
+            else:
+                _magnitudes, _suffix = pu._plain_display(quantities._magnitude,
+                                                         quantities._dims)
+        else:
+            _magnitudes = quantities.to(unit)
+            _suffix = _unit_suffix(unit)
+        return [_magnitude_str(x, fmt) + _suffix for x in _magnitudes.tolist()]
+
+    _out = []
+    if unit is None:
+        for quantity in quantities:
+            if quantity._display:
+                _out.append(_magnitude_str(quantity.get_magnitude(), fmt)
+                            + quantity._display[0])
+            else:
+                _magnitude, _suffix = pu._plain_display(quantity._magnitude,
+                                                        quantity._dims)
+                _out.append(_magnitude_str(_magnitude, fmt) + _suffix)
+        return _out
+
+    _unit_magnitude, _unit_dims = pu._unit_parts(unit)
+    _suffix = _unit_suffix(unit)
+    _dims = None
+    for quantity in quantities:
+        if quantity._dims is not _dims:
+            _dims = quantity._dims
+            _factor = pu._conversion_factor(_dims, _unit_dims, _unit_magnitude)
+        _out.append(_magnitude_str(quantity._magnitude / _factor, fmt) + _suffix)
+    return _out
@@ -0,0 +1,260 @@
+from . import phys_units as pu
+
+
+class QuantityIndex(object):
+    '''
+    A sorted index of measurements of the same dimension, each stored
+    with a value such as the number of the record it came from. The
+    measurements are kept as SI magnitudes in a contiguous sorted numpy
+    array, whatever units they were given in, so that range queries and
+    nearest neighbour lookups are binary searches.
+
+    Optional Arguments
+    ------------------
+
+    quantities    (QuantityArray or list of      measurements to index
+                   combined_units)
+
+    values        (array/list)                   the value stored with each
+                                                 measurement, by default the
+                                                 order in which they were
+                                                 inserted (0, 1, 2, ...)
+
+    unit          (si_unit/combined_units)       unit of plain numbers
+                                                 given to the index, by
+                                                 default they are in SI
+                                                 units and the dimension is
+                                                 taken from the first
+                                                 measurements inserted
+
+    Examples
+    --------
+
+    distances = QuantityIndex(parse_array(lines))
+    distances.range(1*km, 3*mile)
+    distances.nearest(2*AU)
+    '''
+
+    def __init__(self, quantities=None, values=None, unit=None):
+        _np = pu._numpy()
+        self._dims = None
+        self._unit_magnitude = 1
+        if unit is not None:
+            self._unit_magnitude, self._dims = pu._unit_parts(unit)
+        self._keys = _np.empty(0, dtype=float)
+        self._values = _np.empty(0, dtype=int)
+        self._inserted = 0
+        if quantities is not None:
+            self.insert(quantities, values)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def _check(self, dims, expected):
+        # The dimensions of the index once measurements of 'dims' are
+        # added to those of 'expected', None while it has none
+        if expected is None or dims == expected:
+            return dims
+        raise Exception(
+            "Cannot Index '{}' With '{}', Do Indices Match?".format(
+                pu._format_dims(dims) or 'dimensionless',
+                pu._format_dims(expected) or 'dimensionless'))
+
+    def _magnitudes(self, quantities, insert=False):
+        # The SI magnitudes of one or many measurements as a flat array,
+        # plain numbers being in the units of the index. Only inserting
+        # measurements sets the dimensions of an empty index, queries
+        # being checked against them once it has any
+        _np = pu._numpy()
+        _dims = self._dims
+        _plain = pu.DIMENSIONLESS if _dims is None else _dims
+        if isinstance(quantities, (pu.QuantityArray, pu.combined_units)):
+            _dims = self._check(quantities._dims, _dims)
+            _magnitudes = _np.ravel(quantities._magnitude).astype(float)
+        elif pu._is_array(quantities) or isinstance(quantities, (int, float)):
+            _dims = self._check(_plain, _dims)
+            _magnitudes = _np.ravel(quantities).astype(float) * self._unit_magnitude
+        else:
+            _magnitudes = []
+            for quantity in quantities:
+                if isinstance(quantity, (int, float)):
+                    _dims = self._check(_plain, _dims)
+                    _magnitudes.append(quantity * self._unit_magnitude)
+                    continue
+                _magnitude, _quantity_dims = pu._unit_parts(quantity)
+                _dims = self._check(_quantity_dims, _dims)
+                _magnitudes.append(_magnitude)
+            _magnitudes = _np.array(_magnitudes, dtype=float)
+        if insert:
+            self._dims = _dims
+        return _magnitudes
+
+    def insert(self, quantities, values=None):
+        '''
+        Add many measurements at once, the new measurements being sorted
+        and then merged into the index in a single pass.
+
+        Arguments
+        ---------
+
+        quantities    (QuantityArray or list of      the measurements
+                       combined_units)
+
+        Optional Arguments
+        ------------------
+
+        values        (array/list)                   the value stored with
+                                                     each measurement
+        '''
+        _np = pu._numpy()
+        _keys = self._magnitudes(quantities, insert=True)
+        if values is None:
+            _values = _np.arange(self._inserted, self._inserted + len(_keys))
+        else:
+            _values = _np.ravel(_np.asarray(values))
+            if len(_values) != len(_keys):
+                raise Exception(
+                    "Expected {} Values But {} Were Given".format(
+                        len(_keys), len(_values)))
+        self._inserted += len(_keys)
+        _order = _np.argsort(_keys)
+        _keys, _values = _keys[_order], _values[_order]
+        if not len(self._keys):
+            self._keys, self._values = _keys, _values
+            return
+        _positions = _np.searchsorted(self._keys, _keys, side='right')
+        if _values.dtype != self._values.dtype:
+            _numeric = _values.dtype.kind in 'biuf' \
+                and self._values.dtype.kind in 'biuf'
+            self._values = self._values.astype(_np.result_type(
+                self._values, _values) if _numeric else object)
+        self._keys = _np.insert(self._keys, _positions, _keys)
+        self._values = _np.insert(self._values, _positions, _values)
+
+    def add(self, quantity, value=None):
+        '''
+        Add a single measurement, see 'insert' for adding many.
+
+        Arguments
+        ---------
+
+        quantity    (combined_units)     the measurement
+
+        Optional Arguments
+        ------------------
+
+        value                            the value stored with it
+        '''
+        self.insert((quantity,), None if value is None else (value,))
+
+    def _key(self, quantity):
+        _magnitude = self._magnitudes((quantity,))
+        return _magnitude[0]
+
+    def range(self, low=None, high=None, inclusive=True):
+        '''
+        The values of the measurements between two bounds, in order of
+        the measurements.
+
+        Optional Arguments
+        ------------------
+
+        low         (combined_units)     the lower bound, None for no bound
+
+        high        (combined_units)     the upper bound, None for no bound
+
+        inclusive   (bool)               whether measurements equal to the
+                                         bounds are included
+
+        Returns
+        -------
+
+        numpy.ndarray       the values
+        '''
+        _np = pu._numpy()
+        _start, _stop = 0, len(self._keys)
+        if low is not None:
+            _start = _np.searchsorted(self._keys, self._key(low),
+                                      side='left' if inclusive else 'right')
+        if high is not None:
+            _stop = _np.searchsorted(self._keys, self._key(high),
+                                     side='right' if inclusive else 'left')
+        return self._values[_start:max(_start, _stop)]
+
+    def count(self, low=None, high=None, inclusive=True):
+        '''
+        The number of measurements between two bounds, see 'range'.
+
+        Returns
+        -------
+
+        int
+        '''
+        return len(self.range(low, high, inclusive))
+
+    def nearest(self, quantity, k=None):
+        '''
+        The value of the measurement nearest to another.
+
+        Arguments
+        ---------
+
+        quantity    (combined_units/QuantityArray)  the measurement, or an
+                                                    array of measurements
+                                                    each looked up at once
+
+        Optional Arguments
+        ------------------
+
+        k           (int)       the number of nearest measurements to find
+                                for a single measurement
+
+        Returns
+        -------
+
+        value/numpy.ndarray     the value of the nearest measurement, the
+                                values of the nearest measurement to each of
+                                an array, or the values of the 'k' nearest
+                                measurements, nearest first
+        '''
+        _np = pu._numpy()
+        _n = len(self._keys)
+        if not _n:
+            raise Exception("Cannot Search an Empty QuantityIndex")
+        if k is not None:
+            _key = self._key(quantity)
+            _position = _np.searchsorted(self._keys, _key)
+            _start, _stop = max(_position - k, 0), min(_position + k, _n)
+            _distances = _np.abs(self._keys[_start:_stop] - _key)
+            return self._values[_start:_stop][
+                _np.argsort(_distances, kind='stable')[:k]]
+        _keys = self._magnitudes(quantity)
+        _positions = _np.clip(_np.searchsorted(self._keys, _keys), 1, _n - 1)
+        if _n == 1:
+            _nearest = _np.zeros(len(_keys), dtype=int)
+        else:
+            _below = self._keys[_positions - 1]
+            _nearest = _positions - (_keys - _below <= self._keys[_positions] - _keys)
+        _result = self._values[_nearest]
+        if isinstance(quantity, pu.QuantityArray) or pu._is_array(quantity):
+            return _result
+        return _result[0].item() if hasattr(_result[0], 'item') else _result[0]
+
+    def quantities(self):
+        '''
+        The measurements in the index, in order.
+
+        Returns
+        -------
+
+        QuantityArray
+        '''
+        return pu._from_si(self._keys.copy(), self._dims or pu.DIMENSIONLESS)
+
+    @property
+    def values(self):
+        '''
+        The values stored with the measurements, in order of the
+        measurements.
+        '''
+        return self._values
@@ -0,0 +1,203 @@
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+
+import units_database as ud
+from . import convert, formatting, parsing
+from . import phys_units as pu
+
+# Instrumentation works by replacing the methods and functions below with
+# timed wrappers when it is enabled and putting the originals back when it
+# is disabled, so that it costs nothing at all while disabled.
+
+_METHODS = ('__mul__', '__rmul__', '__truediv__', '__rtruediv__', '__pow__',
+            'as_unit', 'as_base', 'to', 'clone', '__str__', '__format__')
+_CLASSES = (pu.combined_units, pu.si_unit, pu.phys_float, pu.QuantityArray)
+_FUNCTIONS = {'simplify': ((ud, 'simplify'),),
+              'format_many': ((ud, 'format_many'), (formatting, 'format_many')),
+              'parse': ((ud, 'parse'), (parsing, 'parse'))}
+
+# The functions of units_database are only added to its namespace when
+# first accessed, they must be there to be replaced
+
+for _owners in _FUNCTIONS.values():
+    for _owner, _attribute in _owners:
+        getattr(_owner, _attribute)
+
+# The caches built with functools.lru_cache, and the dictionaries used as
+# caches by the functions which look in them, with the key of the argument
+
+_LRU_CACHES = {'parse_unit': (parsing, '_parse_unit'),
+               'convert_factor': (convert, '_factor')}
+_DICT_CACHES = {'simplify': ((ud, 'simplify'), lambda x: x._dims,
+                             ud._simplify_cache),
+                'unit_suffix': ((pu, '_format_dims'), lambda x: x, pu._SUFFIXES)}
+
+_calls = {}
+_probes = {}
+_baseline = {}
+_patched = []
+_depth = 0
+
+
+def _timed(name, function):
+    _stats = _calls.setdefault(name, [0, 0.])
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        _start = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _stats[0] += 1
+            _stats[1] += perf_counter() - _start
+
+    return wrapper
+
+
+def _probed(name, function, key, cache):
+    _stats = _probes.setdefault(name, [0, 0])
+
+    @wraps(function)
+    def wrapper(first, *args, **kwargs):
+        _stats[0 if key(first) in cache else 1] += 1
+        return function(first, *args, **kwargs)
+
+    return wrapper
+
+
+def _patch(owner, name, wrapper):
+    _patched.append((owner, name, owner.__dict__[name]))
+    setattr(owner, name, wrapper)
+
+
+def enable():
+    '''
+    Start counting and timing calls to the operations of units_database,
+    and the use of its caches. Only the functions called through the
+    units_database module are counted, not those imported from it
+    beforehand.
+    '''
+    global _depth
+    _depth += 1
+    if _patched:
+        return
+    for cls in _CLASSES:
+        for method in _METHODS:
+            if method in cls.__dict__:
+                _patch(cls, method, _timed('{}.{}'.format(cls.__name__, method),
+                                           cls.__dict__[method]))
+    _probe_wrappers = {}
+    for name, ((owner, attribute), key, cache) in _DICT_CACHES.items():
+        _probe_wrappers[owner, attribute] = _probed(
+            name, owner.__dict__[attribute], key, cache)
+    for name, owners in _FUNCTIONS.items():
+        _owner, _attribute = owners[0]
+        _function = _probe_wrappers.pop(owners[0], _owner.__dict__[_attribute])
+        _wrapper = _timed(name, _function)
+        for owner, attribute in owners:
+            _patch(owner, attribute, _wrapper)
+    for (owner, attribute), wrapper in _probe_wrappers.items():
+        _patch(owner, attribute, wrapper)
+    _mark_lru_caches()
+
+
+def disable():
+    '''
+    Stop counting calls, restoring the uninstrumented operations. The
+    counts so far are kept until 'reset' is called.
+    '''
+    global _depth
+    _depth = max(_depth - 1, 0)
+    if _depth:
+        return
+    _snapshot_lru_caches()
+    while _patched:
+        owner, name, original = _patched.pop()
+        setattr(owner, name, original)
+
+
+def _lru_info(name):
+    owner, attribute = _LRU_CACHES[name]
+    return getattr(owner, attribute).cache_info()
+
+
+def _mark_lru_caches():
+    for name in _LRU_CACHES:
+        _info = _lru_info(name)
+        _counts = _probes.setdefault(name, [0, 0])
+        _baseline[name] = (_info.hits - _counts[0], _info.misses - _counts[1])
+
+
+def _snapshot_lru_caches():
+    if not _patched:
+        return
+    for name in _LRU_CACHES:
+        _info = _lru_info(name)
+        _hits, _misses = _baseline[name]
+        _probes[name] = [_info.hits - _hits, _info.misses - _misses]
+
+
+def reset():
+    '''
+    Set all of the counts back to zero.
+    '''
+    for stats in list(_calls.values()) + list(_probes.values()):
+        stats[0] = stats[1] = 0
+    if _patched:
+        _mark_lru_caches()
+
+
+def snapshot():
+    '''
+    The counts since instrumentation was first enabled, or since 'reset'.
+
+    Returns
+    -------
+
+    dict       'calls' maps each operation to a dictionary of its 'count',
+               'total' time and 'mean' time in seconds, 'caches' maps each
+               cache to a dictionary of its 'hits', 'misses' and 'hit_rate'
+    '''
+    _snapshot_lru_caches()
+    _result = {'calls': {}, 'caches': {}}
+    for name, (count, total) in sorted(_calls.items()):
+        if count:
+            _result['calls'][name] = {'count': count, 'total': total,
+                                      'mean': total / count}
+    for name, (hits, misses) in sorted(_probes.items()):
+        _result['caches'][name] = {
+            'hits': hits, 'misses': misses,
+            'hit_rate': hits / (hits + misses) if hits + misses else None}
+    return _result
+
+
+@contextmanager
+def instrumented(reset_counts=True):
+    '''
+    Context manager counting the operations of units_database within it,
+    e.g.
+
+    with instrumented() as stats:
+        run_simulation()
+    print(stats['calls']['combined_units.__mul__']['count'])
+
+    Optional Arguments
+    ------------------
+
+    reset_counts     (bool)      start the counts from zero
+
+    Returns
+    -------
+
+    dict       filled with the 'snapshot' of the counts on leaving the context
+    '''
+    if reset_counts:
+        reset()
+    _stats = {}
+    enable()
+    try:
+        yield _stats
+    finally:
+        _stats.update(snapshot())
+        disable()
@@ -0,0 +1,104 @@
+import os
+from collections import deque
+from itertools import islice
+
+from . import phys_units as pu
+from .wire import from_wire, to_wire
+
+_QUANTITIES = (pu.combined_units, pu.QuantityArray)
+
+
+def _encode(value):
+    # Quantities are sent between processes in the wire format, which is
+    # a fraction of the size of their pickled form.
+    if isinstance(value, _QUANTITIES):
+        return _Wire(to_wire(value))
+    return value
+
+
+def _decode(value):
+    if isinstance(value, _Wire):
+        return from_wire(value.data)
+    return value
+
+
+class _Wire(object):
+    __slots__ = ('data',)
+
+    def __init__(self, data):
+        self.data = data
+
+    def __reduce__(self):
+        return (_Wire, (self.data,))
+
+
+def _run_chunk(function, chunk):
+    return [_encode(function(*[_decode(x) for x in args])) for args in chunk]
+
+
+def _chunks(iterables, chunksize):
+    _chunk = []
+    for args in zip(*iterables):
+        _chunk.append(tuple(_encode(x) for x in args))
+        if len(_chunk) == chunksize:
+            yield _chunk
+            _chunk = []
+    if _chunk:
+        yield _chunk
+
+
+def parallel_map(function, *iterables, workers=None, chunksize=64,
+                 executor=None, pending=None):
+    '''
+    Apply a function to measurements in several processes at once, the
+    equivalent of 'map(function, *iterables)'. Measurements are sent to
+    and from the worker processes in the compact wire format (see
+    'to_wire'), so arrive without their unit labels.
+
+    Arguments
+    ---------
+
+    function     (callable)      function to apply, must be importable by
+                                 the worker processes (i.e. not a lambda)
+
+    *iterables   (iterables)     the arguments of each call
+
+    Optional Arguments
+    ------------------
+
+    workers      (int)           number of processes, by default the
+                                 number of CPUs
+
+    chunksize    (int)           number of calls sent to a process at once
+
+    executor     (Executor)      an existing executor to use instead of
+                                 starting a new ProcessPoolExecutor
+
+    pending      (int)           most chunks sent to the processes and not
+                                 yet returned, by default twice 'workers',
+                                 so that only these are held in memory
+
+    Returns
+    -------
+
+    generator       the results, in the order of the arguments
+    '''
+    if pending is None:
+        pending = 2 * (workers or os.cpu_count() or 1)
+    if executor is None:
+        # Starting the processes needs multiprocessing, which is only
+        # imported here as it is slow to import
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(workers) as executor:
+            yield from parallel_map(function, *iterables, chunksize=chunksize,
+                                    executor=executor, pending=pending)
+        return
+    _chunks_left = _chunks(iterables, chunksize)
+    _futures = deque(executor.submit(_run_chunk, function, chunk)
+                     for chunk in islice(_chunks_left, pending))
+    while _futures:
+        _results = _futures.popleft().result()
+        for chunk in islice(_chunks_left, 1):
+            _futures.append(executor.submit(_run_chunk, function, chunk))
+        for result in _results:
+            yield _decode(result)
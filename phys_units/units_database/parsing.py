@@ -0,0 +1,167 @@
+import re
+from functools import lru_cache
+
+import units_database as ud
+from . import phys_units as pu
+from .prefixes import prefixed_unit
+
+_NUMBER = re.compile(r'\s*([+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)?\s*')
+_TOKEN = re.compile(r'([./*]?)([^./*^\s]+)(?:\^([+-]?\d+(?:\.\d+)?))?')
+
+_symbols = {}
+
+
+def _add_symbols(units):
+    # Labels (e.g. 'Å', 'miles') take precedence over the python names
+    # (e.g. 'angstrom', 'mile'), where two share a symbol the first one
+    # defined in units_database is used.
+    _units = [(name, unit) for name, unit in units
+              if isinstance(unit, (pu.si_unit, pu.combined_units))
+              and not isinstance(unit, pu.phys_float)]
+    for _, unit in _units:
+        _label = unit._unit_string if isinstance(unit, pu.si_unit) else unit._label
+        if _label:
+            _symbols.setdefault(_label, unit)
+    for name, unit in _units:
+        if name:
+            _symbols.setdefault(name, unit)
+
+
+def _symbol_table():
+    # The symbols of the units come before those of the physical
+    # constants, so that e.g. 'h' is the hour and not the Planck constant.
+    if not _symbols:
+        _add_symbols([(name, getattr(ud, name)) for name in ud._unit_names
+                      if name not in ud._constant_names]
+                     + [(None, unit) for unit in ud.all_cunits])
+        _add_symbols([(name, getattr(ud, name)) for name in ud._constant_names])
+    return _symbols
+
+
+def clear_parse_cache():
+    '''
+    Empty the table of unit symbols and the cache of parsed unit
+    expressions, should be called if units are added to units_database.
+    '''
+    _symbols.clear()
+    _parse_unit.cache_clear()
+
+
+@lru_cache(maxsize=1024)
+def _parse_unit(unit_str):
+    _units = _symbol_table()
+    _result = None
+    _position = 0
+    for match in _TOKEN.finditer(unit_str):
+        _separator, _symbol, _exponent = match.groups()
+        _valid = _separator in ('.', '*', '/') if _position else _separator in ('', '/')
+        if match.start() != _position or not _valid:
+            break
+        _position = match.end()
+        _unit = _units.get(_symbol)
+        if _unit is None:
+            _unit = prefixed_unit(_symbol)
+            if _unit is None:
+                raise ValueError("Unknown Unit '{}' in '{}'".format(_symbol, unit_str))
+        _power = float(_exponent) if _exponent and '.' in _exponent \
+            else int(_exponent) if _exponent else 1
+        if _separator == '/':
+            _power *= -1
+        if _power != 1 or _result is not None:
+            _unit = _unit**_power
+        elif isinstance(_unit, pu.si_unit):
+            _unit = pu.combined_units((_unit,), (1,))
+        _result = _unit if _result is None else _result * _unit
+    if _position != len(unit_str):
+        raise ValueError("Could not Parse Unit Expression '{}'".format(unit_str))
+    return _result
+
+
+def _split(quantity_str):
+    _match = _NUMBER.match(quantity_str)
+    _value, _unit_str = _match.group(1), quantity_str[_match.end():].rstrip()
+    if _value is None:
+        _value = 1
+    elif '.' in _value or 'e' in _value or 'E' in _value:
+        _value = float(_value)
+    else:
+        _value = int(_value)
+    return _value, _unit_str
+
+
+def parse(quantity_str):
+    '''
+    Read a measurement from its string representation, e.g. '5.2 km.h^-1',
+    '3e8m.s^-1' or 'kg.m.s^-2'. Unit symbols are the labels used by the
+    units_database module (e.g. 'Å', 'M_ʘ', 'Ω') or the python names of the
+    units. Physical constants are only used where no unit has the same
+    symbol, e.g. 'h' is the hour. Each distinct unit expression is only
+    parsed once.
+
+    Arguments
+    ---------
+
+    quantity_str     (string)     the measurement to read
+
+    Returns
+    -------
+
+    combined_units      the measurement
+    '''
+    _value, _unit_str = _split(quantity_str)
+    if not _unit_str:
+        tmp = pu.combined_units()
+        tmp._magnitude = _value
+        return tmp
+    _unit = _parse_unit(_unit_str)
+    return _unit._derive(_unit._magnitude * _value, _unit._dims)
+
+
+def parse_many(quantity_strs):
+    '''
+    Read measurements from an iterable of strings, see 'parse'.
+
+    Arguments
+    ---------
+
+    quantity_strs     (iterable of strings)     the measurements to read
+
+    Returns
+    -------
+
+    generator of combined_units      the measurements
+    '''
+    for quantity_str in quantity_strs:
+        yield parse(quantity_str)
+
+
+def parse_array(quantity_strs):
+    '''
+    Read measurements of the same dimension from an iterable of strings
+    into a single QuantityArray, see 'parse'. The measurements may be in
+    different units, e.g. ['5 km', '3 miles'].
+
+    Arguments
+    ---------
+
+    quantity_strs     (iterable of strings)     the measurements to read
+
+    Returns
+    -------
+
+    QuantityArray      the measurements
+    '''
+    _magnitudes = []
+    _first = pu.combined_units()
+    for quantity_str in quantity_strs:
+        _value, _unit_str = _split(quantity_str)
+        _unit = _parse_unit(_unit_str) if _unit_str else pu.combined_units()
+        if not _magnitudes:
+            _first = _unit
+        elif _unit._dims != _first._dims:
+            raise Exception(
+                "Cannot Combine '{}' and '{}' in a QuantityArray, Do Indices Match?".format(
+                    _unit_str, pu._format_dims(_first._dims)))
+        _magnitudes.append(_value * _unit._magnitude)
+    _template = pu.QuantityArray([], _first)
+    return _template._new(pu._numpy().asarray(_magnitudes, dtype=float), _first._dims)
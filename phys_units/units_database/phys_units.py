@@ -1,7 +1,186 @@
 import math
+import sys
+from operator import add, sub
 
 import units_database as ud
 
+# numpy is only needed for QuantityArray, it is imported on first use by
+# '_numpy' to keep importing units_database cheap.
+np = None
+
+# The base SI units, every unit is stored as a fixed length tuple of
+# exponents of these in this order.
+BASE_UNITS = ('A', 's', 'kg', 'm', 'rad', 'sr', 'K', 'mol', 'cd')
+
+_BASE_INDEX = {label: i for i, label in enumerate(BASE_UNITS)}
+_DISPLAY_ORDER = sorted(range(len(BASE_UNITS)), key=lambda i: BASE_UNITS[i])
+_DIMENSIONS = {}
+
+
+def _dimension(exponents):
+    '''
+    Return the interned exponent tuple for a set of exponents, so that
+    equal dimensions are also the same object.
+    '''
+    exponents = tuple(exponents)
+    try:
+        return _DIMENSIONS[exponents]
+    except KeyError:
+        exponents = tuple(int(x) if x == int(x) else x for x in exponents)
+        return _DIMENSIONS.setdefault(exponents, exponents)
+
+
+DIMENSIONLESS = _dimension((0,) * len(BASE_UNITS))
+
+
+def _base_dimension(unit_str):
+    if unit_str not in _BASE_INDEX:
+        return None
+    _exponents = [0] * len(BASE_UNITS)
+    _exponents[_BASE_INDEX[unit_str]] = 1
+    return _dimension(_exponents)
+
+
+def _dim_mul(first, second):
+    return _dimension(map(add, first, second))
+
+
+def _dim_div(first, second):
+    return _dimension(map(sub, first, second))
+
+
+def _dim_pow(dims, power):
+    return _dimension([x * power for x in dims])
+
+
+def _dims_from_labels(labels, exponents):
+    _exponents = [0] * len(BASE_UNITS)
+    for label, exponent in zip(labels, exponents):
+        _exponents[_BASE_INDEX[label]] += exponent
+    return _dimension(_exponents)
+
+
+def _dims_of(unit):
+    if isinstance(unit, (combined_units, QuantityArray)):
+        return unit._dims
+    elif isinstance(unit, si_unit):
+        if unit._dims is None:
+            raise Exception(
+                "Unit '{}' Is Not One of the Base SI Units".format(unit._unit_string))
+        return unit._dims
+    return None
+
+
+_SUFFIXES = {}
+
+
+def _format_dims(dims):
+    # The unit suffix of a dimension, e.g. 'kg.m.s^-2', built only once
+    # for each distinct dimension.
+    try:
+        return _SUFFIXES[dims]
+    except KeyError:
+        pass
+    _out_str = ''
+    for i in _DISPLAY_ORDER:
+        if dims[i] != 0:
+            _out_str += '{}{}.'.format(BASE_UNITS[i], '^{}'.format(
+                dims[i]) if dims[i] != 1 else '')
+    _SUFFIXES[dims] = _out_str[:-1]
+    return _out_str[:-1]
+
+
+def _numpy():
+    global np
+    if np is None:
+        import numpy as np
+    return np
+
+
+def _is_array(obj):
+    _np = np or sys.modules.get('numpy')
+    return _np is not None and isinstance(obj, _np.ndarray)
+
+
+def _is_numpy_scalar(obj):
+    # NumPy scalars such as numpy.int64 are used as the equivalent python
+    # number, e.g. the elements of an integer array
+    _np = np or sys.modules.get('numpy')
+    return _np is not None and isinstance(obj, _np.generic)
+
+
+# The unit system in which quantities without display units of their own
+# are shown, None for SI units (see systems.py)
+
+_system = None
+
+
+def _plain_display(magnitude, dims):
+    # The magnitude and suffix of a quantity with no display unit of its
+    # own, in the units of the active unit system
+    if _system is None:
+        return magnitude, _format_dims(dims)
+    return _system._convert(magnitude, dims)
+
+
+def _defers(other):
+    # Whether an operation with 'other' is left to its reflected method,
+    # for operands such as the measurements with uncertainties which
+    # handle the quantities of units_database themselves
+    return getattr(other, '_defers_units', False)
+
+
+def _conversion_factor(source_dims, target_dims, target_magnitude):
+    # The SI magnitude of one target unit, after checking the dimensions
+    # match, the interned dimensions of matching units usually being the
+    # same object.
+    if source_dims is not target_dims and source_dims != target_dims:
+        raise Exception(
+            "Cannot Convert Between Units '{}' and '{}', Do Indices Match?".format(
+                _format_dims(source_dims), _format_dims(target_dims)))
+    return target_magnitude
+
+
+# The ufuncs which a single quantity applies to a numpy array through its
+# own operators, with the operator used when the quantity is the second
+# operand, e.g. numpy.array([1, 2])*m as m.__rmul__, which gives a
+# QuantityArray
+
+_SCALAR_OPERATORS = {
+    'multiply': ('__mul__', '__rmul__'),
+    'true_divide': ('__truediv__', '__rtruediv__'),
+    'divide': ('__truediv__', '__rtruediv__'),
+    'add': ('__add__', '__radd__'),
+    'subtract': ('__sub__', '__rsub__'),
+    'power': ('__pow__', None),
+    'equal': ('__eq__', '__eq__'),
+    'not_equal': ('__ne__', '__ne__'),
+    'less': ('__lt__', '__gt__'),
+    'less_equal': ('__le__', '__ge__'),
+    'greater': ('__gt__', '__lt__'),
+    'greater_equal': ('__ge__', '__le__')}
+
+
+def _scalar_array_ufunc(self, ufunc, method, *inputs, **kwargs):
+    # The __array_ufunc__ of combined_units and si_unit. Any QuantityArray
+    # operand handles the ufunc itself, using the magnitude of the single
+    # quantity, e.g. numpy.maximum(distances, 2*km), otherwise operators
+    # with a numpy array are left to those of the quantity
+    if any(isinstance(x, QuantityArray) for x in inputs):
+        return NotImplemented
+    if method != '__call__' or kwargs or len(inputs) != 2 \
+            or ufunc.__name__ not in _SCALAR_OPERATORS:
+        return NotImplemented
+    _operator, _reflected = _SCALAR_OPERATORS[ufunc.__name__]
+    if inputs[0] is self:
+        _method, _other = getattr(self, _operator, None), inputs[1]
+    else:
+        _method, _other = getattr(self, _reflected or '', None), inputs[0]
+    _result = NotImplemented if _method is None else _method(_other)
+    if _result is NotImplemented and ufunc.__name__ in ('equal', 'not_equal'):
+        return ufunc.__name__ == 'not_equal'
+    return _result
+
 
 class combined_units(object):
     '''
@@ -50,19 +229,48 @@ class combined_units(object):
     R_N = kg.clone('R_N', 3.42, '')
     '''
 
+    __slots__ = ('_dims', '_display', '_const', '_magnitude', '_desc',
+                 '_label', '_other_label')
+
+    __array_ufunc__ = _scalar_array_ufunc
+
     def __init__(self, components=[], power_ratio=[], desc='', label='',
                  other_label='', const=None):
-        self._components = {}
+        self._dims = DIMENSIONLESS
+        self._display = None
         self._const = const if const else 1
-        self._magnitude = phys_float(const) if const else phys_float(1)
+        self._magnitude = const if const else 1
         self._desc = desc if desc else 'Quantity Has No Known Label'
         self._label = label
         self._other_label = other_label
         for component, exponent in zip(tuple(components), tuple(power_ratio)):
             if isinstance(component, phys_float):
-                self._magnitude *= component
+                self._magnitude *= component._magnitude
+            elif isinstance(component, combined_units):
+                self._magnitude *= component._magnitude**exponent
+                self._dims = _dim_mul(
+                    self._dims, _dim_pow(component._dims, exponent))
             else:
-                self._components[component] = exponent
+                self._dims = _dim_mul(
+                    self._dims, _dim_pow(_dims_of(component), exponent))
+
+    def _derive(self, magnitude, dims):
+        # Equivalent to 'self.clone()' followed by replacing the magnitude
+        # and dimensions, without the intermediate objects.
+        tmp = combined_units.__new__(combined_units)
+        tmp._dims = dims
+        tmp._display = None
+        tmp._const = self._const
+        tmp._magnitude = magnitude
+        tmp._desc = self._desc
+        tmp._label = self._label
+        tmp._other_label = self._other_label
+        return tmp
+
+    def _copy(self):
+        tmp = self._derive(self._magnitude, self._dims)
+        tmp._display = self._display
+        return tmp
 
     def as_base(self):
         '''
@@ -75,25 +283,12 @@ class combined_units(object):
         combined_units           A combined unit with the component being just
                                  the self. E.g. 5miles instead of 8046.72m
         '''
-        _unit = si_unit(self._label, "<Unit('{}'), {}, {}>".format(self._label,
-                                                                   self._other_label, self._desc), self._desc)
-        _comb_unit = combined_units(components=[_unit], power_ratio=[1],
-                                    const=self._const)
-        _comb_unit._magnitude = self._magnitude / self._const
+        _comb_unit = combined_units(const=self._const)
+        _comb_unit._dims = self._dims
+        _comb_unit._magnitude = self._magnitude
+        _comb_unit._display = (self._label, self._const)
         return _comb_unit
 
-    def __sin__(self):
-        return phys_float(math.sin(self.get_magnitude()))
-
-    def __cos__(self):
-        return phys_float(math.cos(self.get_magnitude()))
-
-    def _get_key(self, unit_str):
-        for key in self._components:
-            if key._unit_string == unit_str:
-                return key
-        return None
-
     def get_magnitude(self):
         '''
         The magnitude of the measurement.
@@ -103,7 +298,9 @@ class combined_units(object):
 
         float     the magnitude of the measure (e.g. 5 for 5miles)
         '''
-        return self._magnitude._magnitude
+        if self._display and self._display[1] != 1:
+            return self._magnitude / self._display[1]
+        return self._magnitude
 
     def __eq__(self, other):
         if isinstance(other, int) or isinstance(other, float):
@@ -136,44 +333,38 @@ class combined_units(object):
         '''
 
         if isinstance(other, tuple):
-            _labels_self = [i._unit_string for i in self._components.keys()]
-            _unit_strs = [j._unit_string for j in self._components.keys()]
-            _comp = sorted(_unit_strs) == sorted(other[0])
-            _indices = [
-                self._components[_labels_self.index(i)] for i in other[0]]
-            _index_comp = _indices == other[1]
-        elif isinstance(other, combined_units):
-            _labels_other = [i._unit_string for i in other._components.keys()]
-            _comp = sorted([j._unit_string for j in self._components.keys()]) == sorted(
-                [k._unit_string for k in other._components.keys()])
-            _index_comp = all([self._components[i] == other._components[i]
-                               for i in self._components.keys()])
-        elif isinstance(other, si_unit):
-            _single_unit = len(self._components.keys()) == 1
-            _same_unit = list(self._components.keys())[0] == other
-            return _single_unit and _same_unit
+            return self._dims == _dims_from_labels(other[0], other[1])
+        elif isinstance(other, (combined_units, si_unit)):
+            return self._dims == _dims_of(other)
         else:
             print("Shound not get here!")
             raise AssertionError
-        return _comp and _index_comp
 
     def __mul__(self, other):
-        tmp = self.clone()
-        if issubclass(combined_units, other.__class__):
-            tmp._magnitude = self._magnitude * other._magnitude
-            for unit in other._components:
-                if unit not in tmp._components:
-                    tmp._components[unit] = 0
-                tmp._components[unit] += other._components[unit]
+        if isinstance(other, QuantityArray):
+            return other.__rmul__(self)
+
+        if _is_array(other):
+            return QuantityArray(other, self)
+
+        if isinstance(other, combined_units):
+            tmp = self._derive(self._magnitude * other._magnitude,
+                               _dim_mul(self._dims, other._dims))
 
         elif isinstance(si_unit, other.__class__) or issubclass(si_unit, other.__class__):
             return other.__mul__(self)
 
         elif isinstance(other, float) or isinstance(other, int):
-            tmp._magnitude = self._magnitude * other
+            tmp = self._derive(self._magnitude * other, self._dims)
 
         elif isinstance(other, phys_float):
-            tmp._magnitude = self._magnitude * other._magnitude
+            tmp = self._derive(self._magnitude * other._magnitude, self._dims)
+
+        elif _is_numpy_scalar(other):
+            return self.__mul__(other.item())
+
+        elif _defers(other):
+            return NotImplemented
 
         else:
             raise Exception(
@@ -190,17 +381,16 @@ class combined_units(object):
     def __pow__(self, other):
         tmp = combined_units()
         if isinstance(other, float) or isinstance(other, int):
-            for unit in self._components:
-                tmp._components[unit] = self._components[unit] * other
+            tmp._dims = _dim_pow(self._dims, other)
             tmp._magnitude = pow(self._magnitude, other)
 
         elif isinstance(other, phys_float):
-            tmp._magnitude = self._magnitude
-            for unit in self._components:
-                tmp._components[unit] = self._components[unit] * \
-                    other._magnitude
+            tmp._dims = _dim_pow(self._dims, other._magnitude)
             tmp._magnitude = self._magnitude**other._magnitude
 
+        elif _is_numpy_scalar(other):
+            return self.__pow__(other.item())
+
         else:
             raise Exception(
                 "Could not Apply Exponent of Type '{}' to Combined Units Object".format(type(other)))
@@ -221,79 +411,113 @@ class combined_units(object):
 
         bool           compatible/not
         '''
-        if isinstance(other, si_unit):
-            if len(self._components) == 1:
-                for key in self._components:
-                    return self._components[key] == si_unit
-
-        if isinstance(other, combined_units):
-            if set(self._components.keys()) == set(other._components.keys()):
-                for key in self._components:
-                    if self._components[key] != other._components[key]:
-                        return False
-                return True
+        if isinstance(other, (combined_units, si_unit, QuantityArray)):
+            return self._dims is other._dims or self._dims == other._dims
         return False
 
     def _compare_two(self, other):
-        if set(self._components.keys()) == set(other._components.keys()
-                                               ) and math.isclose(self.get_magnitude(), other.get_magnitude()):
-            for key in self._components:
-                if self._components[key] != other._components[key]:
-                    return False
-            return True
-        return False
+        return self.check_dimensionality(other) and math.isclose(
+            self._magnitude, _unit_parts(other)[0])
+
+    def _ordering_magnitude(self, other):
+        # The SI magnitude of 'other' when ordering it against self, which
+        # must have the same dimension unless it is zero
+        if isinstance(other, (int, float)) and other == 0:
+            return other
+        _magnitude, _dims = _unit_parts(other)
+        if _dims != self._dims:
+            raise Exception(
+                "Cannot Compare Unit Combination Objects, Do Indices Match?")
+        return _magnitude
+
+    def __lt__(self, other):
+        if _defers(other):
+            return NotImplemented
+        return self._magnitude < self._ordering_magnitude(other)
+
+    def __le__(self, other):
+        if _defers(other):
+            return NotImplemented
+        return self._magnitude <= self._ordering_magnitude(other)
+
+    def __gt__(self, other):
+        if _defers(other):
+            return NotImplemented
+        return self._magnitude > self._ordering_magnitude(other)
+
+    def __ge__(self, other):
+        if _defers(other):
+            return NotImplemented
+        return self._magnitude >= self._ordering_magnitude(other)
 
     def __add__(self, other):
-        tmp = self.clone()
+        if isinstance(other, QuantityArray):
+            return other.__radd__(self)
+
         try:
             assert self.check_dimensionality(other)
         except BaseException:
+            if _defers(other):
+                return NotImplemented
             raise Exception(
                 "Cannot Add Unit Combination Objects, Do Indices Match?")
-        tmp._magnitude = phys_float(
-            self._magnitude._magnitude + other._magnitude._magnitude)
-        return tmp
+        return self._derive(self._magnitude + _unit_parts(other)[0], self._dims)
 
     def __sub__(self, other):
-        tmp = self.clone()
+        if isinstance(other, QuantityArray):
+            return other.__rsub__(self)
+
         try:
             if other == 0:
-                return self
+                return self._copy()
             assert self.check_dimensionality(other)
         except BaseException:
+            if _defers(other):
+                return NotImplemented
             raise Exception(
                 "Cannot Subtract Unit Combination Objects, Do Indices Match?")
-        tmp._magnitude = phys_float(
-            self._magnitude._magnitude - other._magnitude._magnitude)
-        return tmp
+        return self._derive(self._magnitude - _unit_parts(other)[0], self._dims)
+
+    def __radd__(self, other):
+        # Allows the use of sum(), which starts from 0
+        if isinstance(other, (int, float)) and other == 0:
+            return self._copy()
+        return self.__add__(other)
+
+    # There are no in-place operators, so that like numbers a measurement
+    # is never modified once created and 'x += y' gives a new object.
 
     def __truediv__(self, other):
-        tmp = self.clone()
-        if issubclass(combined_units, other.__class__):
-            tmp._magnitude = self._magnitude / other._magnitude
-            for unit in other._components:
-                if unit not in tmp._components:
-                    tmp._components[unit] = 0
-                tmp._components[unit] -= other._components[unit]
+        if isinstance(other, QuantityArray):
+            return other.__rtruediv__(self)
+
+        if _is_array(other):
+            return QuantityArray(1 / other, self)
+
+        if isinstance(other, combined_units):
+            return self._derive(self._magnitude / other._magnitude,
+                                _dim_div(self._dims, other._dims))
 
         elif issubclass(si_unit, other.__class__):
-            tmp._magnitude = self._magnitude
-            if other not in tmp._components.keys():
-                tmp._components[other] = 0
-            tmp._components[other] -= 1
+            return self._derive(self._magnitude,
+                                _dim_div(self._dims, _dims_of(other)))
 
         elif isinstance(other, si_unit):
-            tmp._magnitude = self._magnitude / other._magnitude
+            return self._derive(self._magnitude / other._magnitude, self._dims)
 
         elif isinstance(other, float) or isinstance(other, int):
-            tmp._magnitude = self._magnitude / other
+            return self._derive(self._magnitude / other, self._dims)
+
+        elif _is_numpy_scalar(other):
+            return self.__truediv__(other.item())
+
+        elif _defers(other):
+            return NotImplemented
 
         else:
             raise Exception(
                 "Invalid Division '{}/{}'".format(type(self), type(other)))
 
-        return tmp
-
     def __rtruediv__(self, other):
         tmp = self.__pow__(-1)
         return tmp * other
@@ -312,39 +536,63 @@ class combined_units(object):
 
         string       string representation of result
         '''
-        
+
         assert self.has_units(unit), "Incompatible unit types"
-        _tmp = unit
         if isinstance(unit, si_unit):
-            return (self.get_magnitude() * unit).__str__()
+            return (self._magnitude * unit).__str__()
         else:
-            magnitude = self._magnitude / unit._magnitude
-            _base = _tmp.as_base()
-            _base._magnitude = phys_float(1)
-            return '{}{}'.format(magnitude, _base)
+            return '{}{}'.format(self.to(unit), unit._label)
+
+    def to(self, unit):
+        '''
+        The magnitude of the measurement in terms of another unit.
+
+        Arguments
+        ---------
+
+        unit  (combined_units/si_unit)        unit to express self in terms of
+
+        Returns
+        -------
+
+        float        the magnitude in terms of 'unit' (e.g. 5 for 8046.72m
+                     in miles)
+        '''
+        _magnitude, _dims = _unit_parts(unit)
+        return self._magnitude / _conversion_factor(self._dims, _dims, _magnitude)
 
     def __str__(self):
         '''
         Return a string representation of the combined_units object
         '''
-        _out_str = ''
-        _sorted_units = sorted([x._unit_string for x in self._components])
-        _sorted_keys = [self._get_key(x) for x in _sorted_units]
-        for key, label in zip(_sorted_keys, _sorted_units):
-            _out_str += '{}{}.'.format(label if self._components[key] != 0 else '', '^{}'.format(
-                self._components[key]) if self._components[key] not in [1, 0] else '')
-        _out_str = '{}'.format(self._magnitude.__str__() if float(
-            self._magnitude.__str__()) != 1. else '') + _out_str[:-1]
-        if _out_str[-1] == '.':
-            _out_str = _out_str[:-1]
-        return _out_str
+        if self._display:
+            _magnitude, _suffix = self.get_magnitude(), self._display[0]
+        else:
+            _magnitude, _suffix = _plain_display(self._magnitude, self._dims)
+        if not _suffix:
+            return str(_magnitude) if _magnitude != 1 else '1'
+        return '{}{}'.format(_magnitude if _magnitude != 1 else '', _suffix)
+
+    def __format__(self, format_spec):
+        '''
+        Return a string representation of the combined_units object with
+        the magnitude formatted according to 'format_spec', e.g.
+        '{:.3e}'.format(x)
+        '''
+        if not format_spec:
+            return self.__str__()
+        if self._display:
+            return format(self.get_magnitude(), format_spec) + self._display[0]
+        _magnitude, _suffix = _plain_display(self._magnitude, self._dims)
+        return format(_magnitude, format_spec) + _suffix
 
     def __repr__(self):
+        _indices = [i for i in _DISPLAY_ORDER if self._dims[i] != 0]
         return "<{}*UnitsCombination('{}'), [{}]{}>".format(self._magnitude,
                                                             ','.join(
-                                                                [x._unit_string for x in self._components.keys()]),
+                                                                [BASE_UNITS[i] for i in _indices]),
                                                             ','.join(
-                                                                [str(val) for val in self._components.values()]),
+                                                                [str(self._dims[i]) for i in _indices]),
                                                             ', "{}"'.format(self._desc) if self._desc != '' else '')
 
     def measures(self):
@@ -371,7 +619,7 @@ class combined_units(object):
 
         const       (float)         the constant associated with the unit
                                     (e.g. number of nm in a km)
-        
+
         desc        (float)         description of what the unit measures
 
         other_label (string)        the word name for the unit (e.g. kilometre)
@@ -388,31 +636,180 @@ class combined_units(object):
         tmp = combined_units(desc=desc, other_label=other_label)
         tmp._label = label
         tmp._const = const
-        tmp._magnitude = self._magnitude * phys_float(const)
-        for unit in self._components:
-            tmp._components[unit] = self._components[unit]
+        tmp._magnitude = self._magnitude * const
+        tmp._dims = self._dims
         return tmp
 
+    def freeze(self):
+        '''
+        An immutable copy of the measurement which can be hashed, and so
+        used as a dictionary key, in a set or as an argument of a function
+        memoized with functools.lru_cache.
+
+        Returns
+        -------
+
+        frozen_units       the frozen measurement
+        '''
+        return _frozen(self._magnitude, self._dims, self._display, self._const,
+                       self._desc, self._label, self._other_label)
+
+    def __reduce__(self):
+        return (_unpickled, (self._magnitude, self._dims, self._display,
+                             self._const, self._desc, self._label,
+                             self._other_label))
+
+
+# Unpickling interns the dimensions of quantities, and returns the units of
+# units_database themselves rather than copies of them, so that quantities
+# sent to and from other processes behave as those created locally.
+
+def _unpickled(magnitude, dims, display, const, desc, label, other_label):
+    tmp = combined_units.__new__(combined_units)
+    tmp._magnitude = magnitude
+    tmp._dims = _dimension(dims)
+    tmp._display = display
+    tmp._const = const
+    tmp._desc = desc
+    tmp._label = label
+    tmp._other_label = other_label
+    return _registry_unit(tmp) or tmp
+
+
+def _registry_unit(unit):
+    # The unit of units_database with the same label as 'unit', if it is
+    # the same in every other respect
+    _unit = ud.parsing._symbol_table().get(unit._label) if unit._label else None
+    if type(_unit) is type(unit) and _unit._dims is unit._dims \
+            and _unit._magnitude == unit._magnitude \
+            and _unit._desc == unit._desc and _unit._display == unit._display:
+        return _unit
+    return None
+
+
+def _unpickled_frozen(magnitude, dims, display, const, desc, label,
+                      other_label):
+    tmp = _frozen(magnitude, dims, display, const, desc, label, other_label)
+    return _registry_unit(tmp) or tmp
+
+
+def _unpickled_si_unit(unit_str, python_str, desc):
+    _unit = getattr(ud, unit_str, None) if unit_str else None
+    if isinstance(_unit, si_unit) and _unit._python_string == python_str:
+        return _unit
+    return si_unit(unit_str, python_str, desc)
+
+
+def _unpickled_array(magnitude, dims, display, const, desc, label,
+                     other_label):
+    tmp = QuantityArray.__new__(QuantityArray)
+    tmp._magnitude = magnitude
+    tmp._dims = _dimension(dims)
+    tmp._display = display
+    tmp._label = label
+    tmp._const = const
+    tmp._desc = desc
+    tmp._other_label = other_label
+    return tmp
+
+
+def _frozen(magnitude, dims, display, const, desc, label, other_label):
+    tmp = combined_units.__new__(frozen_units)
+    for name, value in (('_magnitude', magnitude),
+                        ('_dims', _dimension(dims)),
+                        ('_display', display), ('_const', const),
+                        ('_desc', desc), ('_label', label),
+                        ('_other_label', other_label)):
+        object.__setattr__(tmp, name, value)
+    return tmp
+
+
+class frozen_units(combined_units):
+    '''
+    An immutable combined_units object, created with 'freeze'. Frozen
+    measurements are hashable, the hash depending only on the dimensions
+    and the SI magnitude, and two frozen measurements are equal only if
+    both of these match exactly (e.g. 1000m and 1km are equal). A frozen
+    measurement is never equal to a plain number or an si_unit. The
+    units of units_database are not frozen, and like other measurements
+    compare equal to numbers of the same SI magnitude (e.g. km == 1000).
+    The results of arithmetic on frozen measurements are ordinary
+    combined_units objects.
+    '''
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise Exception(
+            "Cannot Modify a Frozen Quantity, Use 'thaw' for a Mutable Copy")
+
+    def __delattr__(self, name):
+        raise Exception(
+            "Cannot Modify a Frozen Quantity, Use 'thaw' for a Mutable Copy")
+
+    def __hash__(self):
+        return hash((self._dims, self._magnitude))
+
+    def __eq__(self, other):
+        # Only other frozen measurements, which are equal exactly when their
+        # hashes are, and the unhashable mutable measurements may be equal
+        if isinstance(other, frozen_units):
+            return self._dims == other._dims and self._magnitude == other._magnitude
+        if isinstance(other, (combined_units, QuantityArray)):
+            return combined_units.__eq__(self, other)
+        return NotImplemented
+
+    def __reduce__(self):
+        return (_unpickled_frozen, (self._magnitude, self._dims, self._display,
+                          self._const, self._desc, self._label,
+                          self._other_label))
+
+    def freeze(self):
+        return self
+
+    def thaw(self):
+        '''
+        An ordinary, unhashable, copy of the measurement.
+
+        Returns
+        -------
+
+        combined_units       the measurement
+        '''
+        return self._copy()
+
 
 class si_unit(object):
+    __slots__ = ('_unit_string', '_python_string', '_desc', '_dims')
+
+    __array_ufunc__ = _scalar_array_ufunc
+
     def __init__(self, unit_str, python_str, desc):
         self._unit_string = unit_str
         self._python_string = python_str
         self._desc = desc
+        self._dims = _base_dimension(unit_str)
 
     def check_dimensionality(self, other):
-        if isinstance(other, si_unit):
-            return other == si_unit
-        elif isinstance(other, combined_units):
-            return other.check_dimensionality(self)
+        if isinstance(other, (si_unit, combined_units)):
+            return self._dims == other._dims
         else:
             return False
 
     def __repr__(self):
         return self._python_string
 
+    def __reduce__(self):
+        return (_unpickled_si_unit, (self._unit_string, self._python_string,
+                                     self._desc))
+
     def __mul__(self, other):
-        if isinstance(other, self.__class__) and other._desc == self._desc:
+        if isinstance(other, QuantityArray):
+            return other.__rmul__(self)
+
+        elif _is_array(other):
+            return QuantityArray(other, self)
+
+        elif isinstance(other, self.__class__) and other._desc == self._desc:
             return combined_units([self], [2])
         elif isinstance(other, combined_units):
             if other.get_magnitude() == 0:
@@ -422,20 +819,39 @@ class si_unit(object):
         elif isinstance(other, si_unit):
             return combined_units([self, other], [1, 1])
 
-        elif int(other) == 0:
+        elif _is_numpy_scalar(other):
+            return self.__mul__(other.item())
+
+        elif not isinstance(other, (int, float)) and _defers(other):
+            return NotImplemented
+
+        elif other == 0:
             return 0
 
         else:
-            return combined_units((phys_float(other), self), [1, 1])
+            tmp = combined_units()
+            tmp._magnitude = other
+            tmp._dims = self._dims
+            return tmp
 
     def __rmul__(self, other):
         return self.__mul__(other)
 
     def __truediv__(self, other):
+        if isinstance(other, QuantityArray):
+            return other.__rtruediv__(self)
+        elif _is_array(other):
+            return QuantityArray(1 / other, self)
+        elif _is_numpy_scalar(other):
+            return self.__truediv__(other.item())
+        elif not isinstance(other, (int, float)) and _defers(other):
+            return NotImplemented
         return self.__mul__(combined_units([other], [-1]))
 
     def __rtruediv__(self, other):
-        if isinstance(other, int) or isinstance(other, float):
+        if _is_numpy_scalar(other):
+            other = other.item()
+        if isinstance(other, int) or isinstance(other, float) or _is_array(other):
             return other * combined_units([self], [-1])
         return other.__rmul__(combined_units([self], [-1]))
 
@@ -444,11 +860,15 @@ class si_unit(object):
             return combined_units([self], [other])
         elif isinstance(other, phys_float):
             return combined_units([self], [other._magnitude])
+        elif _is_numpy_scalar(other):
+            return self.__pow__(other.item())
         else:
             raise Exception(
                 "Could not Apply Exponent of Type '{}' to Phys_Float".format(type(other)))
 
     def __add__(self, other):
+        if isinstance(other, QuantityArray):
+            return other.__radd__(self)
         try:
             assert self._desc == other._desc
             return self
@@ -474,15 +894,27 @@ class si_unit(object):
 
 
 class phys_float(si_unit):
+    __slots__ = ('_magnitude',)
+
     def __init__(self, magnitude):
         si_unit.__init__(self, '', '', '')
+        self._dims = DIMENSIONLESS
         self._magnitude = magnitude
 
     def get_magnitude(self):
         return self._magnitude
 
+    def __reduce__(self):
+        return (phys_float, (self._magnitude,))
+
     def __mul__(self, other):
-        if isinstance(other, phys_float):
+        if isinstance(other, QuantityArray):
+            return other.__rmul__(self)
+
+        elif _is_array(other):
+            return self._magnitude * other
+
+        elif isinstance(other, phys_float):
             if other.get_magnitude() == 0:
                 return 0
             return phys_float(self._magnitude * other._magnitude)
@@ -517,5 +949,549 @@ class phys_float(si_unit):
     def __str__(self):
         return str(self._magnitude)
 
-    def __cos__(self):
-        return phys_float(math.cos(self._magnitude))
+
+def _unit_parts(unit):
+    if isinstance(unit, QuantityArray):
+        return unit._magnitude, unit._dims
+    elif isinstance(unit, combined_units):
+        return unit._magnitude, unit._dims
+    elif isinstance(unit, phys_float):
+        return unit._magnitude, DIMENSIONLESS
+    elif isinstance(unit, si_unit):
+        return 1, _dims_of(unit)
+    return unit, DIMENSIONLESS
+
+
+def _from_si(magnitude, dims):
+    # A new unlabelled combined_units, or QuantityArray if the magnitude
+    # is an array, with the given SI magnitude and dimensions.
+    if type(magnitude) not in (float, int):
+        if _is_array(magnitude) and magnitude.ndim:
+            tmp = QuantityArray.__new__(QuantityArray)
+            tmp._magnitude = magnitude
+            tmp._dims = dims
+            tmp._display = None
+            tmp._label = ''
+            tmp._const = 1
+            tmp._desc = 'Quantity Has No Known Label'
+            tmp._other_label = ''
+            return tmp
+        if _is_array(magnitude) or (np is not None and isinstance(magnitude, np.generic)):
+            magnitude = float(magnitude)
+    tmp = combined_units.__new__(combined_units)
+    tmp._dims = dims
+    tmp._display = None
+    tmp._const = 1
+    tmp._magnitude = magnitude
+    tmp._desc = 'Quantity Has No Known Label'
+    tmp._label = ''
+    tmp._other_label = ''
+    return tmp
+
+
+class QuantityArray(object):
+    '''
+    An array of measurements which all share the same units. The
+    magnitudes are held in a single numpy array and the units only once,
+    so that arithmetic and conversion are applied to every measurement
+    in a single vectorised step.
+
+    Arguments
+    ---------
+
+    magnitudes   (array_like)                 The values of the
+                                              measurements in terms
+                                              of 'unit'.
+
+    unit         (combined_units/si_unit)     The unit shared by all
+                                              of the measurements.
+
+    Examples
+    --------
+
+    To store a set of distances measured in kilometres:
+
+    distances = QuantityArray([1.2, 5.0, 7.3], km)
+
+    OR
+
+    distances = numpy.array([1.2, 5.0, 7.3]) * km
+
+    the result can then be used like any other unit, e.g. 'distances/s'
+    or 'numpy.sqrt(distances*m)'.
+    '''
+
+    _SAME_UNITS = ('negative', 'positive', 'absolute', 'fabs', 'rint',
+                   'floor', 'ceil', 'trunc', 'conjugate', 'maximum',
+                   'minimum', 'fmax', 'fmin', 'hypot')
+    _COMPARISONS = ('greater', 'greater_equal', 'less', 'less_equal',
+                    'equal', 'not_equal')
+    _DIMENSIONLESS = ('sin', 'cos', 'tan', 'arcsin', 'arccos', 'arctan',
+                      'sinh', 'cosh', 'tanh', 'exp', 'expm1', 'exp2', 'log',
+                      'log2', 'log10', 'log1p')
+    _TRIGONOMETRIC = ('sin', 'cos', 'tan')
+    _PREDICATES = ('isfinite', 'isinf', 'isnan', 'signbit')
+    _POWERS = {'sqrt': 0.5, 'cbrt': 1. / 3, 'square': 2, 'reciprocal': -1}
+
+    def __init__(self, magnitudes, unit=None):
+        try:
+            _numpy()
+        except ImportError:
+            raise ImportError("QuantityArray Requires the NumPy Package")
+        _magnitude, self._dims = _unit_parts(unit)
+        self._magnitude = np.asarray(magnitudes, dtype=float) * _magnitude
+        self._display = None
+        self._label = ''
+        self._const = 1
+        self._desc = 'Quantity Has No Known Label'
+        self._other_label = ''
+        if isinstance(unit, combined_units):
+            self._label = unit._label
+            self._const = unit._const
+            self._desc = unit._desc
+            self._other_label = unit._other_label
+        elif isinstance(unit, si_unit) and not isinstance(unit, phys_float):
+            self._label = unit._unit_string
+            self._desc = unit._desc
+
+    def __reduce__(self):
+        return (_unpickled_array, (self._magnitude, self._dims, self._display,
+                                   self._const, self._desc, self._label,
+                                   self._other_label))
+
+    def _new(self, magnitude, dims):
+        tmp = QuantityArray.__new__(QuantityArray)
+        tmp._magnitude = magnitude
+        tmp._dims = dims
+        tmp._display = None
+        tmp._label = self._label
+        tmp._const = self._const
+        tmp._desc = self._desc
+        tmp._other_label = self._other_label
+        return tmp
+
+    def _copy(self):
+        tmp = self._new(self._magnitude.copy(), self._dims)
+        tmp._display = self._display
+        return tmp
+
+    def _element(self, magnitude):
+        tmp = combined_units(desc=self._desc, label=self._label,
+                             other_label=self._other_label)
+        tmp._const = self._const
+        tmp._magnitude = magnitude
+        tmp._dims = self._dims
+        return tmp
+
+    @property
+    def shape(self):
+        return self._magnitude.shape
+
+    def __len__(self):
+        return len(self._magnitude)
+
+    def __getitem__(self, index):
+        _magnitude = self._magnitude[index]
+        if np.ndim(_magnitude) == 0:
+            return self._element(float(_magnitude))
+        return self._new(_magnitude, self._dims)
+
+    def __iter__(self):
+        for magnitude in self._magnitude:
+            yield self._element(float(magnitude))
+
+    def get_magnitude(self):
+        '''
+        The magnitudes of the measurements.
+
+        Returns
+        -------
+
+        numpy.ndarray     the magnitudes of the measures (e.g. [5, 6] for
+                          [5, 6]miles)
+        '''
+        if self._display and self._display[1] != 1:
+            return self._magnitude / self._display[1]
+        return self._magnitude
+
+    def measures(self):
+        '''
+        Return the description of what the unit measures
+
+        Returns
+        -------
+
+        string       unit description
+        '''
+        return self._desc
+
+    def check_dimensionality(self, other):
+        '''
+        Check that the dimensionality of the array matches another unit.
+
+        Arguments
+        ---------
+
+        other     (QuantityArray/combined_units/si_unit)   other unit to
+                                                           compare with
+
+        Returns
+        -------
+
+        bool           compatible/not
+        '''
+        if isinstance(other, (QuantityArray, combined_units, si_unit)):
+            return self._dims == other._dims
+        return False
+
+    def has_units(self, other):
+        '''
+        Asserts if the array has the same units as another
+        combined_units/si_unit/QuantityArray object.
+
+        Arguments
+        ---------
+
+        other              either a combined_units/si_unit/QuantityArray
+
+        Returns
+        -------
+
+        bool               True/False for matching units
+        '''
+        return self.check_dimensionality(other)
+
+    def __mul__(self, other):
+        if isinstance(other, QuantityArray) or isinstance(other, combined_units) \
+                or isinstance(other, si_unit):
+            _magnitude, _dims = _unit_parts(other)
+            return self._new(self._magnitude * _magnitude,
+                             _dim_mul(self._dims, _dims))
+
+        elif isinstance(other, (int, float)) or _is_array(other) or np.isscalar(other):
+            return self._new(self._magnitude * other, self._dims)
+
+        elif _defers(other):
+            return NotImplemented
+
+        raise Exception(
+            "Invalid Product '{}*{}'".format(type(self), type(other)))
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        if isinstance(other, QuantityArray) or isinstance(other, combined_units) \
+                or isinstance(other, si_unit):
+            _magnitude, _dims = _unit_parts(other)
+            return self._new(self._magnitude / _magnitude,
+                             _dim_div(self._dims, _dims))
+
+        elif isinstance(other, (int, float)) or _is_array(other) or np.isscalar(other):
+            return self._new(self._magnitude / other, self._dims)
+
+        elif _defers(other):
+            return NotImplemented
+
+        raise Exception(
+            "Invalid Division '{}/{}'".format(type(self), type(other)))
+
+    def __rtruediv__(self, other):
+        return self.__pow__(-1).__mul__(other)
+
+    def __pow__(self, other):
+        if isinstance(other, phys_float):
+            other = other._magnitude
+        if not (isinstance(other, (int, float)) or np.isscalar(other)):
+            raise Exception(
+                "Could not Apply Exponent of Type '{}' to QuantityArray Object".format(type(other)))
+        return self._new(self._magnitude**other, _dim_pow(self._dims, other))
+
+    def _matching_magnitude(self, other, operation):
+        if not isinstance(other, (QuantityArray, combined_units, si_unit)) \
+                or not self.check_dimensionality(other):
+            raise Exception(
+                "Cannot {} Unit Combination Objects, Do Indices Match?".format(operation))
+        return _unit_parts(other)[0]
+
+    def __add__(self, other):
+        if _defers(other):
+            return NotImplemented
+        _magnitude = self._matching_magnitude(other, 'Add')
+        return self._new(self._magnitude + _magnitude, self._dims)
+
+    def __radd__(self, other):
+        if isinstance(other, (int, float)) and other == 0:
+            return self._copy()
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        if isinstance(other, (int, float)) and other == 0:
+            return self._copy()
+        if _defers(other):
+            return NotImplemented
+        _magnitude = self._matching_magnitude(other, 'Subtract')
+        return self._new(self._magnitude - _magnitude, self._dims)
+
+    def __iadd__(self, other):
+        self._magnitude += self._matching_magnitude(other, 'Add')
+        self._display = None
+        return self
+
+    def __isub__(self, other):
+        if isinstance(other, (int, float)) and other == 0:
+            return self
+        self._magnitude -= self._matching_magnitude(other, 'Subtract')
+        self._display = None
+        return self
+
+    def __imul__(self, other):
+        if isinstance(other, QuantityArray) or isinstance(other, combined_units) \
+                or isinstance(other, si_unit):
+            _magnitude, _dims = _unit_parts(other)
+            self._magnitude *= _magnitude
+            self._dims = _dim_mul(self._dims, _dims)
+        else:
+            self._magnitude *= other
+        self._display = None
+        return self
+
+    def __itruediv__(self, other):
+        if isinstance(other, QuantityArray) or isinstance(other, combined_units) \
+                or isinstance(other, si_unit):
+            _magnitude, _dims = _unit_parts(other)
+            self._magnitude /= _magnitude
+            self._dims = _dim_div(self._dims, _dims)
+        else:
+            self._magnitude /= other
+        self._display = None
+        return self
+
+    def __rsub__(self, other):
+        _magnitude = self._matching_magnitude(other, 'Subtract')
+        return self._new(_magnitude - self._magnitude, self._dims)
+
+    def __neg__(self):
+        return self._new(-self._magnitude, self._dims)
+
+    def __abs__(self):
+        return self._new(np.abs(self._magnitude), self._dims)
+
+    def __eq__(self, other):
+        if isinstance(other, (int, float)):
+            return np.isclose(self.get_magnitude(), other)
+        if not self.check_dimensionality(other):
+            return np.zeros(self.shape, dtype=bool)
+        return np.isclose(self._magnitude, self._matching_magnitude(other, 'Compare'))
+
+    def _ordering_magnitude(self, other):
+        if isinstance(other, (int, float)) and other == 0:
+            return other
+        return self._matching_magnitude(other, 'Compare')
+
+    def __lt__(self, other):
+        return self._magnitude < self._ordering_magnitude(other)
+
+    def __le__(self, other):
+        return self._magnitude <= self._ordering_magnitude(other)
+
+    def __gt__(self, other):
+        return self._magnitude > self._ordering_magnitude(other)
+
+    def __ge__(self, other):
+        return self._magnitude >= self._ordering_magnitude(other)
+
+    def sum(self, axis=None, **kwargs):
+        return self._reduced(np.sum(self._magnitude, axis=axis, **kwargs))
+
+    def mean(self, axis=None, **kwargs):
+        return self._reduced(np.mean(self._magnitude, axis=axis, **kwargs))
+
+    def std(self, axis=None, **kwargs):
+        return self._reduced(np.std(self._magnitude, axis=axis, **kwargs))
+
+    def min(self, axis=None, **kwargs):
+        return self._reduced(np.min(self._magnitude, axis=axis, **kwargs))
+
+    def max(self, axis=None, **kwargs):
+        return self._reduced(np.max(self._magnitude, axis=axis, **kwargs))
+
+    def cumsum(self, axis=None, **kwargs):
+        return self._new(np.cumsum(self._magnitude, axis=axis, **kwargs),
+                         self._dims)
+
+    def _reduced(self, magnitude):
+        if np.ndim(magnitude) == 0:
+            return self._element(float(magnitude))
+        return self._new(magnitude, self._dims)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if kwargs.get('out') is not None:
+            return NotImplemented
+
+        _name = ufunc.__name__
+
+        if method == 'reduce' and _name in ('add', 'maximum', 'minimum',
+                                             'fmax', 'fmin'):
+            return self._reduced(ufunc.reduce(self._magnitude, **kwargs))
+
+        if method == 'accumulate' and _name == 'add':
+            return self._new(ufunc.accumulate(self._magnitude, **kwargs),
+                             self._dims)
+
+        if method != '__call__':
+            return NotImplemented
+
+        _operators = {'multiply': '__mul__', 'true_divide': '__truediv__',
+                      'divide': '__truediv__', 'add': '__add__',
+                      'subtract': '__sub__', 'power': '__pow__'}
+
+        if _name in _operators:
+            _first, _second = inputs
+            if _first is self:
+                return getattr(self, _operators[_name])(_second)
+            _reflected = {'__mul__': '__rmul__', '__truediv__': '__rtruediv__',
+                          '__add__': '__radd__', '__sub__': '__rsub__'}
+            if _operators[_name] not in _reflected:
+                return NotImplemented
+            return getattr(self, _reflected[_operators[_name]])(_first)
+
+        if _name in self._POWERS:
+            return self.__pow__(self._POWERS[_name])
+
+        _magnitudes = []
+        for x in inputs:
+            if x is self:
+                _magnitudes.append(self._magnitude)
+            elif isinstance(x, (QuantityArray, combined_units, si_unit)):
+                _magnitudes.append(self._matching_magnitude(x, 'Compare'))
+            else:
+                _magnitudes.append(x)
+
+        if _name in self._SAME_UNITS:
+            return self._new(ufunc(*_magnitudes, **kwargs), self._dims)
+
+        if _name in self._COMPARISONS or _name in self._PREDICATES:
+            return ufunc(*_magnitudes, **kwargs)
+
+        if _name == 'arctan2':
+            return ufunc(*_magnitudes, **kwargs)
+
+        if _name in self._DIMENSIONLESS:
+            _angle = self._dims == _base_dimension('rad')
+            if self._dims != DIMENSIONLESS and not (_angle and _name in self._TRIGONOMETRIC):
+                raise Exception(
+                    "Function '{}' Requires a Dimensionless Argument".format(_name))
+            return ufunc(*_magnitudes, **kwargs)
+
+        return NotImplemented
+
+    def __array_function__(self, func, types, args, kwargs):
+        if func is np.concatenate:
+            _arrays = args[0] if args else kwargs.pop('arrays')
+            _first = _arrays[0]
+            if not isinstance(_first, QuantityArray):
+                return NotImplemented
+            _magnitudes = [_first._matching_magnitude(x, 'Concatenate')
+                           for x in _arrays]
+            return _first._new(np.concatenate(_magnitudes, *args[1:], **kwargs),
+                               _first._dims)
+
+        if func is np.clip:
+            _bounds = [x if x is None else self._ordering_magnitude(x)
+                       for x in args[1:3]]
+            return self._new(np.clip(self._magnitude, *(_bounds + list(args[3:])),
+                                     **kwargs), self._dims)
+
+        if func in (np.round, getattr(np, 'around', None)):
+            return self._new(func(self._magnitude, *args[1:], **kwargs),
+                             self._dims)
+
+        if func is np.linalg.norm:
+            return self._reduced(func(self._magnitude, *args[1:], **kwargs))
+
+        return func._implementation(*args, **kwargs)
+
+    def as_base(self):
+        '''
+        Express the array in terms of its own unit rather than the
+        constituent SI units.
+
+        Returns
+        -------
+
+        QuantityArray           An array with the component being just
+                                the unit label. E.g. [5, 6]miles instead
+                                of [8046.72, 9656.064]m
+        '''
+        tmp = self._new(self._magnitude, self._dims)
+        tmp._display = (self._label, self._const)
+        return tmp
+
+    def as_unit(self, unit):
+        '''
+        Express the array in terms of an existing composite.
+
+        Arguments
+        ---------
+
+        unit  (combined_units/si_unit)        unit to express self in terms of
+
+        Returns
+        -------
+
+        string       string representation of result
+        '''
+        assert self.has_units(unit), "Incompatible unit types"
+        if isinstance(unit, si_unit):
+            return '{}{}'.format(self._magnitude, unit)
+        return '{}{}'.format(self.to(unit), unit._label)
+
+    def to(self, unit):
+        '''
+        The magnitudes of the measurements in terms of another unit.
+
+        Arguments
+        ---------
+
+        unit  (combined_units/si_unit)        unit to express self in terms of
+
+        Returns
+        -------
+
+        numpy.ndarray        the magnitudes in terms of 'unit'
+        '''
+        _magnitude, _dims = _unit_parts(unit)
+        return self._magnitude / _conversion_factor(self._dims, _dims, _magnitude)
+
+    def __str__(self):
+        '''
+        Return a string representation of the QuantityArray object
+        '''
+        if self._display:
+            return '{}{}'.format(self.get_magnitude(), self._display[0])
+        return '{}{}'.format(*_plain_display(self._magnitude, self._dims))
+
+    def __format__(self, format_spec):
+        '''
+        Return a string representation of the QuantityArray object with
+        each magnitude formatted according to 'format_spec'
+        '''
+        if not format_spec:
+            return self.__str__()
+        if self._display:
+            _magnitude, _suffix = self.get_magnitude(), self._display[0]
+        else:
+            _magnitude, _suffix = _plain_display(self._magnitude, self._dims)
+        _magnitude = _numpy().array2string(
+            _magnitude,
+            formatter={'all': lambda x: format(x, format_spec)})
+        return _magnitude + _suffix
+
+    def __repr__(self):
+        _indices = [i for i in _DISPLAY_ORDER if self._dims[i] != 0]
+        return "<{}*QuantityArray('{}'), [{}]{}>".format(
+            self._magnitude.tolist(),
+            ','.join([BASE_UNITS[i] for i in _indices]),
+            ','.join([str(self._dims[i]) for i in _indices]),
+            ', "{}"'.format(self._desc) if self._desc != '' else '')
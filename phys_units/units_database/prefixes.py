@@ -0,0 +1,235 @@
+import math
+
+import units_database as ud
+from . import phys_units as pu
+
+# The SI prefixes with their factor and name, 'u' and the greek letter mu
+# being accepted in place of the micro sign.
+
+PREFIXES = {
+    'Y': (1E24, 'yotta'), 'Z': (1E21, 'zetta'), 'E': (1E18, 'exa'),
+    'P': (1E15, 'peta'), 'T': (1E12, 'tera'), 'G': (1E9, 'giga'),
+    'M': (1E6, 'mega'), 'k': (1E3, 'kilo'), 'h': (1E2, 'hecto'),
+    'da': (1E1, 'deca'), 'd': (1E-1, 'deci'), 'c': (1E-2, 'centi'),
+    'm': (1E-3, 'milli'), 'µ': (1E-6, 'micro'), 'n': (1E-9, 'nano'),
+    'p': (1E-12, 'pico'), 'f': (1E-15, 'femto'), 'a': (1E-18, 'atto'),
+    'z': (1E-21, 'zepto'), 'y': (1E-24, 'yocto'),
+}
+
+_ALIASES = {'u': 'µ', 'μ': 'µ'}
+
+# The units which may be prefixed, by symbol, with the name of the unit
+# in units_database (None for the gram) and the word name of the unit.
+# Where several share a dimension the first is used by 'auto_prefix'.
+
+_PREFIXABLE = {
+    'm': ('m', 'metre'), 'g': (None, 'gram'), 's': ('s', 'second'),
+    'A': ('A', 'ampere'), 'K': ('K', 'kelvin'), 'mol': ('mol', 'mole'),
+    'cd': ('cd', 'candela'), 'rad': ('rad', 'radian'),
+    'sr': ('sr', 'steradian'), 'N': ('N', 'newton'), 'J': ('J', 'joule'),
+    'W': ('W', 'watt'), 'Pa': ('Pa', 'pascal'), 'V': ('V', 'volt'),
+    'C': ('C', 'coulomb'), 'F': ('F', 'farad'), 'Ω': ('ohm', 'ohm'),
+    'ohm': ('ohm', 'ohm'), 'S': ('S', 'siemens'), 'Wb': ('Wb', 'weber'),
+    'T': ('T', 'tesla'), 'H': ('H', 'henry'), 'Hz': ('Hz', 'hertz'),
+    'lm': ('lm', 'lumen'), 'lx': ('lx', 'lux'), 'Gy': ('Gy', 'gray'),
+    'Sv': ('Sv', 'sievert'), 'kat': ('kat', 'katal'),
+    'Bq': ('Bq', 'becquerel'), 'L': ('L', 'litre'),
+    'eV': ('eV', 'electronvolt'), 'b': ('barn', 'barn'),
+    'pc': ('pc', 'parsec'),
+}
+
+# The prefixes used by 'auto_prefix', those of powers of 1000
+
+_ENGINEERING = {int(round(math.log10(factor))): symbol
+                for symbol, (factor, _) in PREFIXES.items()
+                if round(math.log10(factor)) % 3 == 0}
+_ENGINEERING[0] = ''
+
+_prefixed_units = {}
+_preferred = {}
+
+
+def _base_unit(symbol):
+    _name = _PREFIXABLE[symbol][0]
+    if _name is None:
+        tmp = pu._from_si(1E-3, pu._dims_of(ud.kg))
+        tmp._desc = ud.kg._desc
+        return tmp
+    return getattr(ud, _name)
+
+
+def _unit_label(unit):
+    if isinstance(unit, pu.si_unit):
+        return unit._unit_string
+    return unit._label
+
+
+def prefixed_unit(symbol):
+    '''
+    The unit with an SI prefix given by a symbol such as 'µm', 'kPa' or
+    'mA', created the first time it is asked for.
+
+    Arguments
+    ---------
+
+    symbol     (string)        prefix followed by the symbol of the unit,
+                               'u' may be used for the micro prefix
+
+    Returns
+    -------
+
+    combined_units/None     the unit, or None if 'symbol' is not a prefixed
+                            unit
+    '''
+    try:
+        return _prefixed_units[symbol]
+    except KeyError:
+        pass
+    for length in (2, 1):
+        _prefix, _symbol = symbol[:length], symbol[length:]
+        _prefix = _ALIASES.get(_prefix, _prefix)
+        if _prefix in PREFIXES and _symbol in _PREFIXABLE:
+            break
+    else:
+        return None
+    _base = _base_unit(_symbol)
+    _factor, _name = PREFIXES[_prefix]
+    _magnitude, _dims = pu._unit_parts(_base)
+    tmp = pu._from_si(_factor * _magnitude, _dims)
+    tmp._const = tmp._magnitude
+    tmp._label = _prefix + (_symbol if _symbol != 'ohm' else 'Ω')
+    tmp._other_label = _name + _PREFIXABLE[_symbol][1]
+    tmp._desc = _base._desc
+    _unit = _prefixed_units[symbol] = tmp
+    if ud._loaded('tables'):
+        ud.tables._add_unit(_unit)
+    return _unit
+
+
+def _prefix_base(dims, unit):
+    # The label and SI magnitude of the unit to which prefixes are added
+    if unit is None:
+        if not _preferred:
+            for symbol in _PREFIXABLE:
+                _preferred.setdefault(
+                    pu._unit_parts(_base_unit(symbol))[1], symbol)
+        try:
+            unit = _preferred[dims]
+        except KeyError:
+            raise Exception(
+                "No Unit to Prefix for '{}', Give 'unit'".format(pu._format_dims(dims)))
+    if isinstance(unit, str):
+        if unit not in _PREFIXABLE:
+            raise Exception("Unit '{}' Cannot be Prefixed".format(unit))
+        return (unit if unit != 'ohm' else 'Ω'), pu._unit_parts(_base_unit(unit))[0]
+    _magnitude, _dims = pu._unit_parts(unit)
+    if _dims != dims:
+        raise Exception(
+            "Cannot Convert Between Units '{}' and '{}', Do Indices Match?".format(
+                pu._format_dims(dims), pu._format_dims(_dims)))
+    return _unit_label(unit), _magnitude
+
+
+def _exponents(values):
+    # The power of 1000 of the prefix which puts each value between 1
+    # and 1000, vectorised over arrays
+    _np = pu._numpy()
+    _values = _np.abs(_np.asarray(values, dtype=float))
+    with _np.errstate(divide='ignore'):
+        _exponents = _np.floor(_np.log10(_values) / 3) * 3
+    _exponents[~_np.isfinite(_exponents)] = 0
+    return _np.clip(_exponents, min(_ENGINEERING), max(_ENGINEERING)).astype(int)
+
+
+def _exponent(value):
+    if value == 0 or not math.isfinite(value):
+        return 0
+    _exponent = math.floor(math.log10(abs(value)) / 3) * 3
+    return max(min(_exponent, max(_ENGINEERING)), min(_ENGINEERING))
+
+
+def auto_prefix(quantity, unit=None):
+    '''
+    Express a measurement with the SI prefix that gives the most readable
+    magnitude, i.e. between 1 and 1000, e.g. 0.0000052m as 5.2µm. An
+    array is given the prefix which suits its largest magnitude.
+
+    Arguments
+    ---------
+
+    quantity     (combined_units/QuantityArray)     the measurement
+
+    Optional Arguments
+    ------------------
+
+    unit         (string/si_unit/combined_units)    unit to add the prefix
+                                                    to, by default the
+                                                    unit of the same
+                                                    dimension from those
+                                                    which can be prefixed
+
+    Returns
+    -------
+
+    combined_units/QuantityArray      the measurement, displayed in terms
+                                      of the prefixed unit
+    '''
+    _label, _magnitude = _prefix_base(quantity._dims, unit)
+    if isinstance(quantity, pu.QuantityArray):
+        _np = pu._numpy()
+        _values = quantity._magnitude / _magnitude
+        _power = _exponent(float(_np.max(_np.abs(_values))) if _values.size else 0)
+        tmp = quantity._new(quantity._magnitude, quantity._dims)
+    else:
+        _power = _exponent(quantity._magnitude / _magnitude)
+        tmp = quantity._derive(quantity._magnitude, quantity._dims)
+    tmp._display = (_ENGINEERING[_power] + _label, 10.**_power * _magnitude)
+    return tmp
+
+
+def format_prefixed(quantities, unit=None, fmt=''):
+    '''
+    Format measurements each with the SI prefix that gives the most
+    readable magnitude, see 'auto_prefix'. The prefixes of an array are
+    found all at once.
+
+    Arguments
+    ---------
+
+    quantities     (QuantityArray or list of       the measurements
+                    combined_units)
+
+    Optional Arguments
+    ------------------
+
+    unit           (string/si_unit/combined_units) unit to add the prefixes
+                                                   to
+
+    fmt            (string)                        format specification of
+                                                   the magnitudes, e.g. '.3g'
+
+    Returns
+    -------
+
+    list of strings      the formatted measurements
+    '''
+    if isinstance(quantities, pu.QuantityArray):
+        _label, _magnitude = _prefix_base(quantities._dims, unit)
+        _values = quantities._magnitude.ravel() / _magnitude
+    else:
+        quantities = list(quantities)
+        if not quantities:
+            return []
+        _label, _magnitude = _prefix_base(quantities[0]._dims, unit)
+        for quantity in quantities:
+            if quantity._dims != quantities[0]._dims:
+                raise Exception(
+                    "Cannot Format '{}' With '{}', Do Indices Match?".format(
+                        pu._format_dims(quantity._dims),
+                        pu._format_dims(quantities[0]._dims)))
+        _values = pu._numpy().array([x._magnitude for x in quantities],
+                                    dtype=float) / _magnitude
+    _powers = _exponents(_values)
+    _values = (_values / 10.**_powers).tolist()
+    return [format(value, fmt) + _ENGINEERING[power] + _label
+            for value, power in zip(_values, _powers.tolist())]
@@ -0,0 +1,217 @@
+from contextlib import contextmanager
+from fractions import Fraction
+
+import units_database as ud
+from . import phys_units as pu
+
+
+class UnitSystem(object):
+    '''
+    A system of units in which the quantities without display units of
+    their own are shown while the system is in use, see 'unit_system'.
+    Quantities are still held in SI units, so that only their display
+    changes. The suffix and conversion factor of each dimension are worked
+    out once and kept in a table, which is filled for all of the units of
+    units_database when the system is first used.
+
+    Arguments
+    ---------
+
+    name      (string)          name of the system
+
+    units     (list of tuples)  the label of each unit of the system with
+                                a dictionary of its power for a unit power
+                                of each SI base unit, e.g. ('cm', {'m': 1})
+                                or, as mass, length, time and temperature
+                                all become energies in natural units,
+                                ('GeV', {'kg': 1, 'm': -1, 's': -1, 'K': 1})
+
+    bases     (dict)            the unit of the system which takes the
+                                place of each SI base unit, as a dictionary
+                                of the powers of the constants it is the
+                                product of, e.g. {'m': {'cm': 1}}, those
+                                not given being shown in SI units
+
+    constants (dict)            the SI magnitude of each of the constants
+
+    Optional Arguments
+    ------------------
+
+    named     (dict)            labels used in place of the units of the
+                                system for whole dimensions, each given as
+                                a unit, e.g. {'erg': J}
+    '''
+
+    def __init__(self, name, units, bases, constants, named=None):
+        self.name = name
+        self._units = [(label, [powers.get(x, 0) for x in pu.BASE_UNITS])
+                       for label, powers in units]
+        self._bases = [bases.get(x) for x in pu.BASE_UNITS]
+        self._constants = constants
+        self._named = {pu._unit_parts(unit)[1]: label
+                       for label, unit in (named or {}).items()}
+        self._table = {}
+
+    def __repr__(self):
+        return "UnitSystem('{}')".format(self.name)
+
+    def _display(self, dims):
+        # The suffix of quantities of a dimension in this system, the SI
+        # magnitude of the unit of the suffix and whether SI magnitudes are
+        # divided by it, rather than multiplied by its inverse. The powers
+        # of each constant are added up and the magnitude worked out
+        # exactly, so that e.g. the c^-2 of a mass and the c^2 of a squared
+        # speed cancel, and magnitudes are only divided by it if it is
+        # exactly a float, so that e.g. 5*GeV is shown as 5.0GeV and 5*N
+        # as 500000.0dyn.
+        try:
+            return self._table[dims]
+        except KeyError:
+            pass
+        _powers, _residual = {}, list(dims)
+        for i, base in enumerate(self._bases):
+            if base is not None and dims[i]:
+                for constant, power in base.items():
+                    _powers[constant] = _powers.get(constant, 0) + power * dims[i]
+                _residual[i] = 0
+        _scale = Fraction(1)
+        for constant, power in _powers.items():
+            _scale *= Fraction(self._constants[constant])**power
+        try:
+            _suffix = self._named[dims]
+        except KeyError:
+            _labels = []
+            for label, powers in self._units:
+                _power = sum(x * y for x, y in zip(powers, dims))
+                if _power:
+                    _labels.append(label + ('^{}'.format(_power) if _power != 1 else ''))
+            _labels.append(pu._format_dims(pu._dimension(_residual)))
+            _suffix = '.'.join(x for x in _labels if x)
+        _divide = Fraction(float(_scale)) == _scale
+        self._table[dims] = (_suffix, float(_scale if _divide else 1 / _scale),
+                             _divide)
+        return self._table[dims]
+
+    def _convert(self, magnitude, dims):
+        # The magnitude in the units of the system and their suffix
+        _suffix, _factor, _divide = self._display(dims)
+        if _factor == 1:
+            return magnitude, _suffix
+        if _divide:
+            return magnitude / _factor, _suffix
+        return magnitude * _factor, _suffix
+
+    def _fill(self):
+        # Work out the displays of all of the units of units_database
+        for unit in ud.tables._units():
+            if isinstance(unit, (pu.si_unit, pu.combined_units)) \
+                    and not isinstance(unit, pu.phys_float):
+                self._display(pu._unit_parts(unit)[1])
+
+    def unit(self, dimension):
+        '''
+        The unit of the system for a dimension, e.g. the GeV of mass in
+        natural units, for entering measurements in the system's units.
+
+        Arguments
+        ---------
+
+        dimension    (si_unit/combined_units)     a unit of the dimension
+
+        Returns
+        -------
+
+        frozen_units      the unit
+        '''
+        _dims = pu._unit_parts(dimension)[1]
+        _suffix, _factor, _divide = self._display(_dims)
+        _scale = _factor if _divide else 1 / _factor
+        tmp = pu._from_si(_scale, _dims)
+        tmp._label = _suffix
+        tmp._const = _scale
+        tmp._display = (_suffix, _scale)
+        return tmp.freeze()
+
+
+def _cgs():
+    return UnitSystem('cgs', [('g', {'kg': 1}), ('cm', {'m': 1})],
+                      {'kg': {'g': 1}, 'm': {'cm': 1}}, {'g': 1E-3, 'cm': 1E-2},
+                      named={'erg': ud.erg, 'dyn': ud.N})
+
+
+def _natural():
+    # hbar = c = k_B = 1, with the GeV as the unit of mass, energy and
+    # temperature, and the inverse GeV as the unit of length and time
+    return UnitSystem('natural', [('GeV', {'kg': 1, 'm': -1, 's': -1, 'K': 1})],
+                      {'kg': {'GeV': 1, 'c': -2},
+                       'm': {'hbar': 1, 'c': 1, 'GeV': -1},
+                       's': {'hbar': 1, 'GeV': -1},
+                       'K': {'GeV': 1, 'k_B': -1}},
+                      {'GeV': ud.GeV._magnitude, 'c': ud.c._magnitude,
+                       'hbar': ud.hbar._magnitude, 'k_B': ud.k_B._magnitude})
+
+
+_DEFINITIONS = {'cgs': _cgs, 'natural': _natural}
+_systems = {}
+
+
+def get_unit_system(name):
+    '''
+    One of the unit systems of units_database, 'si', 'cgs' or 'natural'.
+
+    Arguments
+    ---------
+
+    name      (string)       name of the system
+
+    Returns
+    -------
+
+    UnitSystem/None          the system, None for SI units
+    '''
+    if name == 'si':
+        return None
+    try:
+        return _systems[name]
+    except KeyError:
+        pass
+    try:
+        _definition = _DEFINITIONS[name]
+    except KeyError:
+        raise Exception("Unknown Unit System '{}'".format(name))
+    _system = _systems[name] = _definition()
+    _system._fill()
+    return _system
+
+
+@contextmanager
+def unit_system(system):
+    '''
+    Context manager in which the quantities without display units of
+    their own are shown in another system of units, e.g.
+
+    with unit_system('natural'):
+        print(m_p*c**2)
+
+    shows the energy in GeV. The system applies to the whole process, not
+    only the current thread.
+
+    Arguments
+    ---------
+
+    system     (string/UnitSystem)     'si', 'cgs', 'natural' or a
+                                       UnitSystem
+
+    Returns
+    -------
+
+    UnitSystem/None        the system, None for SI units
+    '''
+    if isinstance(system, str):
+        system = get_unit_system(system)
+    _previous = pu._system
+    pu._system = system
+    try:
+        yield system
+    finally:
+        pu._system = _previous
@@ -0,0 +1,127 @@
+import units_database as ud
+from . import phys_units as pu
+from .parsing import _parse_unit
+
+# The units of each dimension seen so far, by label, with the factors to
+# convert SI magnitudes to each of them. A table is built the first time a
+# dimension is asked for and then kept up to date as units are added with
+# 'register_unit' or created by the SI prefix engine.
+
+_tables = {}
+_vectors = {}
+
+
+def _label(unit):
+    if isinstance(unit, pu.si_unit):
+        return unit._unit_string
+    return unit._label
+
+
+def _units():
+    for name in ud._unit_names:
+        yield getattr(ud, name)
+    yield from ud.all_cunits
+    yield from ud.prefixes._prefixed_units.values()
+
+
+def _table_of(dims):
+    try:
+        return _tables[dims]
+    except KeyError:
+        pass
+    _table = {}
+    for unit in _units():
+        if isinstance(unit, pu.phys_float) \
+                or not isinstance(unit, (pu.si_unit, pu.combined_units)):
+            continue
+        _magnitude, _dims = pu._unit_parts(unit)
+        if _dims == dims and _label(unit) and _magnitude:
+            _table.setdefault(_label(unit), _magnitude)
+    _tables[dims] = _table
+    return _table
+
+
+def _add_unit(unit):
+    # Called when a unit is added to units_database after start up
+    _magnitude, _dims = pu._unit_parts(unit)
+    if _dims in _tables and _label(unit) and _magnitude:
+        _tables[_dims].setdefault(_label(unit), _magnitude)
+        _vectors.pop(_dims, None)
+
+
+def _vector(dims):
+    try:
+        return _vectors[dims]
+    except KeyError:
+        pass
+    _table = _table_of(dims)
+    _vectors[dims] = _result = (list(_table), 1 / pu._numpy().array(
+        list(_table.values()), dtype=float))
+    return _result
+
+
+def conversion_table(unit):
+    '''
+    The factors converting between all of the units of units_database
+    with the same dimension as 'unit', e.g. all of the units of length.
+
+    Arguments
+    ---------
+
+    unit      (si_unit/combined_units/string)     a unit of the dimension
+
+    Returns
+    -------
+
+    list of strings     the labels of the units
+
+    numpy.ndarray       matrix of which element [i, j] is the number of
+                        the units j in one of the units i
+    '''
+    if isinstance(unit, str):
+        unit = _parse_unit(unit)
+    _labels, _inverse = _vector(pu._unit_parts(unit)[1])
+    return list(_labels), pu._numpy().multiply.outer(1 / _inverse, _inverse)
+
+
+def convert_many(quantities, targets=None):
+    '''
+    Convert a measurement, or an array of measurements, to several units
+    at once.
+
+    Arguments
+    ---------
+
+    quantities    (combined_units/QuantityArray)     the measurement(s)
+
+    Optional Arguments
+    ------------------
+
+    targets       (list of si_unit/combined_units    the units to convert
+                   or strings)                       to, by default all of
+                                                     the units in
+                                                     units_database with
+                                                     the same dimension
+
+    Returns
+    -------
+
+    dict      the magnitude(s) in each unit by its label
+    '''
+    _magnitude, _dims = pu._unit_parts(quantities)
+    if targets is None:
+        _labels, _inverse = _vector(_dims)
+    else:
+        _labels, _factors = [], []
+        for target in targets:
+            _unit = _parse_unit(target) if isinstance(target, str) else target
+            _target_magnitude, _target_dims = pu._unit_parts(_unit)
+            _labels.append(target if isinstance(target, str) else
+                           _label(_unit) or pu._format_dims(_target_dims))
+            _factors.append(pu._conversion_factor(_dims, _target_dims,
+                                                  _target_magnitude))
+        _inverse = 1 / pu._numpy().array(_factors, dtype=float)
+    if isinstance(quantities, pu.QuantityArray):
+        _converted = pu._numpy().multiply.outer(_magnitude, _inverse)
+        return {label: _converted[..., i] for i, label in enumerate(_labels)}
+    return dict(zip(_labels, (_magnitude * _inverse).tolist()))
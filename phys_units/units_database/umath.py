@@ -0,0 +1,241 @@
+import math
+from functools import reduce
+
+from . import phys_units as pu
+
+# Mathematical functions of quantities, e.g. umath.sqrt(area) or
+# umath.sin(theta), with the units checked. Scalars are passed to the
+# functions of the math module and arrays to those of numpy. The units of
+# the result for each function and dimension of argument are found once
+# and kept, so that calls after the first skip the checks.
+
+_RAD = pu._base_dimension('rad')
+
+_results = {}
+
+
+def _parts(value):
+    if isinstance(value, (pu.combined_units, pu.QuantityArray)):
+        return value._magnitude, value._dims
+    if isinstance(value, (list, tuple)):
+        return pu._numpy().asarray(value, dtype=float), pu.DIMENSIONLESS
+    return pu._unit_parts(value)
+
+
+def _dimensionless(name, dims):
+    if dims != pu.DIMENSIONLESS:
+        raise Exception(
+            "Function '{}' Requires a Dimensionless Argument, Not '{}'".format(
+                name, pu._format_dims(dims)))
+    return pu.DIMENSIONLESS
+
+
+def _angle(name, dims):
+    if dims != _RAD and dims != pu.DIMENSIONLESS:
+        raise Exception(
+            "Function '{}' Requires an Angle in Radians, Not '{}'".format(
+                name, pu._format_dims(dims)))
+    return pu.DIMENSIONLESS
+
+
+def _inverse_angle(name, dims):
+    _dimensionless(name, dims)
+    return _RAD
+
+
+def _power(power):
+    return lambda name, dims: pu._dim_pow(dims, power)
+
+
+_SQUARE_ROOT = _power(0.5)
+_CUBE_ROOT = _power(1. / 3)
+
+
+def _result_dims(name, dims, rule):
+    try:
+        return _results[name, dims]
+    except KeyError:
+        pass
+    _results[name, dims] = _dims = rule(name, dims)
+    return _dims
+
+
+def _result(magnitude, dims):
+    if dims == pu.DIMENSIONLESS:
+        return magnitude
+    return pu._from_si(magnitude, dims)
+
+
+def _apply(name, value, rule, function):
+    _magnitude, _dims = _parts(value)
+    _dims = _result_dims(name, _dims, rule)
+    if pu._is_array(_magnitude):
+        return _result(getattr(pu._numpy(), name)(_magnitude), _dims)
+    return _result(function(_magnitude), _dims)
+
+
+def _matching(name, values):
+    # The magnitudes of several arguments which must have the same units,
+    # and their dimension
+    _parts_of = [_parts(x) for x in values]
+    _dims = _parts_of[0][1]
+    for _, dims in _parts_of[1:]:
+        if dims != _dims:
+            raise Exception(
+                "Function '{}' Requires Arguments With the Same Units, "
+                "Do Indices Match?".format(name))
+    return [x for x, _ in _parts_of], _dims
+
+
+def sqrt(x):
+    '''
+    Square root, halving the exponents of the units, e.g. m^2 becomes m.
+    '''
+    return _apply('sqrt', x, _SQUARE_ROOT, math.sqrt)
+
+
+def cbrt(x):
+    '''
+    Cube root, dividing the exponents of the units by three.
+    '''
+    return _apply('cbrt', x, _CUBE_ROOT,
+                  lambda y: math.copysign(abs(y)**(1. / 3), y))
+
+
+def exp(x):
+    '''
+    Exponential of a dimensionless quantity.
+    '''
+    return _apply('exp', x, _dimensionless, math.exp)
+
+
+def log(x):
+    '''
+    Natural logarithm of a dimensionless quantity.
+    '''
+    return _apply('log', x, _dimensionless, math.log)
+
+
+def log10(x):
+    '''
+    Base 10 logarithm of a dimensionless quantity.
+    '''
+    return _apply('log10', x, _dimensionless, math.log10)
+
+
+def log2(x):
+    '''
+    Base 2 logarithm of a dimensionless quantity.
+    '''
+    return _apply('log2', x, _dimensionless, math.log2)
+
+
+def sin(x):
+    '''
+    Sine of an angle in radians.
+    '''
+    return _apply('sin', x, _angle, math.sin)
+
+
+def cos(x):
+    '''
+    Cosine of an angle in radians.
+    '''
+    return _apply('cos', x, _angle, math.cos)
+
+
+def tan(x):
+    '''
+    Tangent of an angle in radians.
+    '''
+    return _apply('tan', x, _angle, math.tan)
+
+
+def arcsin(x):
+    '''
+    Inverse sine of a dimensionless quantity, as an angle in radians.
+    '''
+    return _apply('arcsin', x, _inverse_angle, math.asin)
+
+
+def arccos(x):
+    '''
+    Inverse cosine of a dimensionless quantity, as an angle in radians.
+    '''
+    return _apply('arccos', x, _inverse_angle, math.acos)
+
+
+def arctan(x):
+    '''
+    Inverse tangent of a dimensionless quantity, as an angle in radians.
+    '''
+    return _apply('arctan', x, _inverse_angle, math.atan)
+
+
+def sinh(x):
+    '''
+    Hyperbolic sine of a dimensionless quantity.
+    '''
+    return _apply('sinh', x, _dimensionless, math.sinh)
+
+
+def cosh(x):
+    '''
+    Hyperbolic cosine of a dimensionless quantity.
+    '''
+    return _apply('cosh', x, _dimensionless, math.cosh)
+
+
+def tanh(x):
+    '''
+    Hyperbolic tangent of a dimensionless quantity.
+    '''
+    return _apply('tanh', x, _dimensionless, math.tanh)
+
+
+def arctan2(y, x):
+    '''
+    The angle in radians of the point (x, y) from the x axis, x and y
+    having the same units.
+
+    Arguments
+    ---------
+
+    y       (combined_units/QuantityArray/number)
+
+    x       (combined_units/QuantityArray/number)
+
+    Returns
+    -------
+
+    combined_units/QuantityArray      the angle
+    '''
+    (_y, _x), _ = _matching('arctan2', (y, x))
+    if pu._is_array(_y) or pu._is_array(_x):
+        return pu._from_si(pu._numpy().arctan2(_y, _x), _RAD)
+    return pu._from_si(math.atan2(_y, _x), _RAD)
+
+
+def hypot(*values):
+    '''
+    The length of the vector of which the arguments are the components,
+    all having the same units.
+
+    Arguments
+    ---------
+
+    *values     (combined_units/QuantityArray/number)
+
+    Returns
+    -------
+
+    combined_units/QuantityArray/number      the length
+    '''
+    _magnitudes, _dims = _matching('hypot', values)
+    if any(pu._is_array(x) for x in _magnitudes):
+        # Starting from zero so that a single array is also made positive
+        return _result(reduce(pu._numpy().hypot, _magnitudes, 0.), _dims)
+    return _result(math.hypot(*_magnitudes), _dims)
+
+
+asin, acos, atan, atan2 = arcsin, arccos, arctan, arctan2
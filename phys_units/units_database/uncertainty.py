@@ -0,0 +1,309 @@
+from . import phys_units as pu
+
+_EXACT = (pu.combined_units, pu.si_unit, pu.QuantityArray, int, float)
+
+
+def _exact_parts(other):
+    # The (SI magnitude, dimensions) of a value without uncertainty, or
+    # None if it is not a quantity or number
+    if isinstance(other, _EXACT) or pu._is_array(other):
+        return pu._unit_parts(other)
+    return None
+
+
+class UncertainQuantity(object):
+    '''
+    A measurement, or an array of measurements, with a standard
+    uncertainty. The uncertainty is propagated linearly through
+    multiplication, division, powers, addition and subtraction, assuming
+    the measurements combined are independent (a measurement combined
+    with itself, e.g. x*x, is handled exactly). For functions in which
+    the linear approximation is poor use 'monte_carlo'.
+
+    Arguments
+    ---------
+
+    value         (number/array/combined_units    the measurement(s)
+                   /QuantityArray)
+
+    uncertainty   (number/array/combined_units    the standard
+                   /QuantityArray)                uncertainty of the
+                                                  measurement(s), in the
+                                                  same units as 'value'
+
+    Optional Arguments
+    ------------------
+
+    unit          (si_unit/combined_units)        unit of 'value' and
+                                                  'uncertainty' when they
+                                                  are numbers or arrays
+
+    Examples
+    --------
+
+    M = UncertainQuantity(1.989, 0.002, 1E30*kg)
+    r = UncertainQuantity(1, 0.01, AU)
+    print(G*M*M_earth/r**2)
+    '''
+
+    __array_ufunc__ = None
+
+    # The quantities of units_database leave their operations with an
+    # UncertainQuantity to its reflected methods
+    _defers_units = True
+
+    def __init__(self, value, uncertainty, unit=None):
+        if unit is not None:
+            _unit_magnitude, self._dims = pu._unit_parts(unit)
+            self._magnitude = self._asmagnitude(value) * _unit_magnitude
+            self._sigma = self._asmagnitude(uncertainty) * _unit_magnitude
+            return
+        self._magnitude, self._dims = pu._unit_parts(value)
+        _sigma, _dims = pu._unit_parts(uncertainty)
+        if _dims != self._dims and not (isinstance(_sigma, (int, float))
+                                        and _sigma == 0):
+            raise Exception(
+                "Uncertainty Must Have the Same Units as the Value, Do Indices Match?")
+        self._sigma = _sigma
+
+    @staticmethod
+    def _asmagnitude(value):
+        if isinstance(value, (list, tuple)):
+            return pu._numpy().asarray(value, dtype=float)
+        return value
+
+    @classmethod
+    def _new(cls, magnitude, sigma, dims):
+        tmp = cls.__new__(cls)
+        tmp._magnitude = magnitude
+        tmp._sigma = sigma
+        tmp._dims = dims
+        return tmp
+
+    def value(self):
+        '''
+        The measurement(s) without the uncertainty.
+
+        Returns
+        -------
+
+        combined_units/QuantityArray
+        '''
+        return pu._from_si(self._magnitude, self._dims)
+
+    def uncertainty(self):
+        '''
+        The standard uncertainty of the measurement(s).
+
+        Returns
+        -------
+
+        combined_units/QuantityArray
+        '''
+        return pu._from_si(self._sigma, self._dims)
+
+    def relative_uncertainty(self):
+        return self._sigma / abs(self._magnitude)
+
+    def to(self, unit):
+        '''
+        The magnitude(s) and uncertainty in terms of another unit.
+
+        Arguments
+        ---------
+
+        unit  (combined_units/si_unit)        unit to express self in terms of
+
+        Returns
+        -------
+
+        tuple       the magnitude(s) and the uncertainty
+        '''
+        _magnitude, _dims = pu._unit_parts(unit)
+        _factor = pu._conversion_factor(self._dims, _dims, _magnitude)
+        return self._magnitude / _factor, self._sigma / _factor
+
+    def as_unit(self, unit):
+        '''
+        Express the measurement in terms of an existing composite.
+
+        Arguments
+        ---------
+
+        unit  (combined_units/si_unit)        unit to express self in terms of
+
+        Returns
+        -------
+
+        string       string representation of result
+        '''
+        _magnitude, _sigma = self.to(unit)
+        _label = unit._unit_string if isinstance(unit, pu.si_unit) else unit._label
+        return '({} ± {}){}'.format(_magnitude, _sigma, _label)
+
+    def __str__(self):
+        return '({} ± {}){}'.format(self._magnitude, self._sigma,
+                                    pu._format_dims(self._dims))
+
+    def __repr__(self):
+        return '<UncertainQuantity({}, {}, {})>'.format(
+            self._magnitude, self._sigma, pu._format_dims(self._dims))
+
+    def _parts(self, other):
+        # The (magnitude, uncertainty, dimensions) of the other operand
+        if isinstance(other, UncertainQuantity):
+            return other._magnitude, other._sigma, other._dims
+        _parts = _exact_parts(other)
+        if _parts is None:
+            return None
+        return _parts[0], 0, _parts[1]
+
+    def __mul__(self, other):
+        if other is self:
+            return self.__pow__(2)
+        _parts = self._parts(other)
+        if _parts is None:
+            return NotImplemented
+        _magnitude, _sigma, _dims = _parts
+        return self._new(self._magnitude * _magnitude,
+                         ((self._sigma * _magnitude)**2
+                          + (self._magnitude * _sigma)**2)**0.5,
+                         pu._dim_mul(self._dims, _dims))
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        if other is self:
+            return self._new(self._magnitude / self._magnitude, 0,
+                             pu.DIMENSIONLESS)
+        _parts = self._parts(other)
+        if _parts is None:
+            return NotImplemented
+        _magnitude, _sigma, _dims = _parts
+        return self._new(self._magnitude / _magnitude,
+                         ((self._sigma / _magnitude)**2
+                          + (self._magnitude * _sigma / _magnitude**2)**2)**0.5,
+                         pu._dim_div(self._dims, _dims))
+
+    def __rtruediv__(self, other):
+        _parts = self._parts(other)
+        if _parts is None:
+            return NotImplemented
+        return self._new(*_parts).__truediv__(self)
+
+    def __pow__(self, power):
+        if isinstance(power, pu.phys_float):
+            power = power._magnitude
+        if not isinstance(power, (int, float)):
+            raise Exception(
+                "Could not Apply Exponent of Type '{}' to UncertainQuantity Object".format(
+                    type(power)))
+        return self._new(self._magnitude**power,
+                         abs(power * self._magnitude**(power - 1)) * self._sigma,
+                         pu._dim_pow(self._dims, power))
+
+    def _matching_parts(self, other, operation):
+        _parts = self._parts(other)
+        if _parts is None or _parts[2] != self._dims:
+            raise Exception(
+                "Cannot {} Unit Combination Objects, Do Indices Match?".format(operation))
+        return _parts
+
+    def __add__(self, other):
+        if other is self:
+            return self.__mul__(2)
+        _magnitude, _sigma, _ = self._matching_parts(other, 'Add')
+        return self._new(self._magnitude + _magnitude,
+                         (self._sigma**2 + _sigma**2)**0.5, self._dims)
+
+    def __radd__(self, other):
+        if isinstance(other, (int, float)) and other == 0:
+            return self
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        if other is self:
+            return self._new(self._magnitude - self._magnitude, 0, self._dims)
+        _magnitude, _sigma, _ = self._matching_parts(other, 'Subtract')
+        return self._new(self._magnitude - _magnitude,
+                         (self._sigma**2 + _sigma**2)**0.5, self._dims)
+
+    def __rsub__(self, other):
+        return self.__neg__().__add__(other)
+
+    def __neg__(self):
+        return self._new(-self._magnitude, self._sigma, self._dims)
+
+    def sample(self, n, rng=None):
+        '''
+        Draw samples of the measurement(s) from a normal distribution.
+
+        Arguments
+        ---------
+
+        n       (int)                         number of samples
+
+        Optional Arguments
+        ------------------
+
+        rng     (numpy.random.Generator)      the random number generator
+
+        Returns
+        -------
+
+        QuantityArray      the samples, of shape (n,) followed by the shape
+                           of the measurement(s)
+        '''
+        _np = pu._numpy()
+        rng = _np.random.default_rng() if rng is None else rng
+        _magnitude = _np.asarray(self._magnitude, dtype=float)
+        _samples = rng.normal(_magnitude, self._sigma,
+                              size=(n,) + _magnitude.shape)
+        return pu._from_si(_samples, self._dims)
+
+
+def monte_carlo(function, *args, n=10000, seed=None):
+    '''
+    Propagate uncertainties through a function by evaluating it once for
+    'n' random samples of each UncertainQuantity argument at the same time,
+    as QuantityArrays, e.g.
+
+    monte_carlo(lambda m, r: G*m*M_earth/r**2, M, r)
+
+    Arguments
+    ---------
+
+    function     (callable)       the function, which must accept
+                                  QuantityArrays in place of the uncertain
+                                  arguments
+
+    *args                         the arguments of the function, those
+                                  which are not UncertainQuantity objects
+                                  being passed unchanged
+
+    Optional Arguments
+    ------------------
+
+    n            (int)            number of samples
+
+    seed         (int)            seed of the random number generator
+
+    Returns
+    -------
+
+    UncertainQuantity      the mean and standard deviation of the samples
+                           of the result
+    '''
+    _np = pu._numpy()
+    _rng = _np.random.default_rng(seed)
+    _args = [x.sample(n, _rng) if isinstance(x, UncertainQuantity) else x
+             for x in args]
+    _magnitude, _dims = pu._unit_parts(function(*_args))
+    _magnitude = _np.asarray(_magnitude, dtype=float)
+    if _magnitude.ndim == 0:
+        return UncertainQuantity._new(float(_magnitude), 0., _dims)
+    _mean, _std = _magnitude.mean(axis=0), _magnitude.std(axis=0, ddof=1)
+    if _mean.ndim == 0:
+        _mean, _std = float(_mean), float(_std)
+    return UncertainQuantity._new(_mean, _std, _dims)
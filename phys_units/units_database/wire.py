@@ -0,0 +1,85 @@
+import struct
+
+from . import phys_units as pu
+
+# A quantity is sent as a header holding the format version, flags and
+# the integer exponent of each SI base unit, followed by the exponents
+# again as doubles if any are fractional, then by either the SI magnitude
+# as a double or, for arrays, the shape and the raw float64 magnitudes.
+
+_VERSION = 1
+_ARRAY = 1
+_FRACTIONAL = 2
+
+_HEADER = struct.Struct('<BB{}b'.format(len(pu.BASE_UNITS)))
+_EXPONENTS = struct.Struct('<{}d'.format(len(pu.BASE_UNITS)))
+_MAGNITUDE = struct.Struct('<d')
+_NDIM = struct.Struct('<B')
+
+
+def to_wire(quantity):
+    '''
+    Encode a measurement, or an array of measurements, in a compact binary
+    form, e.g. to send it to another process or over a network. Only the
+    SI magnitude and the dimensions are kept, not the unit labels.
+
+    Arguments
+    ---------
+
+    quantity     (combined_units/QuantityArray/si_unit)     the measurement
+
+    Returns
+    -------
+
+    bytes      the encoded measurement, see 'from_wire'
+    '''
+    _magnitude, _dims = pu._unit_parts(quantity)
+    _flags = _ARRAY if isinstance(quantity, pu.QuantityArray) else 0
+    _fractional = any(x != int(x) for x in _dims)
+    if _fractional:
+        _flags |= _FRACTIONAL
+    _parts = [_HEADER.pack(_VERSION, _flags,
+                           *(0 if _fractional else int(x) for x in _dims))]
+    if _fractional:
+        _parts.append(_EXPONENTS.pack(*_dims))
+    if _flags & _ARRAY:
+        _np = pu._numpy()
+        _parts.append(_NDIM.pack(_magnitude.ndim))
+        _parts.append(struct.pack('<{}q'.format(_magnitude.ndim), *_magnitude.shape))
+        _parts.append(_np.ascontiguousarray(_magnitude, dtype='<f8').tobytes())
+    else:
+        _parts.append(_MAGNITUDE.pack(_magnitude))
+    return b''.join(_parts)
+
+
+def from_wire(data):
+    '''
+    Decode a measurement encoded with 'to_wire'.
+
+    Arguments
+    ---------
+
+    data       (bytes)       the encoded measurement
+
+    Returns
+    -------
+
+    combined_units/QuantityArray       the measurement
+    '''
+    _version, _flags, *_dims = _HEADER.unpack_from(data)
+    if _version != _VERSION:
+        raise ValueError(
+            "Unsupported Wire Format Version '{}'".format(_version))
+    _offset = _HEADER.size
+    if _flags & _FRACTIONAL:
+        _dims = _EXPONENTS.unpack_from(data, _offset)
+        _offset += _EXPONENTS.size
+    _dims = pu._dimension(_dims)
+    if not _flags & _ARRAY:
+        return pu._from_si(_MAGNITUDE.unpack_from(data, _offset)[0], _dims)
+    _ndim = _NDIM.unpack_from(data, _offset)[0]
+    _offset += _NDIM.size
+    _shape = struct.unpack_from('<{}q'.format(_ndim), data, _offset)
+    _offset += 8 * _ndim
+    _magnitude = pu._numpy().frombuffer(data, dtype='<f8', offset=_offset)
+    return pu._from_si(_magnitude.reshape(_shape).astype(float), _dims)